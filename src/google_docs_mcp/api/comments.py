@@ -5,11 +5,37 @@ Handles listing, creating, and managing comments on documents.
 """
 
 import json
+import re
+import threading
+import time
 
 from fastmcp.exceptions import ToolError
 
+from google_docs_mcp.api import helpers
 from google_docs_mcp.auth import get_docs_client, get_drive_client
-from google_docs_mcp.utils import log
+from google_docs_mcp.utils import env_number, log, log_error
+
+# Fields needed to render a comment together with its replies
+_COMMENT_THREAD_FIELDS = (
+    "id,content,quotedFileContent,author,createdTime,resolved,"
+    "replies(id,content,author,createdTime)"
+)
+
+# Partial-response mask covering only what is needed to extract quoted text
+_QUOTED_TEXT_FIELDS = (
+    "body(content(startIndex,endIndex,"
+    "paragraph(elements(startIndex,endIndex,textRun(content)))))"
+)
+
+# Characters that can appear in a Drive file ID
+_DRIVE_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
+
+# Short-lived cache of formatted comment reads, keyed by (document_id, comment_id).
+# A comment_id of None holds the list_comments result for the document.
+_COMMENT_CACHE_TTL_SECONDS = env_number("COMMENT_CACHE_TTL_SECONDS", 15.0)
+_COMMENT_CACHE_MAX_ENTRIES = 256
+_comment_cache: dict[tuple[str, str | None], tuple[float, str]] = {}
+_comment_cache_lock = threading.Lock()
 
 
 def list_comments(document_id: str) -> str:
@@ -27,60 +53,69 @@ def list_comments(document_id: str) -> str:
     """
     log(f"Listing comments for document {document_id}")
 
+    cached = _get_cached(document_id, None)
+    if cached is not None:
+        return cached
+
     try:
         # Use Drive API v3 for comments
         drive = get_drive_client()
 
-        response = (
-            drive.comments()
-            .list(
-                fileId=document_id,
-                fields="comments(id,content,quotedFileContent,author,createdTime,resolved)",
-                pageSize=100,
+        # Format comments for display, page by page
+        result_parts = []
+        page_token = None
+        while True:
+            response = (
+                drive.comments()
+                .list(
+                    fileId=document_id,
+                    fields=(
+                        "nextPageToken,"
+                        "comments(id,content,quotedFileContent,author,createdTime,resolved)"
+                    ),
+                    pageSize=100,
+                    pageToken=page_token,
+                )
+                .execute()
             )
-            .execute()
-        )
-
-        comments = response.get("comments", [])
-
-        if not comments:
-            return "No comments found in this document."
 
-        # Format comments for display
-        result_parts = []
-        for index, comment in enumerate(comments):
-            author = comment.get("author", {}).get("displayName", "Unknown")
-            created = comment.get("createdTime", "Unknown date")
-            if created != "Unknown date":
-                # Simplify date format
-                created = created[:10]  # Just get YYYY-MM-DD
-
-            status = " [RESOLVED]" if comment.get("resolved") else ""
-
-            # Get quoted text
-            quoted_content = comment.get("quotedFileContent", {})
-            quoted_text = quoted_content.get("value", "")
-            anchor = ""
-            if quoted_text:
-                truncated = (
-                    quoted_text[:100] + "..." if len(quoted_text) > 100 else quoted_text
+            for comment in response.get("comments", []):
+                author = _author_name(comment)
+                created = _short_date(comment)
+
+                status = " [RESOLVED]" if comment.get("resolved") else ""
+
+                # Get quoted text
+                quoted_text = comment.get("quotedFileContent", {}).get("value", "")
+                anchor = ""
+                if quoted_text:
+                    truncated = (
+                        quoted_text[:100] + "..." if len(quoted_text) > 100 else quoted_text
+                    )
+                    anchor = f' (anchored to: "{truncated}")'
+
+                result_parts.append(
+                    f"\n{len(result_parts) + 1}. **{author}** ({created}){status}{anchor}\n"
+                    f"   {comment.get('content', '')}\n"
+                    f"   Comment ID: {comment.get('id', '')}"
                 )
-                anchor = f' (anchored to: "{truncated}")'
 
-            content = comment.get("content", "")
-            comment_id = comment.get("id", "")
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
 
-            result_parts.append(
-                f"\n{index + 1}. **{author}** ({created}){status}{anchor}\n"
-                f"   {content}\n"
-                f"   Comment ID: {comment_id}"
-            )
+        if not result_parts:
+            result = "No comments found in this document."
+        else:
+            count = len(result_parts)
+            result = f"Found {count} comment{'s' if count != 1 else ''}:\n{''.join(result_parts)}"
 
-        return f"Found {len(comments)} comment{'s' if len(comments) != 1 else ''}:\n{''.join(result_parts)}"
+        _set_cached(document_id, None, result)
+        return result
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error listing comments: {error_message}")
+        log_error(f"Error listing comments: {error_message}")
         raise ToolError(f"Failed to list comments: {error_message}")
 
 
@@ -100,6 +135,10 @@ def get_comment(document_id: str, comment_id: str) -> str:
     """
     log(f"Getting comment {comment_id} from document {document_id}")
 
+    cached = _get_cached(document_id, comment_id)
+    if cached is not None:
+        return cached
+
     try:
         drive = get_drive_client()
 
@@ -108,45 +147,155 @@ def get_comment(document_id: str, comment_id: str) -> str:
             .get(
                 fileId=document_id,
                 commentId=comment_id,
-                fields="id,content,quotedFileContent,author,createdTime,resolved,replies(id,content,author,createdTime)",
+                fields=_COMMENT_THREAD_FIELDS,
             )
             .execute()
         )
 
-        author = response.get("author", {}).get("displayName", "Unknown")
-        created = response.get("createdTime", "Unknown date")
-        if created != "Unknown date":
-            created = created[:10]
-
-        status = " [RESOLVED]" if response.get("resolved") else ""
-        quoted_text = response.get("quotedFileContent", {}).get("value", "")
-        anchor = f'\nAnchored to: "{quoted_text}"' if quoted_text else ""
-        content = response.get("content", "")
-
-        result = f"**{author}** ({created}){status}{anchor}\n{content}"
-
-        # Add replies
-        replies = response.get("replies", [])
-        if replies:
-            result += "\n\n**Replies:**"
-            for index, reply in enumerate(replies):
-                reply_author = reply.get("author", {}).get("displayName", "Unknown")
-                reply_date = reply.get("createdTime", "Unknown date")
-                if reply_date != "Unknown date":
-                    reply_date = reply_date[:10]
-                reply_content = reply.get("content", "")
-                result += f"\n{index + 1}. **{reply_author}** ({reply_date})\n   {reply_content}"
-
+        result = _format_comment_thread(response)
+        _set_cached(document_id, comment_id, result)
         return result
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error getting comment: {error_message}")
+        log_error(f"Error getting comment: {error_message}")
         raise ToolError(f"Failed to get comment: {error_message}")
 
 
+def get_comments(document_id: str, comment_ids: list[str]) -> str:
+    """
+    Get several comments with their reply threads in batched requests.
+
+    Uses the Drive batch endpoint so up to 100 comments are fetched in a
+    single HTTP round trip instead of one request per comment.
+
+    Args:
+        document_id: The ID of the Google Document
+        comment_ids: The IDs of the comments to retrieve
+
+    Returns:
+        Formatted string with each comment and its replies
+
+    Raises:
+        UserError: For permission/not found errors
+    """
+    log(f"Getting {len(comment_ids)} comments from document {document_id}")
+
+    if not comment_ids:
+        return "No comment IDs provided."
+
+    try:
+        drive = get_drive_client()
+        # Batch request IDs must be unique, so fetch each comment only once
+        unique_ids = list(dict.fromkeys(comment_ids))
+        results: dict[str, str] = {}
+
+        def collect(request_id: str, response: dict, exception: Exception | None) -> None:
+            if exception is not None:
+                results[request_id] = f"Failed to get comment: {exception}"
+            else:
+                results[request_id] = _format_comment_thread(response)
+
+        for start in range(0, len(unique_ids), helpers.MAX_BATCH_HTTP_REQUESTS):
+            batch = drive.new_batch_http_request(callback=collect)
+            for comment_id in unique_ids[start : start + helpers.MAX_BATCH_HTTP_REQUESTS]:
+                batch.add(
+                    drive.comments().get(
+                        fileId=document_id,
+                        commentId=comment_id,
+                        fields=_COMMENT_THREAD_FIELDS,
+                    ),
+                    request_id=comment_id,
+                )
+            batch.execute()
+
+        return "\n\n---\n\n".join(
+            f"Comment ID: {comment_id}\n{results.get(comment_id, 'No response received.')}"
+            for comment_id in unique_ids
+        )
+
+    except Exception as e:
+        error_message = str(e)
+        log_error(f"Error getting comments: {error_message}")
+        raise ToolError(f"Failed to get comments: {error_message}")
+
+
+def _get_cached(document_id: str, comment_id: str | None) -> str | None:
+    """Return a cached comment read if it is still fresh."""
+    with _comment_cache_lock:
+        entry = _comment_cache.get((document_id, comment_id))
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del _comment_cache[(document_id, comment_id)]
+            return None
+        return value
+
+
+def _set_cached(document_id: str, comment_id: str | None, value: str) -> None:
+    """Cache a comment read, evicting the oldest entry when full."""
+    if _COMMENT_CACHE_TTL_SECONDS <= 0:
+        return
+    with _comment_cache_lock:
+        _comment_cache.pop((document_id, comment_id), None)
+        if len(_comment_cache) >= _COMMENT_CACHE_MAX_ENTRIES:
+            del _comment_cache[next(iter(_comment_cache))]
+        _comment_cache[(document_id, comment_id)] = (
+            time.monotonic() + _COMMENT_CACHE_TTL_SECONDS,
+            value,
+        )
+
+
+def _invalidate_cached(document_id: str) -> None:
+    """Drop all cached comment reads for a document after it changes."""
+    with _comment_cache_lock:
+        for key in [key for key in _comment_cache if key[0] == document_id]:
+            del _comment_cache[key]
+
+
+def _author_name(item: dict) -> str:
+    """Get the author display name of a comment or reply."""
+    return (item.get("author") or {}).get("displayName", "Unknown")
+
+
+def _short_date(item: dict) -> str:
+    """Get the creation date of a comment or reply as YYYY-MM-DD."""
+    created = item.get("createdTime")
+    return created.partition("T")[0] if created else "Unknown date"
+
+
+def _format_comment_thread(comment: dict) -> str:
+    """Format a comment and its replies for display."""
+    author = _author_name(comment)
+    created = _short_date(comment)
+
+    status = " [RESOLVED]" if comment.get("resolved") else ""
+    quoted_text = comment.get("quotedFileContent", {}).get("value", "")
+    anchor = f'\nAnchored to: "{quoted_text}"' if quoted_text else ""
+    content = comment.get("content", "")
+
+    parts = [f"**{author}** ({created}){status}{anchor}\n{content}"]
+
+    # Add replies
+    replies = comment.get("replies", [])
+    if replies:
+        parts.append("\n\n**Replies:**")
+        parts.extend(
+            f"\n{index + 1}. **{_author_name(reply)}** ({_short_date(reply)})\n"
+            f"   {reply.get('content', '')}"
+            for index, reply in enumerate(replies)
+        )
+
+    return "".join(parts)
+
+
 def add_comment(
-    document_id: str, start_index: int, end_index: int, comment_text: str
+    document_id: str,
+    start_index: int,
+    end_index: int,
+    comment_text: str,
+    quoted_text: str | None = None,
 ) -> str:
     """
     Add a comment anchored to a specific text range.
@@ -160,6 +309,9 @@ def add_comment(
         start_index: Starting index of text range (inclusive, 1-based)
         end_index: Ending index of text range (exclusive)
         comment_text: Content of the comment
+        quoted_text: Text the comment quotes. If None, it is read from the
+            document, which costs an extra request. Pass an empty string to
+            skip the quote and rely on the anchor alone.
 
     Returns:
         Success message with comment ID
@@ -173,28 +325,15 @@ def add_comment(
         raise ToolError("End index must be greater than start index.")
 
     try:
-        # First get the quoted text from the document
-        docs = get_docs_client()
-        doc = docs.documents().get(documentId=document_id).execute()
-
-        # Extract quoted text
-        quoted_text = ""
-        content = doc.get("body", {}).get("content", [])
-
-        for element in content:
-            paragraph = element.get("paragraph", {})
-            for pe in paragraph.get("elements", []):
-                text_run = pe.get("textRun", {})
-                if text_run:
-                    element_start = pe.get("startIndex", 0)
-                    element_end = pe.get("endIndex", 0)
-                    text = text_run.get("content", "")
-
-                    # Check if this element overlaps with our range
-                    if element_end > start_index and element_start < end_index:
-                        start_offset = max(0, start_index - element_start)
-                        end_offset = min(len(text), end_index - element_start)
-                        quoted_text += text[start_offset:end_offset]
+        if quoted_text is None:
+            quoted_text = _get_quoted_text(document_id, start_index, end_index)
+
+        body = {
+            "content": comment_text,
+            "anchor": _build_anchor(document_id, start_index, end_index),
+        }
+        if quoted_text:
+            body["quotedFileContent"] = {"value": quoted_text, "mimeType": "text/html"}
 
         # Use Drive API v3 for comments
         drive = get_drive_client()
@@ -204,41 +343,175 @@ def add_comment(
             .create(
                 fileId=document_id,
                 fields="id,content,quotedFileContent,author,createdTime,resolved",
-                body={
-                    "content": comment_text,
-                    "quotedFileContent": {
-                        "value": quoted_text,
-                        "mimeType": "text/html",
-                    },
-                    "anchor": json.dumps(
-                        {
-                            "r": document_id,
-                            "a": [
-                                {
-                                    "txt": {
-                                        "o": start_index - 1,  # 0-based
-                                        "l": end_index - start_index,
-                                        "ml": end_index - start_index,
-                                    }
-                                }
-                            ],
-                        }
-                    ),
-                },
+                body=body,
             )
             .execute()
         )
 
+        _invalidate_cached(document_id)
         return f"Comment added successfully. Comment ID: {response.get('id')}"
 
     except ToolError:
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error adding comment: {error_message}")
+        log_error(f"Error adding comment: {error_message}")
         raise ToolError(f"Failed to add comment: {error_message}")
 
 
+def _build_anchor(document_id: str, start_index: int, end_index: int) -> str:
+    """Build the Drive anchor JSON for a text range (start_index is 1-based)."""
+    length = end_index - start_index
+    if _DRIVE_ID_PATTERN.fullmatch(document_id):
+        # Drive IDs need no escaping, so format the fixed shape directly
+        return (
+            f'{{"r":"{document_id}","a":[{{"txt":'
+            f'{{"o":{start_index - 1},"l":{length},"ml":{length}}}}}]}}'
+        )
+    return json.dumps(
+        {"r": document_id, "a": [{"txt": {"o": start_index - 1, "l": length, "ml": length}}]}
+    )
+
+
+def _get_quoted_text(document_id: str, start_index: int, end_index: int) -> str:
+    """Read the text between start_index and end_index from the document body."""
+    return _extract_quoted_text(_get_quote_content(document_id), start_index, end_index)
+
+
+def _get_quote_content(document_id: str) -> list:
+    """Fetch the body content needed to extract quoted text."""
+    docs = get_docs_client()
+    doc = (
+        docs.documents()
+        .get(documentId=document_id, fields=_QUOTED_TEXT_FIELDS)
+        .execute()
+    )
+    return doc.get("body", {}).get("content", [])
+
+
+def _extract_quoted_text(content: list, start_index: int, end_index: int) -> str:
+    """Extract the text between start_index and end_index from body content."""
+    quoted_parts = []
+
+    for element in content:
+        # Skip structural elements before the range; stop once past it
+        if element.get("endIndex", 0) <= start_index:
+            continue
+        if element.get("startIndex", 0) >= end_index:
+            break
+
+        paragraph = element.get("paragraph", {})
+        for pe in paragraph.get("elements", []):
+            element_start = pe.get("startIndex", 0)
+            element_end = pe.get("endIndex", 0)
+            if element_end <= start_index:
+                continue
+            if element_start >= end_index:
+                break
+
+            text_run = pe.get("textRun", {})
+            if text_run:
+                text = text_run.get("content", "")
+                start_offset = max(0, start_index - element_start)
+                end_offset = min(len(text), end_index - element_start)
+                quoted_parts.append(text[start_offset:end_offset])
+
+    return "".join(quoted_parts)
+
+
+def add_comments(document_id: str, new_comments: list[dict]) -> str:
+    """
+    Add several comments anchored to text ranges in batched requests.
+
+    Quotes that are not supplied are read from a single document fetch, and
+    up to 100 comments are created per batch HTTP request.
+
+    Args:
+        document_id: The ID of the Google Document
+        new_comments: Comment dicts with 'start_index', 'end_index' and
+            'comment_text', plus an optional 'quoted_text' (see add_comment)
+
+    Returns:
+        Summary listing the ID of each created comment or why it failed
+
+    Raises:
+        UserError: For invalid ranges or permission/not found errors
+    """
+    log("Adding %d comments to doc %s", len(new_comments), document_id)
+
+    if not new_comments:
+        return "No comments provided."
+
+    for number, comment in enumerate(new_comments, start=1):
+        missing = [
+            key
+            for key in ("start_index", "end_index", "comment_text")
+            if comment.get(key) is None
+        ]
+        if missing:
+            raise ToolError(f"Comment {number} is missing {', '.join(missing)}.")
+        if comment["end_index"] <= comment["start_index"]:
+            raise ToolError(
+                f"Comment {number}: end index must be greater than start index."
+            )
+
+    try:
+        content = None
+        bodies = []
+        for comment in new_comments:
+            start_index = comment["start_index"]
+            end_index = comment["end_index"]
+            quoted_text = comment.get("quoted_text")
+            if quoted_text is None:
+                # One fetch serves the quotes of every comment that needs one
+                if content is None:
+                    content = _get_quote_content(document_id)
+                quoted_text = _extract_quoted_text(content, start_index, end_index)
+
+            body = {
+                "content": comment["comment_text"],
+                "anchor": _build_anchor(document_id, start_index, end_index),
+            }
+            if quoted_text:
+                body["quotedFileContent"] = {"value": quoted_text, "mimeType": "text/html"}
+            bodies.append(body)
+
+        drive = get_drive_client()
+        results: dict[str, str] = {}
+
+        def collect(request_id: str, response: dict, exception: Exception | None) -> None:
+            if exception is not None:
+                results[request_id] = f"Failed to add comment: {exception}"
+            else:
+                results[request_id] = f"Comment ID: {response.get('id')}"
+
+        for start in range(0, len(bodies), helpers.MAX_BATCH_HTTP_REQUESTS):
+            batch = drive.new_batch_http_request(callback=collect)
+            for number in range(start, min(start + helpers.MAX_BATCH_HTTP_REQUESTS, len(bodies))):
+                batch.add(
+                    drive.comments().create(
+                        fileId=document_id,
+                        fields="id",
+                        body=bodies[number],
+                    ),
+                    request_id=str(number + 1),
+                )
+            batch.execute()
+
+        _invalidate_cached(document_id)
+        return "\n".join(
+            f"Comment {number}: {results.get(str(number), 'No response received.')}"
+            for number in range(1, len(bodies) + 1)
+        )
+
+    except ToolError:
+        raise
+    except Exception as e:
+        error_message = str(e)
+        log_error(f"Error adding comments: {error_message}")
+        raise ToolError(f"Failed to add comments: {error_message}")
+
+
 def reply_to_comment(document_id: str, comment_id: str, reply_text: str) -> str:
     """
     Add a reply to an existing comment.
@@ -270,11 +543,12 @@ def reply_to_comment(document_id: str, comment_id: str, reply_text: str) -> str:
             .execute()
         )
 
+        _invalidate_cached(document_id)
         return f"Reply added successfully. Reply ID: {response.get('id')}"
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error adding reply: {error_message}")
+        log_error(f"Error adding reply: {error_message}")
         raise ToolError(f"Failed to add reply: {error_message}")
 
 
@@ -307,22 +581,22 @@ def resolve_comment(document_id: str, comment_id: str) -> str:
             .execute()
         )
 
-        # Update with resolved status
-        drive.comments().update(
-            fileId=document_id,
-            commentId=comment_id,
-            fields="id,resolved",
-            body={"content": current.get("content"), "resolved": True},
-        ).execute()
-
-        # Verify
-        verify = (
+        # Update with resolved status; the response reports the new state,
+        # so no follow-up GET is needed to verify it
+        updated = (
             drive.comments()
-            .get(fileId=document_id, commentId=comment_id, fields="resolved")
+            .update(
+                fileId=document_id,
+                commentId=comment_id,
+                fields="id,resolved",
+                body={"content": current.get("content"), "resolved": True},
+            )
             .execute()
         )
 
-        if verify.get("resolved"):
+        _invalidate_cached(document_id)
+
+        if updated.get("resolved"):
             return f"Comment {comment_id} has been marked as resolved."
         else:
             return (
@@ -333,7 +607,7 @@ def resolve_comment(document_id: str, comment_id: str) -> str:
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error resolving comment: {error_message}")
+        log_error(f"Error resolving comment: {error_message}")
         raise ToolError(f"Failed to resolve comment: {error_message}")
 
 
@@ -357,10 +631,11 @@ def delete_comment(document_id: str, comment_id: str) -> str:
         drive = get_drive_client()
 
         drive.comments().delete(fileId=document_id, commentId=comment_id).execute()
+        _invalidate_cached(document_id)
 
         return f"Comment {comment_id} has been deleted."
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error deleting comment: {error_message}")
+        log_error(f"Error deleting comment: {error_message}")
         raise ToolError(f"Failed to delete comment: {error_message}")
@@ -4,15 +4,27 @@ Document operations for Google Docs MCP Server.
 Handles reading, writing, and formatting document content.
 """
 
-from typing import Any
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+import codecs
+import dataclasses
+import io
+import json
 import re
 
 from fastmcp.exceptions import ToolError
+from googleapiclient.http import MediaIoBaseDownload
 
-from google_docs_mcp.auth import get_docs_client, get_drive_client
-from google_docs_mcp.types import TextStyleArgs, ParagraphStyleArgs
+try:
+    import orjson
+except ImportError:  # Optional; stdlib json is used without it
+    orjson = None
+
+from google_docs_mcp.auth import API_NUM_RETRIES, get_docs_client, get_drive_client
+from google_docs_mcp.types import TextRange, TextStyleArgs, ParagraphStyleArgs
 from google_docs_mcp.api import helpers
-from google_docs_mcp.utils import log
+from google_docs_mcp.utils import log, log_warning, log_error
 
 
 def _export_document_as_markdown(
@@ -40,40 +52,101 @@ def _export_document_as_markdown(
 
     # Warn if tab_id is specified since Drive API exports entire document
     if tab_id:
-        log(f"Warning: tab_id '{tab_id}' specified but Drive API markdown export will export the entire document")
-
-    try:
-        # Export document as markdown using Drive API
-        markdown_bytes = (
-            drive.files()
-            .export(fileId=document_id, mimeType='text/markdown')
-            .execute()
+        log_warning(
+            "tab_id '%s' specified but Drive API markdown export will export the entire document",
+            tab_id,
         )
 
-        markdown_content = markdown_bytes.decode('utf-8')
-        total_length = len(markdown_content)
-        log(f"Exported document {document_id} as markdown using native Drive API: {total_length} characters")
-
-        # Apply max_length truncation if needed
-        if max_length and total_length > max_length:
-            truncated = markdown_content[:max_length]
-            return (
-                f"{truncated}\n\n... [Markdown truncated to {max_length} chars "
-                f"of {total_length} total. Use maxLength parameter to adjust limit "
-                f"or remove it to get full content.]"
+    try:
+        if max_length:
+            # Only download as much of the export as the preview needs
+            markdown_content, complete = _download_markdown_prefix(
+                drive, document_id, max_length
+            )
+        else:
+            # Export document as markdown using Drive API
+            markdown_bytes = (
+                drive.files()
+                .export(fileId=document_id, mimeType='text/markdown')
+                .execute()
             )
-
-        return markdown_content
-
     except Exception as e:
         error_message = str(e)
-        log(f"Error exporting document as markdown: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error exporting document as markdown: %s", error_message)
+        if status == 404:
             raise ToolError("Document not found. Check the document ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError("Permission denied. Make sure you have read access to the document.")
         raise ToolError(f"Failed to export document as markdown: {error_message}")
 
+    # Decode outside the fetch so stray non-UTF-8 bytes are replaced
+    # rather than reported as a failed export
+    if not max_length:
+        markdown_content, complete = markdown_bytes.decode('utf-8', errors='replace'), True
+
+    total_length = len(markdown_content)
+    log(
+        "Exported document %s as markdown using native Drive API: %s characters%s",
+        document_id,
+        total_length,
+        "" if complete else " (partial)",
+    )
+
+    # Apply max_length truncation if needed
+    if max_length and total_length > max_length:
+        truncated = markdown_content[:max_length]
+        total = f" of {total_length} total" if complete else ""
+        return (
+            f"{truncated}\n\n... [Markdown truncated to {max_length} chars"
+            f"{total}. Use maxLength parameter to adjust limit "
+            f"or remove it to get full content.]"
+        )
+
+    return markdown_content
+
+
+def _dump_json(data: Any) -> str:
+    """Pretty-print data as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+# Bytes fetched per request when downloading a truncated markdown export
+_MARKDOWN_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+
+def _download_markdown_prefix(drive, document_id: str, max_length: int) -> tuple[str, bool]:
+    """
+    Download a markdown export in chunks until more than max_length characters are decoded.
+
+    Returns:
+        Tuple of (decoded markdown, whether the whole export was downloaded)
+    """
+    request = drive.files().export_media(fileId=document_id, mimeType='text/markdown')
+    buffer = io.BytesIO()
+    downloader = MediaIoBaseDownload(buffer, request, chunksize=_MARKDOWN_DOWNLOAD_CHUNK_SIZE)
+    # Chunks can split multi-byte characters, so decode incrementally
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    parts: list[str] = []
+    length = 0
+    done = False
+    while not done:
+        _, done = downloader.next_chunk(num_retries=API_NUM_RETRIES)
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+        text = decoder.decode(chunk, final=done)
+        parts.append(text)
+        length += len(text)
+        if length > max_length:
+            break
+
+    return "".join(parts), done
+
 
 def read_document(
     document_id: str,
@@ -96,33 +169,45 @@ def read_document(
     Raises:
         UserError: For permission/not found errors
     """
-    import json
-
     docs = get_docs_client()
     log(
-        f"Reading Google Doc: {document_id}, Format: {format}"
-        f"{f', Tab: {tab_id}' if tab_id else ''}"
+        "Reading Google Doc: %s, Format: %s, Tab: %s",
+        document_id,
+        format,
+        tab_id or "default",
     )
 
     try:
         needs_tabs_content = bool(tab_id)
 
-        if format in ("json", "markdown"):
+        if format == "json":
             fields = "*"
+        elif format == "markdown":
+            if not tab_id:
+                # Content comes from the Drive export, so there is nothing to fetch
+                return _export_document_as_markdown(document_id, None, max_length)
+            # Only check that the tab exists
+            fields = helpers.build_tabs_fields(
+                "tabProperties,documentTab(body(content(startIndex)))"
+            )
+        elif tab_id:
+            fields = helpers.build_tabs_fields(
+                f"tabProperties,documentTab({helpers.BODY_TEXT_FIELDS})"
+            )
         else:
-            fields = "body(content(paragraph(elements(textRun(content)))))"
+            fields = helpers.BODY_TEXT_FIELDS
 
         res = (
             docs.documents()
             .get(
                 documentId=document_id,
                 includeTabsContent=needs_tabs_content,
-                fields="*" if needs_tabs_content else fields,
+                fields=fields,
             )
             .execute()
         )
 
-        log(f"Fetched doc: {document_id}{f' (tab: {tab_id})' if tab_id else ''}")
+        log("Fetched doc: %s (tab: %s)", document_id, tab_id or "default")
 
         # Determine content source
         content_source: dict
@@ -136,12 +221,12 @@ def read_document(
                 )
             content_source = {"body": target_tab["documentTab"].get("body", {})}
             tab_title = target_tab.get("tabProperties", {}).get("title", "Untitled")
-            log(f"Using content from tab: {tab_title}")
+            log("Using content from tab: %s", tab_title)
         else:
             content_source = res
 
         if format == "json":
-            json_content = json.dumps(content_source, indent=2)
+            json_content = _dump_json(content_source)
             if max_length and len(json_content) > max_length:
                 return (
                     json_content[:max_length]
@@ -154,45 +239,44 @@ def read_document(
             return _export_document_as_markdown(document_id, tab_id, max_length)
 
         # Default: Text format
-        text_content = ""
-        element_count = 0
         body = content_source.get("body", {})
+        content = body.get("content")
+        if not content:
+            return "Document found, but appears empty."
 
-        for element in body.get("content", []):
-            element_count += 1
-
-            # Handle paragraphs
-            paragraph = element.get("paragraph", {})
-            for pe in paragraph.get("elements", []):
-                text_run = pe.get("textRun", {})
-                if text_run.get("content"):
-                    text_content += text_run["content"]
-
-            # Handle tables
-            table = element.get("table", {})
-            for row in table.get("tableRows", []):
-                for cell in row.get("tableCells", []):
-                    for cell_element in cell.get("content", []):
-                        cell_para = cell_element.get("paragraph", {})
-                        for pe in cell_para.get("elements", []):
-                            text_run = pe.get("textRun", {})
-                            if text_run.get("content"):
-                                text_content += text_run["content"]
-
-        if not text_content.strip():
+        # Keep at most max_length characters, but count the whole body
+        chunks: list[str] = []
+        kept_length = 0
+        total_length = 0
+        has_text = False
+        for run in helpers.iter_text_runs(body):
+            total_length += len(run)
+            if not has_text and not run.isspace():
+                has_text = True
+            if not max_length:
+                chunks.append(run)
+            elif kept_length < max_length:
+                piece = run[: max_length - kept_length]
+                chunks.append(piece)
+                kept_length += len(piece)
+        text_content = "".join(chunks)
+
+        if not has_text:
             return "Document found, but appears empty."
 
-        total_length = len(text_content)
+        element_count = len(content)
+
         log(
-            f"Document contains {total_length} characters across {element_count} elements"
+            "Document contains %s characters across %s elements",
+            total_length,
+            element_count,
         )
 
         if max_length and total_length > max_length:
-            truncated = text_content[:max_length]
-            log(f"Truncating content from {total_length} to {max_length} characters")
+            log("Truncating content from %s to %s characters", total_length, max_length)
             return (
                 f"Content (truncated to {max_length} chars of {total_length} total):\n"
-                f"---\n{truncated}\n\n... [Document continues for "
+                f"---\n{text_content}\n\n... [Document continues for "
                 f"{total_length - max_length} more characters. Use maxLength parameter "
                 f"to adjust limit or remove it to get full content.]"
             )
@@ -203,10 +287,11 @@ def read_document(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error reading doc {document_id}: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error reading doc %s: %s", document_id, error_message)
+        if status == 404:
             raise ToolError(f"Doc not found (ID: {document_id}).")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(f"Permission denied for doc (ID: {document_id}).")
         raise ToolError(f"Failed to read doc: {error_message}")
 
@@ -226,13 +311,14 @@ def list_document_tabs(document_id: str, include_content: bool = False) -> str:
         UserError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Listing tabs for document: {document_id}")
+    log("Listing tabs for document: %s", document_id)
 
     try:
-        fields = (
-            "title,tabs"
+        # Content lengths only need text runs; otherwise tab properties suffice
+        fields = "title," + helpers.build_tabs_fields(
+            f"tabProperties,documentTab({helpers.BODY_TEXT_FIELDS})"
             if include_content
-            else "title,tabs(tabProperties,childTabs)"
+            else "tabProperties"
         )
 
         res = (
@@ -249,53 +335,61 @@ def list_document_tabs(document_id: str, include_content: bool = False) -> str:
 
         is_single_tab = len(all_tabs) == 1
 
-        result = f'**Document:** "{doc_title}"\n'
-        result += f"**Total tabs:** {len(all_tabs)}"
-        result += " (single-tab document)\n\n" if is_single_tab else "\n\n"
+        out = io.StringIO()
+        out.write(f'**Document:** "{doc_title}"\n')
+        out.write(f"**Total tabs:** {len(all_tabs)}")
+        out.write(" (single-tab document)\n\n" if is_single_tab else "\n\n")
 
         if not is_single_tab:
-            result += "**Tab Structure:**\n"
-            result += "-" * 50 + "\n\n"
+            out.write("**Tab Structure:**\n")
+            out.write("-" * 50 + "\n\n")
+
+        # Nesting is shallow, so build each indent string once up front
+        max_level = max((tab.level for tab in all_tabs), default=0)
+        indents = tuple("  " * level for level in range(max_level + 1))
 
         for index, tab in enumerate(all_tabs):
             level = tab.level
-            indent = "  " * level
+            indent = indents[level]
 
             if is_single_tab:
-                result += "**Default Tab:**\n"
-                result += f"- Tab ID: {tab.tab_id}\n"
-                result += f"- Title: {tab.title or '(Untitled)'}\n"
+                out.write("**Default Tab:**\n")
+                out.write(f"- Tab ID: {tab.tab_id}\n")
+                out.write(f"- Title: {tab.title or '(Untitled)'}\n")
             else:
                 prefix = "└─ " if level > 0 else ""
-                result += f'{indent}{prefix}**Tab {index + 1}:** "{tab.title}"\n'
-                result += f"{indent}   - ID: {tab.tab_id}\n"
-                result += f"{indent}   - Index: {tab.index if tab.index is not None else 'N/A'}\n"
+                out.write(f'{indent}{prefix}**Tab {index + 1}:** "{tab.title}"\n')
+                out.write(f"{indent}   - ID: {tab.tab_id}\n")
+                out.write(
+                    f"{indent}   - Index: {tab.index if tab.index is not None else 'N/A'}\n"
+                )
 
                 if tab.parent_tab_id:
-                    result += f"{indent}   - Parent Tab ID: {tab.parent_tab_id}\n"
+                    out.write(f"{indent}   - Parent Tab ID: {tab.parent_tab_id}\n")
 
             if include_content and tab.text_length is not None:
                 content_info = (
                     f"{tab.text_length:,} characters" if tab.text_length > 0 else "Empty"
                 )
-                result += f"{indent}   - Content: {content_info}\n"
+                out.write(f"{indent}   - Content: {content_info}\n")
 
             if not is_single_tab:
-                result += "\n"
+                out.write("\n")
 
         if not is_single_tab:
-            result += "\nTip: Use tab IDs with other tools to target specific tabs."
+            out.write("\nTip: Use tab IDs with other tools to target specific tabs.")
 
-        return result
+        return out.getvalue()
 
     except ToolError:
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error listing tabs for doc {document_id}: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error listing tabs for doc %s: %s", document_id, error_message)
+        if status == 404:
             raise ToolError(f"Document not found (ID: {document_id}).")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(f"Permission denied for document (ID: {document_id}).")
         raise ToolError(f"Failed to list tabs: {error_message}")
 
@@ -312,7 +406,9 @@ def append_to_document(
     Args:
         document_id: The ID of the Google Document
         text_to_append: The text to add to the end
-        add_newline_if_needed: Whether to add a newline before appended text
+        add_newline_if_needed: Whether to add a newline before appended text.
+            When False, the text is appended in a single request without first
+            reading the document.
         tab_id: Specific tab ID to append to
 
     Returns:
@@ -322,63 +418,30 @@ def append_to_document(
         UserError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(
-        f"Appending to Google Doc: {document_id}"
-        f"{f' (tab: {tab_id})' if tab_id else ''}"
-    )
-
-    try:
-        needs_tabs_content = bool(tab_id)
-
-        doc_info = (
-            docs.documents()
-            .get(
-                documentId=document_id,
-                includeTabsContent=needs_tabs_content,
-                fields="tabs" if needs_tabs_content else "body(content(endIndex)),documentStyle(pageSize)",
-            )
-            .execute()
-        )
+    log("Appending to Google Doc: %s (tab: %s)", document_id, tab_id or "default")
 
-        end_index = 1
-        body_content: list = []
+    if not text_to_append:
+        return "Nothing to append."
 
-        if tab_id:
-            target_tab = helpers.find_tab_by_id(doc_info, tab_id)
-            if not target_tab:
-                raise ToolError(f'Tab with ID "{tab_id}" not found in document.')
-            if not target_tab.get("documentTab"):
-                raise ToolError(
-                    f'Tab "{tab_id}" does not have content (may not be a document tab).'
-                )
-            body_content = (
-                target_tab.get("documentTab", {}).get("body", {}).get("content", [])
+    try:
+        if add_newline_if_needed:
+            # The current end of the body decides whether a newline is needed
+            request = _prepare_append_at_end_index_request(
+                docs, document_id, text_to_append, tab_id
             )
         else:
-            body_content = doc_info.get("body", {}).get("content", [])
+            # Insert at the end of the body without looking it up first
+            segment: dict[str, Any] = {"tabId": tab_id} if tab_id else {}
+            request = {
+                "insertText": {"endOfSegmentLocation": segment, "text": text_to_append}
+            }
 
-        if body_content:
-            last_element = body_content[-1]
-            if last_element.get("endIndex"):
-                end_index = last_element["endIndex"] - 1
-
-        text_to_insert = (
-            ("\n" if add_newline_if_needed and end_index > 1 else "") + text_to_append
-        )
-
-        if not text_to_insert:
-            return "Nothing to append."
-
-        location: dict[str, Any] = {"index": end_index}
-        if tab_id:
-            location["tabId"] = tab_id
-
-        request = {"insertText": {"location": location, "text": text_to_insert}}
-        helpers.execute_batch_update_sync(docs, document_id, [request])
+        _execute_tab_update(docs, document_id, request, tab_id)
 
         log(
-            f"Successfully appended to doc: {document_id}"
-            f"{f' (tab: {tab_id})' if tab_id else ''}"
+            "Successfully appended to doc: %s (tab: %s)",
+            document_id,
+            tab_id or "default",
         )
         return (
             f"Successfully appended text to "
@@ -389,10 +452,89 @@ def append_to_document(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error appending to doc {document_id}: {error_message}")
+        log_error("Error appending to doc %s: %s", document_id, error_message)
         raise ToolError(f"Failed to append to doc: {error_message}")
 
 
+def _prepare_append_at_end_index_request(
+    docs, document_id: str, text_to_append: str, tab_id: str | None
+) -> dict:
+    """Fetch the body end index and prepare an insertText request that appends there."""
+    needs_tabs_content = bool(tab_id)
+
+    doc_info = (
+        docs.documents()
+        .get(
+            documentId=document_id,
+            includeTabsContent=needs_tabs_content,
+            fields=(
+                helpers.build_tabs_fields(
+                    "tabProperties,documentTab(body(content(endIndex)))"
+                )
+                if needs_tabs_content
+                else "body(content(endIndex))"
+            ),
+        )
+        .execute()
+    )
+
+    end_index = 1
+    body_content: list = []
+
+    if tab_id:
+        target_tab = helpers.find_tab_by_id(doc_info, tab_id)
+        if not target_tab:
+            raise ToolError(f'Tab with ID "{tab_id}" not found in document.')
+        if not target_tab.get("documentTab"):
+            raise ToolError(
+                f'Tab "{tab_id}" does not have content (may not be a document tab).'
+            )
+        body_content = (
+            target_tab.get("documentTab", {}).get("body", {}).get("content", [])
+        )
+    else:
+        body_content = doc_info.get("body", {}).get("content", [])
+
+    if body_content:
+        last_element = body_content[-1]
+        if last_element.get("endIndex"):
+            end_index = last_element["endIndex"] - 1
+
+    text_to_insert = "\n" + text_to_append if end_index > 1 else text_to_append
+
+    location: dict[str, Any] = {"index": end_index}
+    if tab_id:
+        location["tabId"] = tab_id
+
+    return {"insertText": {"location": location, "text": text_to_insert}}
+
+
+# Matches the API's complaints about a tab ("The tab ID is invalid.", "tabId"),
+# but not messages about tables
+_TAB_ERROR_PATTERN = re.compile(r"\btab\b|\btabId\b", re.IGNORECASE)
+
+
+def _execute_tab_update(docs, document_id: str, request: dict, tab_id: str | None) -> None:
+    """
+    Execute a single-request batch update, reporting an unknown tab clearly.
+
+    The tab is not validated up front: batchUpdate rejects an unknown tab ID
+    itself, which saves a round trip on every successful write.
+    """
+    try:
+        helpers.execute_batch_update_sync(docs, document_id, [request])
+    except ToolError as e:
+        cause = e.__cause__
+        if (
+            tab_id
+            and cause is not None
+            and helpers.get_http_status(cause) == 400
+            and _TAB_ERROR_PATTERN.search(str(cause))
+        ):
+            raise ToolError(f'Tab "{tab_id}" not found or not a document tab.') from cause
+        raise
+
+
 def insert_text(
     document_id: str,
     text_to_insert: str,
@@ -416,32 +558,17 @@ def insert_text(
     """
     docs = get_docs_client()
     log(
-        f"Inserting text in doc {document_id} at index {index}"
-        f"{f' (tab: {tab_id})' if tab_id else ''}"
+        "Inserting text in doc %s at index %s (tab: %s)",
+        document_id,
+        index,
+        tab_id or "default",
     )
 
     try:
         if tab_id:
-            doc_info = (
-                docs.documents()
-                .get(
-                    documentId=document_id,
-                    includeTabsContent=True,
-                    fields="tabs(tabProperties,documentTab)",
-                )
-                .execute()
-            )
-            target_tab = helpers.find_tab_by_id(doc_info, tab_id)
-            if not target_tab:
-                raise ToolError(f'Tab with ID "{tab_id}" not found in document.')
-            if not target_tab.get("documentTab"):
-                raise ToolError(
-                    f'Tab "{tab_id}" does not have content (may not be a document tab).'
-                )
-
             location: dict[str, Any] = {"index": index, "tabId": tab_id}
             request = {"insertText": {"location": location, "text": text_to_insert}}
-            helpers.execute_batch_update_sync(docs, document_id, [request])
+            _execute_tab_update(docs, document_id, request, tab_id)
         else:
             helpers.insert_text(docs, document_id, text_to_insert, index)
 
@@ -454,7 +581,7 @@ def insert_text(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error inserting text in doc {document_id}: {error_message}")
+        log_error("Error inserting text in doc %s: %s", document_id, error_message)
         raise ToolError(f"Failed to insert text: {error_message}")
 
 
@@ -481,32 +608,17 @@ def delete_range(
     """
     docs = get_docs_client()
     log(
-        f"Deleting range {start_index}-{end_index} in doc {document_id}"
-        f"{f' (tab: {tab_id})' if tab_id else ''}"
+        "Deleting range %s-%s in doc %s (tab: %s)",
+        start_index,
+        end_index,
+        document_id,
+        tab_id or "default",
     )
 
     if end_index <= start_index:
         raise ToolError("End index must be greater than start index for deletion.")
 
     try:
-        if tab_id:
-            doc_info = (
-                docs.documents()
-                .get(
-                    documentId=document_id,
-                    includeTabsContent=True,
-                    fields="tabs(tabProperties,documentTab)",
-                )
-                .execute()
-            )
-            target_tab = helpers.find_tab_by_id(doc_info, tab_id)
-            if not target_tab:
-                raise ToolError(f'Tab with ID "{tab_id}" not found in document.')
-            if not target_tab.get("documentTab"):
-                raise ToolError(
-                    f'Tab "{tab_id}" does not have content (may not be a document tab).'
-                )
-
         range_dict: dict[str, Any] = {
             "startIndex": start_index,
             "endIndex": end_index,
@@ -515,7 +627,7 @@ def delete_range(
             range_dict["tabId"] = tab_id
 
         request = {"deleteContentRange": {"range": range_dict}}
-        helpers.execute_batch_update_sync(docs, document_id, [request])
+        _execute_tab_update(docs, document_id, request, tab_id)
 
         return (
             f"Successfully deleted content in range {start_index}-{end_index}"
@@ -526,7 +638,7 @@ def delete_range(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error deleting range in doc {document_id}: {error_message}")
+        log_error("Error deleting range in doc %s: %s", document_id, error_message)
         raise ToolError(f"Failed to delete range: {error_message}")
 
 
@@ -557,8 +669,11 @@ def apply_text_style(
     """
     docs = get_docs_client()
     log(
-        f"Applying text style in doc {document_id}. "
-        f"Target: range={start_index}-{end_index}, text='{text_to_find}'"
+        "Applying text style in doc %s. Target: range=%s-%s, text='%s'",
+        document_id,
+        start_index,
+        end_index,
+        text_to_find,
     )
 
     try:
@@ -574,8 +689,11 @@ def apply_text_style(
             start_index = text_range.start_index
             end_index = text_range.end_index
             log(
-                f'Found text "{text_to_find}" (instance {match_instance}) '
-                f"at range {start_index}-{end_index}"
+                'Found text "%s" (instance %s) at range %s-%s',
+                text_to_find,
+                match_instance,
+                start_index,
+                end_index,
             )
 
         if start_index is None or end_index is None:
@@ -600,7 +718,7 @@ def apply_text_style(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error applying text style in doc {document_id}: {error_message}")
+        log_error("Error applying text style in doc %s: %s", document_id, error_message)
         raise ToolError(f"Failed to apply text style: {error_message}")
 
 
@@ -632,25 +750,32 @@ def apply_paragraph_style(
         UserError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Applying paragraph style to document {document_id}")
+    log("Applying paragraph style to document %s", document_id)
 
     try:
         # Determine target range
         if text_to_find:
-            log(f'Finding text "{text_to_find}" (instance {match_instance})')
+            log('Finding text "%s" (instance %s)', text_to_find, match_instance)
+            # One fetch serves both the text search and the paragraph lookup
+            document = (
+                docs.documents()
+                .get(documentId=document_id, fields=helpers.TEXT_SEARCH_FIELDS)
+                .execute()
+            )
             text_range = helpers.find_text_range(
-                docs, document_id, text_to_find, match_instance
+                docs, document_id, text_to_find, match_instance, document=document
             )
             if not text_range:
                 raise ToolError(f'Could not find "{text_to_find}" in the document.')
 
             log(
-                f"Found text at range {text_range.start_index}-{text_range.end_index}, "
-                f"now locating containing paragraph"
+                "Found text at range %s-%s, now locating containing paragraph",
+                text_range.start_index,
+                text_range.end_index,
             )
 
             paragraph_range = helpers.get_paragraph_range(
-                docs, document_id, text_range.start_index
+                docs, document_id, text_range.start_index, document=document
             )
             if not paragraph_range:
                 raise ToolError(
@@ -659,10 +784,14 @@ def apply_paragraph_style(
 
             start_index = paragraph_range.start_index
             end_index = paragraph_range.end_index
-            log(f"Text is contained within paragraph at range {start_index}-{end_index}")
+            log(
+                "Text is contained within paragraph at range %s-%s",
+                start_index,
+                end_index,
+            )
 
         elif index_within_paragraph is not None:
-            log(f"Finding paragraph containing index {index_within_paragraph}")
+            log("Finding paragraph containing index %s", index_within_paragraph)
             paragraph_range = helpers.get_paragraph_range(
                 docs, document_id, index_within_paragraph
             )
@@ -673,7 +802,7 @@ def apply_paragraph_style(
 
             start_index = paragraph_range.start_index
             end_index = paragraph_range.end_index
-            log(f"Located paragraph at range {start_index}-{end_index}")
+            log("Located paragraph at range %s-%s", start_index, end_index)
 
         if start_index is None or end_index is None:
             raise ToolError(
@@ -686,7 +815,7 @@ def apply_paragraph_style(
             )
 
         # Build and apply the paragraph style request
-        log(f"Building paragraph style request for range {start_index}-{end_index}")
+        log("Building paragraph style request for range %s-%s", start_index, end_index)
         request_info = helpers.build_update_paragraph_style_request(
             start_index, end_index, style
         )
@@ -694,7 +823,7 @@ def apply_paragraph_style(
         if not request_info:
             return "No valid paragraph styling options were provided."
 
-        log(f"Applying styles: {', '.join(request_info['fields'])}")
+        log("Applying styles: %s", ", ".join(request_info["fields"]))
         helpers.execute_batch_update_sync(docs, document_id, [request_info["request"]])
 
         return (
@@ -706,7 +835,9 @@ def apply_paragraph_style(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error applying paragraph style in doc {document_id}: {error_message}")
+        log_error(
+            "Error applying paragraph style in doc %s: %s", document_id, error_message
+        )
         raise ToolError(f"Failed to apply paragraph style: {error_message}")
 
 
@@ -727,7 +858,9 @@ def insert_table(document_id: str, rows: int, columns: int, index: int) -> str:
         UserError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Inserting {rows}x{columns} table in doc {document_id} at index {index}")
+    log(
+        "Inserting %sx%s table in doc %s at index %s", rows, columns, document_id, index
+    )
 
     try:
         helpers.create_table(docs, document_id, rows, columns, index)
@@ -737,7 +870,7 @@ def insert_table(document_id: str, rows: int, columns: int, index: int) -> str:
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error inserting table in doc {document_id}: {error_message}")
+        log_error("Error inserting table in doc %s: %s", document_id, error_message)
         raise ToolError(f"Failed to insert table: {error_message}")
 
 
@@ -756,7 +889,7 @@ def insert_page_break(document_id: str, index: int) -> str:
         UserError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Inserting page break in doc {document_id} at index {index}")
+    log("Inserting page break in doc %s at index %s", document_id, index)
 
     try:
         request = {"insertPageBreak": {"location": {"index": index}}}
@@ -767,7 +900,9 @@ def insert_page_break(document_id: str, index: int) -> str:
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error inserting page break in doc {document_id}: {error_message}")
+        log_error(
+            "Error inserting page break in doc %s: %s", document_id, error_message
+        )
         raise ToolError(f"Failed to insert page break: {error_message}")
 
 
@@ -795,7 +930,12 @@ def insert_image_from_url(
         UserError: For permission/not found errors or invalid URL
     """
     docs = get_docs_client()
-    log(f"Inserting image from URL {image_url} at index {index} in doc {document_id}")
+    log(
+        "Inserting image from URL %s at index %s in doc %s",
+        image_url,
+        index,
+        document_id,
+    )
 
     try:
         helpers.insert_inline_image(docs, document_id, image_url, index, width, height)
@@ -810,10 +950,76 @@ def insert_image_from_url(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error inserting image in doc {document_id}: {error_message}")
+        log_error("Error inserting image in doc %s: %s", document_id, error_message)
         raise ToolError(f"Failed to insert image: {error_message}")
 
 
+# Document fields used by text-finding bulk operations: the ID plus, for each
+# tab and child tab, the text runs and element boundaries searched by the helpers
+_TEXT_FINDING_FIELDS = "documentId," + helpers.build_tabs_fields(
+    f"tabProperties,documentTab({helpers.TEXT_SEARCH_FIELDS})"
+)
+
+
+class _BulkDocument:
+    """
+    Document state shared by the operations of one bulk update.
+
+    The document is fetched on first use. Text lookups are remembered so
+    operations targeting the same text search the document only once, and
+    each tab's paragraphs are indexed once for paragraph lookups. Image URL
+    checks run up front are kept in image_url_errors.
+    """
+
+    def __init__(self, docs, document_id: str):
+        self._docs = docs
+        self._document_id = document_id
+        self._document: dict | None = None
+        self._text_ranges: dict[tuple, TextRange | None] = {}
+        self._paragraph_indexes: dict[str | None, tuple[list[int], list[TextRange]]] = {}
+        self.image_url_errors: dict[str, Exception | None] = {}
+
+    def get(self) -> dict:
+        """Return the document, fetching it on the first call."""
+        if self._document is None:
+            log("Fetching document %s for text-finding operations", self._document_id)
+            self._document = (
+                self._docs.documents()
+                .get(
+                    documentId=self._document_id,
+                    includeTabsContent=True,
+                    fields=_TEXT_FINDING_FIELDS,
+                )
+                .execute()
+            )
+        return self._document
+
+    def find_text_range(
+        self, text_to_find: str, match_instance: int, tab_id: str | None
+    ) -> TextRange | None:
+        """Find text in the document, reusing the result of an identical lookup."""
+        key = (tab_id, text_to_find, match_instance)
+        if key not in self._text_ranges:
+            self._text_ranges[key] = helpers.find_text_range(
+                self._docs,
+                self._document_id,
+                text_to_find,
+                match_instance,
+                document=self.get(),
+                tab_id=tab_id,
+            )
+        return self._text_ranges[key]
+
+    def paragraph_range(self, index_within: int, tab_id: str | None) -> TextRange | None:
+        """Find the paragraph containing an index using the tab's paragraph index."""
+        paragraph_index = self._paragraph_indexes.get(tab_id)
+        if paragraph_index is None:
+            body = helpers.get_body_from_document(self.get(), tab_id) or {}
+            paragraph_index = helpers.build_paragraph_index(body)
+            self._paragraph_indexes[tab_id] = paragraph_index
+        return helpers.find_paragraph_in_index(paragraph_index, index_within)
+
+
 def bulk_update_document(
     document_id: str, operations: list[dict], default_tab_id: str | None = None
 ) -> str:
@@ -833,7 +1039,9 @@ def bulk_update_document(
     """
     docs = get_docs_client()
     log(
-        f"Processing bulk update with {len(operations)} operations for doc {document_id}"
+        "Processing bulk update with %s operations for doc %s",
+        len(operations),
+        document_id,
     )
 
     if not operations:
@@ -845,191 +1053,75 @@ def bulk_update_document(
         )
 
     try:
-        # Step 1: Determine if we need to fetch the document for text-finding operations
-        needs_document = any(
-            op.get("text_to_find") or op.get("index_within_paragraph")
-            for op in operations
-        )
+        # Step 1: Fetch the document lazily, only once an operation needs it
+        bulk_document = _BulkDocument(docs, document_id)
 
-        document = None
-        if needs_document:
-            log(f"Fetching document {document_id} for text-finding operations")
-            document = (
-                docs.documents()
-                .get(documentId=document_id, includeTabsContent=True, fields="*")
-                .execute()
-            )
+        # Check every image URL concurrently rather than once per operation
+        bulk_document.image_url_errors = _validate_image_urls(operations)
 
         # Step 2: Parse and validate operations, preparing requests
         requests = []
-        operation_summaries = []
-
-        for i, op_dict in enumerate(operations):
-            op_type = op_dict.get("type")
-            if not op_type:
-                raise ToolError(f"Operation {i + 1} missing 'type' field")
-
-            try:
-                if op_type == "insert_text":
-                    request = _prepare_insert_text_request(op_dict, default_tab_id)
-                    requests.append(request)
-                    operation_summaries.append(f"insert_text at index {op_dict.get('index', 1)}")
-
-                elif op_type == "delete_range":
-                    request = _prepare_delete_range_request(op_dict, default_tab_id)
-                    requests.append(request)
-                    operation_summaries.append(
-                        f"delete_range {op_dict.get('start_index')}-{op_dict.get('end_index')}"
-                    )
-
-                elif op_type == "apply_text_style":
-                    request = _prepare_apply_text_style_request(
-                        op_dict, document, default_tab_id
-                    )
-                    requests.append(request)
-                    operation_summaries.append("apply_text_style")
-
-                elif op_type == "apply_paragraph_style":
-                    request = _prepare_apply_paragraph_style_request(
-                        op_dict, document, default_tab_id
-                    )
-                    requests.append(request)
-                    operation_summaries.append("apply_paragraph_style")
-
-                elif op_type == "insert_table":
-                    request = _prepare_insert_table_request(op_dict)
-                    requests.append(request)
-                    operation_summaries.append(
-                        f"insert_table {op_dict.get('rows')}x{op_dict.get('columns')}"
+        operation_counts: Counter[str] = Counter()
+
+        # One handler around the whole loop keeps the per-operation path lean;
+        # the loop variables still identify the operation that failed
+        op_type = None
+        try:
+            for i, op_dict in enumerate(operations):
+                op_type = op_dict.get("type")
+                if not op_type:
+                    raise ToolError(f"Operation {i + 1} missing 'type' field")
+
+                handler = _BULK_OPERATION_HANDLERS.get(op_type)
+                if handler is None:
+                    raise ToolError(
+                        f"Unknown operation type '{op_type}' in operation {i + 1}"
                     )
 
-                elif op_type == "insert_page_break":
-                    request = _prepare_insert_page_break_request(op_dict)
+                request = handler(op_dict, bulk_document, default_tab_id)
+                if request:  # May be None, e.g. cell style with no styles provided
                     requests.append(request)
-                    operation_summaries.append(f"insert_page_break at index {op_dict.get('index')}")
+                    operation_counts[op_type] += 1
 
-                elif op_type == "insert_image_from_url":
-                    request = _prepare_insert_image_request(op_dict)
-                    requests.append(request)
-                    operation_summaries.append(f"insert_image at index {op_dict.get('index')}")
-
-                elif op_type == "create_bullet_list":
-                    request = _prepare_create_bullet_list_request(op_dict, default_tab_id)
-                    requests.append(request)
-                    operation_summaries.append(f"create_bullet_list {op_dict.get('list_type', 'UNORDERED')}")
-
-                elif op_type == "replace_all_text":
-                    request = _prepare_replace_all_text_request(op_dict, default_tab_id)
-                    requests.append(request)
-                    operation_summaries.append(f"replace_all_text '{op_dict.get('find_text')}'")
-
-                elif op_type == "insert_table_row":
-                    request = _prepare_insert_table_row_request(op_dict)
-                    requests.append(request)
-                    operation_summaries.append("insert_table_row")
-
-                elif op_type == "delete_table_row":
-                    request = _prepare_delete_table_row_request(op_dict)
-                    requests.append(request)
-                    operation_summaries.append("delete_table_row")
-
-                elif op_type == "insert_table_column":
-                    request = _prepare_insert_table_column_request(op_dict)
-                    requests.append(request)
-                    operation_summaries.append("insert_table_column")
-
-                elif op_type == "delete_table_column":
-                    request = _prepare_delete_table_column_request(op_dict)
-                    requests.append(request)
-                    operation_summaries.append("delete_table_column")
-
-                elif op_type == "update_table_cell_style":
-                    request = _prepare_update_table_cell_style_request(op_dict)
-                    if request:  # May be None if no styles provided
-                        requests.append(request)
-                        operation_summaries.append("update_table_cell_style")
-
-                elif op_type == "merge_table_cells":
-                    request = _prepare_merge_table_cells_request(op_dict)
-                    requests.append(request)
-                    operation_summaries.append("merge_table_cells")
-
-                elif op_type == "unmerge_table_cells":
-                    request = _prepare_unmerge_table_cells_request(op_dict)
-                    requests.append(request)
-                    operation_summaries.append("unmerge_table_cells")
-
-                elif op_type == "create_named_range":
-                    request = _prepare_create_named_range_request(op_dict, default_tab_id)
-                    requests.append(request)
-                    operation_summaries.append(f"create_named_range '{op_dict.get('name')}'")
-
-                elif op_type == "delete_named_range":
-                    request = _prepare_delete_named_range_request(op_dict)
-                    requests.append(request)
-                    operation_summaries.append("delete_named_range")
-
-                elif op_type == "insert_footnote":
-                    request = _prepare_insert_footnote_request(op_dict)
-                    requests.append(request)
-                    operation_summaries.append("insert_footnote")
-
-                elif op_type == "insert_table_of_contents":
-                    request = _prepare_insert_table_of_contents_request(op_dict)
-                    requests.append(request)
-                    operation_summaries.append("insert_table_of_contents")
-
-                elif op_type == "insert_horizontal_rule":
-                    request = _prepare_insert_horizontal_rule_request(op_dict)
-                    requests.append(request)
-                    operation_summaries.append("insert_horizontal_rule")
-
-                elif op_type == "insert_section_break":
-                    request = _prepare_insert_section_break_request(op_dict)
-                    requests.append(request)
-                    operation_summaries.append(f"insert_section_break {op_dict.get('section_type', 'CONTINUOUS')}")
-
-                else:
-                    raise ToolError(
-                        f"Unknown operation type '{op_type}' in operation {i + 1}"
-                    )
+        except Exception as e:
+            if not op_type:
+                raise
+            raise ToolError(
+                f"Error preparing operation {i + 1} ({op_type}): {str(e)}"
+            ) from e
 
-            except Exception as e:
-                raise ToolError(f"Error preparing operation {i + 1} ({op_type}): {str(e)}")
+        _share_drive_images(operations)
 
         # Step 3: Chunk requests into batches of 50
         request_chunks = helpers.chunk_requests(requests, chunk_size=50)
-        log(
-            f"Executing {len(requests)} requests in {len(request_chunks)} batch(es)"
-        )
+        log("Executing %s requests in %s batch(es)", len(requests), len(request_chunks))
 
-        # Step 4: Execute batches sequentially
+        # Step 4: Execute batches sequentially. Later requests use indices that
+        # assume earlier batches were applied, so batches cannot run concurrently.
         for chunk_idx, chunk in enumerate(request_chunks):
-            log(f"Executing batch {chunk_idx + 1}/{len(request_chunks)} with {len(chunk)} requests")
+            log(
+                "Executing batch %s/%s with %s requests",
+                chunk_idx + 1,
+                len(request_chunks),
+                len(chunk),
+            )
             helpers.execute_batch_update_sync(docs, document_id, chunk)
 
         # Step 5: Return summary
-        summary_lines = [
-            f"✓ Successfully executed {len(operations)} operations in {len(request_chunks)} batch(es):",
-            "",
-        ]
-
-        # Group operation summaries by type
-        operation_counts: dict[str, int] = {}
-        for summary in operation_summaries:
-            op_type = summary.split()[0]
-            operation_counts[op_type] = operation_counts.get(op_type, 0) + 1
-
+        summary = io.StringIO()
+        summary.write(
+            f"✓ Successfully executed {len(operations)} operations in {len(request_chunks)} batch(es):\n"
+        )
         for op_type, count in sorted(operation_counts.items()):
-            summary_lines.append(f"  - {count}× {op_type}")
+            summary.write(f"\n  - {count}× {op_type}")
 
-        return "\n".join(summary_lines)
+        return summary.getvalue()
 
     except ToolError:
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error in bulk update for doc {document_id}: {error_message}")
+        log_error("Error in bulk update for doc %s: %s", document_id, error_message)
         raise ToolError(f"Bulk update failed: {error_message}")
 
 
@@ -1042,9 +1134,7 @@ def _prepare_insert_text_request(op_dict: dict, default_tab_id: str | None) -> d
     index = op_dict.get("index", 1)
     tab_id = op_dict.get("tab_id", default_tab_id)
 
-    location: dict[str, Any] = {"index": index}
-    if tab_id:
-        location["tabId"] = tab_id
+    location = {"index": index, "tabId": tab_id} if tab_id else {"index": index}
 
     return {"insertText": {"text": text, "location": location}}
 
@@ -1060,15 +1150,54 @@ def _prepare_delete_range_request(op_dict: dict, default_tab_id: str | None) ->
             f"Invalid range: end_index ({end_index}) must be greater than start_index ({start_index})"
         )
 
-    range_obj: dict[str, Any] = {"startIndex": start_index, "endIndex": end_index}
-    if tab_id:
-        range_obj["tabId"] = tab_id
+    range_obj = (
+        {"startIndex": start_index, "endIndex": end_index, "tabId": tab_id}
+        if tab_id
+        else {"startIndex": start_index, "endIndex": end_index}
+    )
 
     return {"deleteContentRange": {"range": range_obj}}
 
 
+# Operation dict keys read into TextStyleArgs / ParagraphStyleArgs
+_TEXT_STYLE_KEYS = tuple(field.name for field in dataclasses.fields(TextStyleArgs))
+_PARAGRAPH_STYLE_KEYS = tuple(field.name for field in dataclasses.fields(ParagraphStyleArgs))
+
+
+def _find_text_range_in_document(
+    document: dict,
+    text_to_find: str,
+    match_instance: int,
+    tab_id: str | None,
+    bulk: _BulkDocument | None = None,
+) -> TextRange | None:
+    """Find text in already-fetched document data, through the bulk update's lookups if given."""
+    if bulk is not None:
+        return bulk.find_text_range(text_to_find, match_instance, tab_id)
+    return helpers.find_text_range(
+        get_docs_client(),
+        document["documentId"],
+        text_to_find,
+        match_instance,
+        document=document,
+        tab_id=tab_id,
+    )
+
+
+def _find_paragraph_range_in_document(
+    document: dict, index_within: int, tab_id: str | None, bulk: _BulkDocument | None = None
+) -> TextRange | None:
+    """Find a paragraph in already-fetched document data, through the bulk update's index if given."""
+    if bulk is not None:
+        return bulk.paragraph_range(index_within, tab_id)
+    return helpers.get_paragraph_range_from_document(document, index_within, tab_id)
+
+
 def _prepare_apply_text_style_request(
-    op_dict: dict, document: dict | None, default_tab_id: str | None
+    op_dict: dict,
+    document: dict | None,
+    default_tab_id: str | None,
+    bulk: _BulkDocument | None = None,
 ) -> dict:
     """Prepare updateTextStyle request from operation dict."""
     # Determine the range to apply styling to
@@ -1076,14 +1205,19 @@ def _prepare_apply_text_style_request(
     end_index = op_dict.get("end_index")
     text_to_find = op_dict.get("text_to_find")
     match_instance = op_dict.get("match_instance", 1)
+    tab_id = op_dict.get("tab_id", default_tab_id)
 
     if text_to_find:
         # Text-based targeting - find the text first
         if not document:
             raise ToolError("Document data required for text-finding operations")
 
-        text_range = helpers.find_text_range(
-            get_docs_client(), document["documentId"], text_to_find, match_instance
+        text_range = _find_text_range_in_document(
+            document,
+            text_to_find,
+            match_instance,
+            tab_id,
+            bulk,
         )
         if not text_range:
             raise ToolError(
@@ -1097,19 +1231,8 @@ def _prepare_apply_text_style_request(
         )
 
     # Build text style args from operation dict
-    style_args = TextStyleArgs(
-        bold=op_dict.get("bold"),
-        italic=op_dict.get("italic"),
-        underline=op_dict.get("underline"),
-        strikethrough=op_dict.get("strikethrough"),
-        font_size=op_dict.get("font_size"),
-        font_family=op_dict.get("font_family"),
-        foreground_color=op_dict.get("foreground_color"),
-        background_color=op_dict.get("background_color"),
-        link_url=op_dict.get("link_url"),
-    )
+    style_args = TextStyleArgs(**{key: op_dict.get(key) for key in _TEXT_STYLE_KEYS})
 
-    tab_id = op_dict.get("tab_id", default_tab_id)
     result = helpers.build_update_text_style_request(
         start_index, end_index, style_args
     )
@@ -1123,7 +1246,10 @@ def _prepare_apply_text_style_request(
 
 
 def _prepare_apply_paragraph_style_request(
-    op_dict: dict, document: dict | None, default_tab_id: str | None
+    op_dict: dict,
+    document: dict | None,
+    default_tab_id: str | None,
+    bulk: _BulkDocument | None = None,
 ) -> dict:
     """Prepare updateParagraphStyle request from operation dict."""
     # Determine the range to apply styling to
@@ -1131,6 +1257,7 @@ def _prepare_apply_paragraph_style_request(
     end_index = op_dict.get("end_index")
     text_to_find = op_dict.get("text_to_find")
     match_instance = op_dict.get("match_instance", 1)
+    tab_id = op_dict.get("tab_id", default_tab_id)
     index_within_paragraph = op_dict.get("index_within_paragraph")
 
     if text_to_find:
@@ -1138,8 +1265,12 @@ def _prepare_apply_paragraph_style_request(
         if not document:
             raise ToolError("Document data required for text-finding operations")
 
-        text_range = helpers.find_text_range(
-            get_docs_client(), document["documentId"], text_to_find, match_instance
+        text_range = _find_text_range_in_document(
+            document,
+            text_to_find,
+            match_instance,
+            tab_id,
+            bulk,
         )
         if not text_range:
             raise ToolError(
@@ -1147,9 +1278,8 @@ def _prepare_apply_paragraph_style_request(
             )
 
         # Find paragraph containing the text
-        tab_id = op_dict.get("tab_id", default_tab_id)
-        para_range = helpers.get_paragraph_range_from_document(
-            document, text_range.start_index, tab_id
+        para_range = _find_paragraph_range_in_document(
+            document, text_range.start_index, tab_id, bulk
         )
         if not para_range:
             raise ToolError(
@@ -1163,9 +1293,8 @@ def _prepare_apply_paragraph_style_request(
         if not document:
             raise ToolError("Document data required for index_within_paragraph operations")
 
-        tab_id = op_dict.get("tab_id", default_tab_id)
-        para_range = helpers.get_paragraph_range_from_document(
-            document, index_within_paragraph, tab_id
+        para_range = _find_paragraph_range_in_document(
+            document, index_within_paragraph, tab_id, bulk
         )
         if not para_range:
             raise ToolError(
@@ -1182,16 +1311,9 @@ def _prepare_apply_paragraph_style_request(
 
     # Build paragraph style args from operation dict
     style_args = ParagraphStyleArgs(
-        alignment=op_dict.get("alignment"),
-        indent_start=op_dict.get("indent_start"),
-        indent_end=op_dict.get("indent_end"),
-        space_above=op_dict.get("space_above"),
-        space_below=op_dict.get("space_below"),
-        named_style_type=op_dict.get("named_style_type"),
-        keep_with_next=op_dict.get("keep_with_next"),
+        **{key: op_dict.get(key) for key in _PARAGRAPH_STYLE_KEYS}
     )
 
-    tab_id = op_dict.get("tab_id", default_tab_id)
     result = helpers.build_update_paragraph_style_request(
         start_index, end_index, style_args
     )
@@ -1228,8 +1350,116 @@ def _prepare_insert_page_break_request(op_dict: dict) -> dict:
     return {"insertPageBreak": {"location": {"index": index}}}
 
 
-def _prepare_insert_image_request(op_dict: dict) -> dict:
-    """Prepare insertInlineImage request from operation dict."""
+
+# Concurrent URL checks when validating a bulk update's images
+_IMAGE_VALIDATION_WORKERS = 8
+
+
+def _validate_image_urls(operations: list[dict]) -> dict[str, Exception | None]:
+    """
+    Validate the image URLs of insert_image_from_url operations concurrently.
+
+    Each check is a blocking HEAD request, so they run on a small thread pool
+    instead of one after another while operations are prepared.
+
+    Args:
+        operations: The bulk operation dicts
+
+    Returns:
+        Dict mapping each unique URL to the error its check raised, or None if valid
+    """
+    image_urls = list(dict.fromkeys(
+        op_dict["image_url"]
+        for op_dict in operations
+        if op_dict.get("type") == "insert_image_from_url" and op_dict.get("image_url")
+    ))
+    if not image_urls:
+        return {}
+
+    def check(image_url: str) -> Exception | None:
+        try:
+            helpers._validate_image_url(image_url)
+        except Exception as e:
+            return e
+        return None
+
+    log("Validating %s image URL(s)", len(image_urls))
+    workers = min(_IMAGE_VALIDATION_WORKERS, len(image_urls))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return dict(zip(image_urls, executor.map(check, image_urls)))
+
+
+def _share_drive_images(operations: list[dict]) -> None:
+    """
+    Make the Drive files behind insert_image_from_url operations publicly readable.
+
+    Google Docs can only fetch images it can access anonymously. Every unique
+    file is shared in batched Drive calls rather than one request per image.
+
+    Args:
+        operations: The bulk operation dicts
+
+    Raises:
+        ToolError: Naming the first operation whose file could not be shared
+    """
+    file_ops: dict[str, int] = {}
+    for i, op_dict in enumerate(operations):
+        if op_dict.get("type") == "insert_image_from_url":
+            file_id = helpers.get_drive_file_id(op_dict.get("image_url", ""))
+            if file_id:
+                file_ops.setdefault(file_id, i)
+
+    if not file_ops:
+        return
+
+    log("Setting public permissions for %s Google Drive file(s)", len(file_ops))
+    failures: dict[str, Exception] = {}
+
+    def collect(request_id: str, response: dict, exception: Exception | None) -> None:
+        if exception is not None:
+            failures[request_id] = exception
+
+    try:
+        drive = get_drive_client()
+        file_ids = list(file_ops)
+        for start in range(0, len(file_ids), helpers.MAX_BATCH_HTTP_REQUESTS):
+            batch = drive.new_batch_http_request(callback=collect)
+            for file_id in file_ids[start : start + helpers.MAX_BATCH_HTTP_REQUESTS]:
+                # Make the file publicly readable so Google Docs can access it
+                batch.add(
+                    drive.permissions().create(
+                        fileId=file_id, body={"type": "anyone", "role": "reader"}
+                    ),
+                    request_id=file_id,
+                )
+            batch.execute()
+    except Exception as e:
+        # The batch itself failed, so none of the files can be assumed shared
+        failures = dict.fromkeys(file_ops, e)
+
+    if failures:
+        file_id = min(failures, key=file_ops.__getitem__)
+        log_warning(
+            "Could not set public permissions for Drive file %s: %s",
+            file_id,
+            failures[file_id],
+        )
+        raise ToolError(
+            f"Error preparing operation {file_ops[file_id] + 1} (insert_image_from_url): "
+            f"Failed to set public permissions on Google Drive file {file_id}. "
+            "Please ensure the file is publicly accessible or share it with 'Anyone with the link'."
+        )
+
+
+def _prepare_insert_image_request(
+    op_dict: dict, image_url_errors: dict[str, Exception | None] | None = None
+) -> dict:
+    """
+    Prepare insertInlineImage request from operation dict.
+
+    image_url_errors holds results from _validate_image_urls; URLs it does
+    not cover are validated here.
+    """
     image_url = op_dict.get("image_url", "")
     index = op_dict.get("index", 1)
     width = op_dict.get("width")
@@ -1239,34 +1469,15 @@ def _prepare_insert_image_request(op_dict: dict) -> dict:
         raise ToolError("image_url is required for insert_image_from_url operation")
 
     # Validate URL is accessible (imported from helpers)
-    helpers._validate_image_url(image_url)
-
-    # If this is a Google Drive URL, ensure it has public permissions
-    if 'drive.google.com' in image_url:
-        # Extract file ID from various Drive URL formats
-        file_id_match = re.search(r'[?&]id=([^&]+)', image_url)
-        if file_id_match:
-            file_id = file_id_match.group(1)
-            log(f"Setting public permissions for Google Drive file {file_id}")
-
-            try:
-                drive = get_drive_client()
-                # Make the file publicly readable so Google Docs can access it
-                permission = {
-                    "type": "anyone",
-                    "role": "reader"
-                }
-                drive.permissions().create(
-                    fileId=file_id,
-                    body=permission
-                ).execute()
-                log(f"Successfully set public permissions for Drive file {file_id}")
-            except Exception as e:
-                log(f"Warning: Could not set public permissions for Drive file {file_id}: {e}")
-                raise ToolError(
-                    f"Failed to set public permissions on Google Drive file {file_id}. "
-                    "Please ensure the file is publicly accessible or share it with 'Anyone with the link'."
-                )
+    if image_url_errors is not None and image_url in image_url_errors:
+        error = image_url_errors[image_url]
+        if error is not None:
+            raise error
+    else:
+        helpers._validate_image_url(image_url)
+
+    # Drive-hosted images are shared by _share_drive_images once all
+    # operations are prepared
 
     location = {"index": index}
     uri = image_url
@@ -1317,7 +1528,7 @@ def create_bullet_list(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Creating {list_type} list in range {start_index}-{end_index}")
+    log("Creating %s list in range %s-%s", list_type, start_index, end_index)
 
     try:
         request = helpers.build_create_paragraph_bullets_request(
@@ -1332,10 +1543,11 @@ def create_bullet_list(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error creating list: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error creating list: %s", error_message)
+        if status == 404:
             raise ToolError("Document not found. Check the document ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
@@ -1366,7 +1578,7 @@ def replace_all_text(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Replacing all '{find_text}' with '{replace_text}' (match_case={match_case})")
+    log("Replacing all '%s' with '%s' (match_case=%s)", find_text, replace_text, match_case)
 
     try:
         request = helpers.build_replace_all_text_request(
@@ -1388,10 +1600,11 @@ def replace_all_text(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error replacing text: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error replacing text: %s", error_message)
+        if status == 404:
             raise ToolError("Document not found. Check the document ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
@@ -1420,7 +1633,7 @@ def insert_table_row(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Inserting table row at table {table_start_index}, row {row_index}")
+    log("Inserting table row at table %s, row %s", table_start_index, row_index)
 
     try:
         request = helpers.build_insert_table_row_request(
@@ -1436,14 +1649,15 @@ def insert_table_row(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error inserting table row: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error inserting table row: %s", error_message)
+        if status == 404:
             raise ToolError("Document or table not found. Check the document ID and table index.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
-        if "400" in error_message:
+        if status == 400:
             raise ToolError(
                 f"Invalid request: {error_message}. Check that the table exists at index {table_start_index} "
                 f"and row index {row_index} is valid."
@@ -1471,7 +1685,7 @@ def delete_table_row(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Deleting table row at table {table_start_index}, row {row_index}")
+    log("Deleting table row at table %s, row %s", table_start_index, row_index)
 
     try:
         request = helpers.build_delete_table_row_request(table_start_index, row_index)
@@ -1484,14 +1698,15 @@ def delete_table_row(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error deleting table row: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error deleting table row: %s", error_message)
+        if status == 404:
             raise ToolError("Document or table not found. Check the document ID and table index.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
-        if "400" in error_message:
+        if status == 400:
             raise ToolError(
                 f"Invalid request: {error_message}. Check that the table exists at index {table_start_index} "
                 f"and row index {row_index} is valid."
@@ -1521,7 +1736,7 @@ def insert_table_column(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Inserting table column at table {table_start_index}, column {column_index}")
+    log("Inserting table column at table %s, column %s", table_start_index, column_index)
 
     try:
         request = helpers.build_insert_table_column_request(
@@ -1537,14 +1752,15 @@ def insert_table_column(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error inserting table column: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error inserting table column: %s", error_message)
+        if status == 404:
             raise ToolError("Document or table not found. Check the document ID and table index.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
-        if "400" in error_message:
+        if status == 400:
             raise ToolError(
                 f"Invalid request: {error_message}. Check that the table exists at index {table_start_index} "
                 f"and column index {column_index} is valid."
@@ -1572,7 +1788,7 @@ def delete_table_column(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Deleting table column at table {table_start_index}, column {column_index}")
+    log("Deleting table column at table %s, column %s", table_start_index, column_index)
 
     try:
         request = helpers.build_delete_table_column_request(table_start_index, column_index)
@@ -1585,14 +1801,15 @@ def delete_table_column(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error deleting table column: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error deleting table column: %s", error_message)
+        if status == 404:
             raise ToolError("Document or table not found. Check the document ID and table index.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
-        if "400" in error_message:
+        if status == 400:
             raise ToolError(
                 f"Invalid request: {error_message}. Check that the table exists at index {table_start_index} "
                 f"and column index {column_index} is valid."
@@ -1648,7 +1865,7 @@ def update_table_cell_style(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Styling table cell at table {table_start_index}, row {row_index}, column {column_index}")
+    log("Styling table cell at table %s, row %s, column %s", table_start_index, row_index, column_index)
 
     try:
         request = helpers.build_update_table_cell_style_request(
@@ -1681,14 +1898,15 @@ def update_table_cell_style(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error styling table cell: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error styling table cell: %s", error_message)
+        if status == 404:
             raise ToolError("Document or table not found. Check the document ID and table index.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
-        if "400" in error_message:
+        if status == 400:
             raise ToolError(
                 f"Invalid request: {error_message}. Check that the table exists at index {table_start_index} "
                 f"and cell position ({row_index}, {column_index}) is valid."
@@ -1722,7 +1940,7 @@ def merge_table_cells(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Merging table cells at table {table_start_index}, from ({start_row},{start_column}) spanning {row_span}x{column_span}")
+    log("Merging table cells at table %s, from (%s,%s) spanning %sx%s", table_start_index, start_row, start_column, row_span, column_span)
 
     try:
         request = helpers.build_merge_table_cells_request(
@@ -1737,14 +1955,15 @@ def merge_table_cells(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error merging table cells: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error merging table cells: %s", error_message)
+        if status == 404:
             raise ToolError("Document or table not found. Check the document ID and table index.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
-        if "400" in error_message:
+        if status == 400:
             raise ToolError(
                 f"Invalid request: {error_message}. Check that the table exists at index {table_start_index} "
                 f"and the merge range is valid."
@@ -1774,7 +1993,7 @@ def unmerge_table_cells(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Unmerging table cells at table {table_start_index}, cell ({row_index},{column_index})")
+    log("Unmerging table cells at table %s, cell (%s,%s)", table_start_index, row_index, column_index)
 
     try:
         request = helpers.build_unmerge_table_cells_request(
@@ -1789,14 +2008,15 @@ def unmerge_table_cells(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error unmerging table cells: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error unmerging table cells: %s", error_message)
+        if status == 404:
             raise ToolError("Document or table not found. Check the document ID and table index.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
-        if "400" in error_message:
+        if status == 400:
             raise ToolError(
                 f"Invalid request: {error_message}. Check that the table exists at index {table_start_index} "
                 f"and cell ({row_index},{column_index}) is merged."
@@ -1828,7 +2048,7 @@ def create_named_range(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Creating named range '{name}' at range {start_index}-{end_index}")
+    log("Creating named range '%s' at range %s-%s", name, start_index, end_index)
 
     try:
         request = helpers.build_create_named_range_request(
@@ -1837,12 +2057,9 @@ def create_named_range(
 
         result = helpers.execute_batch_update_sync(docs, document_id, [request])
 
-        # Extract named range ID from response
-        named_range_id = ""
-        if result and "replies" in result:
-            for reply in result.get("replies", []):
-                if "createNamedRange" in reply:
-                    named_range_id = reply["createNamedRange"].get("namedRangeId", "")
+        # Replies follow request order, so the only reply is for our request
+        replies = (result or {}).get("replies") or [{}]
+        named_range_id = replies[0].get("createNamedRange", {}).get("namedRangeId", "")
 
         return f"Successfully created named range '{name}' at range {start_index}-{end_index}. Range ID: {named_range_id}"
 
@@ -1850,10 +2067,11 @@ def create_named_range(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error creating named range: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error creating named range: %s", error_message)
+        if status == 404:
             raise ToolError("Document not found. Check the document ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
@@ -1878,7 +2096,7 @@ def delete_named_range(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Deleting named range {named_range_id}")
+    log("Deleting named range %s", named_range_id)
 
     try:
         request = helpers.build_delete_named_range_request(named_range_id)
@@ -1891,10 +2109,11 @@ def delete_named_range(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error deleting named range: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error deleting named range: %s", error_message)
+        if status == 404:
             raise ToolError("Document or named range not found. Check the document ID and named range ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
@@ -1921,7 +2140,7 @@ def insert_footnote(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Inserting footnote at index {index}")
+    log("Inserting footnote at index %s", index)
 
     try:
         request = helpers.build_insert_footnote_request(index, footnote_text)
@@ -1934,10 +2153,11 @@ def insert_footnote(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error inserting footnote: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error inserting footnote: %s", error_message)
+        if status == 404:
             raise ToolError("Document not found. Check the document ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
@@ -1964,7 +2184,7 @@ def insert_table_of_contents(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Inserting table of contents at index {index}")
+    log("Inserting table of contents at index %s", index)
 
     try:
         request = helpers.build_insert_table_of_contents_request(index)
@@ -1977,10 +2197,11 @@ def insert_table_of_contents(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error inserting table of contents: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error inserting table of contents: %s", error_message)
+        if status == 404:
             raise ToolError("Document not found. Check the document ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
@@ -2005,7 +2226,7 @@ def insert_horizontal_rule(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Inserting horizontal rule at index {index}")
+    log("Inserting horizontal rule at index %s", index)
 
     try:
         request = helpers.build_insert_horizontal_rule_request(index)
@@ -2018,10 +2239,11 @@ def insert_horizontal_rule(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error inserting horizontal rule: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error inserting horizontal rule: %s", error_message)
+        if status == 404:
             raise ToolError("Document not found. Check the document ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
@@ -2039,7 +2261,7 @@ def insert_section_break(
     Args:
         document_id: The ID of the Google Document
         index: Index where to insert section break (1-based)
-        section_type: Type of section break (CONTINUOUS, NEXT_PAGE, EVEN_PAGE, ODD_PAGE)
+        section_type: Type of section break (CONTINUOUS or NEXT_PAGE)
 
     Returns:
         Success message
@@ -2048,7 +2270,7 @@ def insert_section_break(
         ToolError: For permission/not found errors
     """
     docs = get_docs_client()
-    log(f"Inserting {section_type} section break at index {index}")
+    log("Inserting %s section break at index %s", section_type, index)
 
     try:
         request = helpers.build_insert_section_break_request(index, section_type)
@@ -2061,10 +2283,11 @@ def insert_section_break(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error inserting section break: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error("Error inserting section break: %s", error_message)
+        if status == 404:
             raise ToolError("Document not found. Check the document ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the document."
             )
@@ -2140,8 +2363,30 @@ def _prepare_delete_table_column_request(op_dict: dict) -> dict:
     return helpers.build_delete_table_column_request(table_start_index, column_index)
 
 
+# Operation dict keys that set a table cell style
+_CELL_STYLE_KEYS = frozenset({
+    "background_color",
+    "padding_top",
+    "padding_bottom",
+    "padding_left",
+    "padding_right",
+    "border_top_color",
+    "border_top_width",
+    "border_bottom_color",
+    "border_bottom_width",
+    "border_left_color",
+    "border_left_width",
+    "border_right_color",
+    "border_right_width",
+})
+
+
 def _prepare_update_table_cell_style_request(op_dict: dict) -> dict | None:
     """Prepare updateTableCellStyle request from operation dict."""
+    # Nothing to update, so skip building the request
+    if _CELL_STYLE_KEYS.isdisjoint(op_dict):
+        return None
+
     table_start_index = op_dict.get("table_start_index", 1)
     row_index = op_dict.get("row_index", 0)
     column_index = op_dict.get("column_index", 0)
@@ -2150,19 +2395,7 @@ def _prepare_update_table_cell_style_request(op_dict: dict) -> dict | None:
         table_start_index,
         row_index,
         column_index,
-        background_color=op_dict.get("background_color"),
-        padding_top=op_dict.get("padding_top"),
-        padding_bottom=op_dict.get("padding_bottom"),
-        padding_left=op_dict.get("padding_left"),
-        padding_right=op_dict.get("padding_right"),
-        border_top_color=op_dict.get("border_top_color"),
-        border_top_width=op_dict.get("border_top_width"),
-        border_bottom_color=op_dict.get("border_bottom_color"),
-        border_bottom_width=op_dict.get("border_bottom_width"),
-        border_left_color=op_dict.get("border_left_color"),
-        border_left_width=op_dict.get("border_left_width"),
-        border_right_color=op_dict.get("border_right_color"),
-        border_right_width=op_dict.get("border_right_width"),
+        **{key: op_dict.get(key) for key in _CELL_STYLE_KEYS},
     )
 
 
@@ -2243,3 +2476,40 @@ def _prepare_insert_section_break_request(op_dict: dict) -> dict:
     section_type = op_dict.get("section_type", "CONTINUOUS")
 
     return helpers.build_insert_section_break_request(index, section_type)
+
+
+# Bulk operation handlers by operation type. Each takes the operation dict, the
+# bulk update's _BulkDocument, and the default tab ID.
+_BULK_OPERATION_HANDLERS: dict[str, Callable[[dict, _BulkDocument, str | None], dict | None]] = {
+    "insert_text": lambda op, bulk, tab_id: _prepare_insert_text_request(op, tab_id),
+    "delete_range": lambda op, bulk, tab_id: _prepare_delete_range_request(op, tab_id),
+    "apply_text_style": lambda op, bulk, tab_id: _prepare_apply_text_style_request(
+        op, bulk.get() if op.get("text_to_find") else None, tab_id, bulk
+    ),
+    "apply_paragraph_style": lambda op, bulk, tab_id: _prepare_apply_paragraph_style_request(
+        op,
+        bulk.get() if op.get("text_to_find") or op.get("index_within_paragraph") else None,
+        tab_id,
+        bulk,
+    ),
+    "insert_table": lambda op, bulk, tab_id: _prepare_insert_table_request(op),
+    "insert_page_break": lambda op, bulk, tab_id: _prepare_insert_page_break_request(op),
+    "insert_image_from_url": lambda op, bulk, tab_id: _prepare_insert_image_request(
+        op, bulk.image_url_errors
+    ),
+    "create_bullet_list": lambda op, bulk, tab_id: _prepare_create_bullet_list_request(op, tab_id),
+    "replace_all_text": lambda op, bulk, tab_id: _prepare_replace_all_text_request(op, tab_id),
+    "insert_table_row": lambda op, bulk, tab_id: _prepare_insert_table_row_request(op),
+    "delete_table_row": lambda op, bulk, tab_id: _prepare_delete_table_row_request(op),
+    "insert_table_column": lambda op, bulk, tab_id: _prepare_insert_table_column_request(op),
+    "delete_table_column": lambda op, bulk, tab_id: _prepare_delete_table_column_request(op),
+    "update_table_cell_style": lambda op, bulk, tab_id: _prepare_update_table_cell_style_request(op),
+    "merge_table_cells": lambda op, bulk, tab_id: _prepare_merge_table_cells_request(op),
+    "unmerge_table_cells": lambda op, bulk, tab_id: _prepare_unmerge_table_cells_request(op),
+    "create_named_range": lambda op, bulk, tab_id: _prepare_create_named_range_request(op, tab_id),
+    "delete_named_range": lambda op, bulk, tab_id: _prepare_delete_named_range_request(op),
+    "insert_footnote": lambda op, bulk, tab_id: _prepare_insert_footnote_request(op),
+    "insert_table_of_contents": lambda op, bulk, tab_id: _prepare_insert_table_of_contents_request(op),
+    "insert_horizontal_rule": lambda op, bulk, tab_id: _prepare_insert_horizontal_rule_request(op),
+    "insert_section_break": lambda op, bulk, tab_id: _prepare_insert_section_break_request(op),
+}
@@ -12,8 +12,9 @@ from fastmcp.exceptions import ToolError
 from googleapiclient.http import MediaInMemoryUpload
 from mcp.types import ImageContent
 
+from google_docs_mcp.api import helpers
 from google_docs_mcp.auth import get_drive_client
-from google_docs_mcp.utils import log
+from google_docs_mcp.utils import log, log_error
 
 
 def list_google_docs(
@@ -81,8 +82,9 @@ def list_google_docs(
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error listing Google Docs: {error_message}")
-        if "403" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error listing Google Docs: {error_message}")
+        if status == 403:
             raise ToolError(
                 "Permission denied. Make sure you have granted Google Drive access."
             )
@@ -164,8 +166,9 @@ def search_google_docs(
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error searching Google Docs: {error_message}")
-        if "403" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error searching Google Docs: {error_message}")
+        if status == 403:
             raise ToolError(
                 "Permission denied. Make sure you have granted Google Drive access."
             )
@@ -236,8 +239,9 @@ def get_recent_google_docs(max_results: int = 10, days_back: int = 30) -> str:
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error getting recent Google Docs: {error_message}")
-        if "403" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error getting recent Google Docs: {error_message}")
+        if status == 403:
             raise ToolError(
                 "Permission denied. Make sure you have granted Google Drive access."
             )
@@ -309,10 +313,11 @@ def get_document_info(document_id: str) -> str:
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error getting document info: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error getting document info: {error_message}")
+        if status == 404:
             raise ToolError(f"Document not found (ID: {document_id}).")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError("Permission denied. Make sure you have access to this document.")
         raise ToolError(f"Failed to get document info: {error_message}")
 
@@ -360,10 +365,11 @@ def create_folder(name: str, parent_folder_id: str | None = None) -> str:
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error creating folder: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error creating folder: {error_message}")
+        if status == 404:
             raise ToolError("Parent folder not found. Check the parent folder ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError("Permission denied. Make sure you have write access.")
         raise ToolError(f"Failed to create folder: {error_message}")
 
@@ -447,10 +453,11 @@ def list_folder_contents(
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error listing folder contents: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error listing folder contents: {error_message}")
+        if status == 404:
             raise ToolError(f"Folder not found (ID: {folder_id}).")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError("Permission denied. Make sure you have access to this folder.")
         raise ToolError(f"Failed to list folder contents: {error_message}")
 
@@ -517,10 +524,11 @@ def upload_image_to_drive(
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error uploading image: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error uploading image: {error_message}")
+        if status == 404:
             raise ToolError("Parent folder not found. Check the parent folder ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError("Permission denied. Make sure you have write access to Drive.")
         raise ToolError(f"Failed to upload image: {error_message}")
 
@@ -588,10 +596,11 @@ def upload_file_to_drive(
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error uploading file: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error uploading file: {error_message}")
+        if status == 404:
             raise ToolError("Parent folder not found. Check the parent folder ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError("Permission denied. Make sure you have write access to Drive.")
         raise ToolError(f"Failed to upload file: {error_message}")
 
@@ -639,10 +648,11 @@ def create_google_doc(
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error creating Google Doc: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error creating Google Doc: {error_message}")
+        if status == 404:
             raise ToolError("Parent folder not found. Check the parent folder ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError("Permission denied. Make sure you have write access to Drive.")
         raise ToolError(f"Failed to create document: {error_message}")
 
@@ -668,8 +678,6 @@ def create_google_doc_from_markdown(
     Raises:
         UserError: For permission errors
     """
-    from googleapiclient.http import MediaInMemoryUpload
-
     drive = get_drive_client()
     log(f'Creating new Google Doc from markdown: "{title}"')
 
@@ -714,10 +722,11 @@ def create_google_doc_from_markdown(
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error creating Google Doc from markdown: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error creating Google Doc from markdown: {error_message}")
+        if status == 404:
             raise ToolError("Parent folder not found. Check the parent folder ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError("Permission denied. Make sure you have write access to Drive.")
         raise ToolError(f"Failed to create document from markdown: {error_message}")
 
@@ -777,10 +786,11 @@ def move_file(
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error moving file: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error moving file: {error_message}")
+        if status == 404:
             raise ToolError("File or folder not found. Check the file ID and folder ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the file and folder."
             )
@@ -830,10 +840,11 @@ def copy_file(
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error copying file: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error copying file: {error_message}")
+        if status == 404:
             raise ToolError("File not found. Check the file ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have read access to the file."
             )
@@ -867,10 +878,11 @@ def trash_file(file_id: str) -> str:
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error trashing file: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error trashing file: {error_message}")
+        if status == 404:
             raise ToolError("File not found. Check the file ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the file."
             )
@@ -904,10 +916,11 @@ def restore_file(file_id: str) -> str:
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error restoring file: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error restoring file: {error_message}")
+        if status == 404:
             raise ToolError("File not found. Check the file ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the file."
             )
@@ -937,10 +950,11 @@ def permanently_delete_file(file_id: str) -> str:
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error deleting file: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error deleting file: {error_message}")
+        if status == 404:
             raise ToolError("File not found. Check the file ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have edit access to the file."
             )
@@ -974,10 +988,11 @@ def star_file(file_id: str) -> str:
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error starring file: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error starring file: {error_message}")
+        if status == 404:
             raise ToolError("File not found. Check the file ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have access to the file."
             )
@@ -1011,10 +1026,11 @@ def unstar_file(file_id: str) -> str:
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error unstarring file: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error unstarring file: {error_message}")
+        if status == 404:
             raise ToolError("File not found. Check the file ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have access to the file."
             )
@@ -1077,14 +1093,15 @@ def share_document(
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error sharing document: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error sharing document: {error_message}")
+        if status == 404:
             raise ToolError("Document not found. Check the document ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have permission to share this document."
             )
-        if "400" in error_message:
+        if status == 400:
             raise ToolError(
                 f"Invalid request: {error_message}. Check the email address and role."
             )
@@ -1131,10 +1148,11 @@ def list_permissions(document_id: str) -> str:
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error listing permissions: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error listing permissions: {error_message}")
+        if status == 404:
             raise ToolError("Document not found. Check the document ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have permission to view this document's permissions."
             )
@@ -1171,10 +1189,11 @@ def remove_permission(
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error removing permission: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error removing permission: {error_message}")
+        if status == 404:
             raise ToolError("Document or permission not found. Check the document ID and permission ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have permission to manage sharing for this document."
             )
@@ -1219,14 +1238,15 @@ def update_permission(
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error updating permission: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error updating permission: {error_message}")
+        if status == 404:
             raise ToolError("Document or permission not found. Check the document ID and permission ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 "Permission denied. Ensure you have permission to manage sharing for this document."
             )
-        if "400" in error_message:
+        if status == 400:
             raise ToolError(
                 f"Invalid request: {error_message}. Check the role value."
             )
@@ -4,26 +4,118 @@ Helper functions for Google Docs API operations.
 Ported from googleDocsApiHelpers.ts
 """
 
-from typing import Any
+import bisect
+import re
+import threading
+import time
+import urllib.request
+from typing import Any, Iterator
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlparse, urlsplit
 
 from fastmcp.exceptions import ToolError
+from googleapiclient.errors import HttpError
 
 from google_docs_mcp.types import (
     TextStyleArgs,
     ParagraphStyleArgs,
     TextRange,
     TabInfo,
+    TableInfo,
     hex_to_rgb_color,
     NotImplementedError,
 )
-from google_docs_mcp.utils import log
+from google_docs_mcp.utils import env_number, log, log_enabled, log_warning, log_error
 
 
 # --- Constants ---
 MAX_BATCH_UPDATE_REQUESTS = 50
 
+# Maximum number of calls Google accepts in one batch HTTP request
+MAX_BATCH_HTTP_REQUESTS = 100
+
+# Tabs can be nested at most three levels deep
+MAX_TAB_DEPTH = 3
+
+# Fields mask selecting just the text of a body, including text inside tables
+BODY_TEXT_FIELDS = (
+    "body(content(paragraph(elements(textRun(content))),"
+    "table(tableRows(tableCells(content(paragraph(elements(textRun(content)))))))))"
+)
+
+
+# Section break types supported by the Docs API
+SECTION_TYPES = frozenset({"CONTINUOUS", "NEXT_PAGE"})
+
+# Matches the file ID parameter in the query string of a Google Drive URL
+_DRIVE_FILE_ID_PATTERN = re.compile(r"(?:^|&)id=([^&]+)")
+
+
+# Fields mask with the text runs and element boundaries needed to search text
+# and locate paragraphs in a document body
+TEXT_SEARCH_FIELDS = (
+    "body(content(paragraph(elements(startIndex,endIndex,textRun(content))),"
+    "table,sectionBreak,tableOfContents,startIndex,endIndex))"
+)
+
+
+# --- Error Classification Helper ---
+def get_http_status(error: BaseException | None) -> int | None:
+    """
+    Get the HTTP status code of a failed API call.
+
+    Reads the status from the HttpError itself or, for errors re-raised
+    from one, from the HttpError in the exception's cause chain.
+
+    Args:
+        error: The exception raised by the API call
+
+    Returns:
+        HTTP status code, or None if no HttpError caused the failure
+    """
+    while error is not None:
+        if isinstance(error, HttpError):
+            return error.resp.status
+        error = error.__cause__
+    return None
+
 
 # --- Core Helper to Execute Batch Updates ---
+class _TokenBucket:
+    """Thread-safe token bucket that delays callers exceeding a request rate."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, sleeping until one is available. A rate of 0 disables limiting."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # Reserve the token now so concurrent callers queue up behind it
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Client-side limit on batchUpdate calls, so bursts of edits are spread out
+# instead of exhausting the per-minute write quota and failing with 429s
+_DOCS_WRITE_RATE_LIMIT = env_number("DOCS_WRITE_RATE_LIMIT", 5.0)
+_write_rate_limiter = _TokenBucket(
+    rate=_DOCS_WRITE_RATE_LIMIT, capacity=max(2 * _DOCS_WRITE_RATE_LIMIT, 1)
+)
+
+
 def execute_batch_update_sync(docs, document_id: str, requests: list[dict]) -> dict | None:
     """
     Execute a batch update request on a Google Document.
@@ -44,11 +136,13 @@ def execute_batch_update_sync(docs, document_id: str, requests: list[dict]) -> d
         return {}
 
     if len(requests) > MAX_BATCH_UPDATE_REQUESTS:
-        log(
+        log_warning(
             f"Attempting batch update with {len(requests)} requests, "
             f"exceeding typical limits. May fail."
         )
 
+    _write_rate_limiter.acquire()
+
     try:
         response = (
             docs.documents()
@@ -58,25 +152,31 @@ def execute_batch_update_sync(docs, document_id: str, requests: list[dict]) -> d
         return response
     except Exception as e:
         error_message = str(e)
-        log(f"Google API batchUpdate Error for doc {document_id}: {error_message}")
+        status = get_http_status(e)
+        log_error(f"Google API batchUpdate Error for doc {document_id}: {error_message}")
 
         # Handle common API errors
-        if "404" in error_message:
-            raise ToolError(f"Document not found (ID: {document_id}). Check the ID.")
-        if "403" in error_message:
+        if status == 404:
+            raise ToolError(f"Document not found (ID: {document_id}). Check the ID.") from e
+        if status == 403:
             raise ToolError(
                 f"Permission denied for document (ID: {document_id}). "
                 f"Ensure the authenticated user has edit access."
-            )
-        if "400" in error_message:
-            raise ToolError(f"Invalid request sent to Google Docs API: {error_message}")
+            ) from e
+        if status == 400:
+            raise ToolError(f"Invalid request sent to Google Docs API: {error_message}") from e
 
-        raise Exception(f"Google API Error: {error_message}")
+        raise Exception(f"Google API Error: {error_message}") from e
 
 
 # --- Text Finding Helper ---
 def find_text_range(
-    docs, document_id: str, text_to_find: str, instance: int = 1
+    docs,
+    document_id: str,
+    text_to_find: str,
+    instance: int = 1,
+    document: dict | None = None,
+    tab_id: str | None = None,
 ) -> TextRange | None:
     """
     Find a specific instance of text within a document.
@@ -86,6 +186,8 @@ def find_text_range(
         document_id: The document ID
         text_to_find: The text string to locate
         instance: Which instance to find (1-based)
+        document: Optional pre-fetched document data; skips fetching the document
+        tab_id: Optional tab ID to search within (only used with document)
 
     Returns:
         TextRange with start and end indices, or None if not found
@@ -94,17 +196,15 @@ def find_text_range(
         UserError: For permission/not found errors
     """
     try:
-        # Request detailed document structure
-        res = (
-            docs.documents()
-            .get(
-                documentId=document_id,
-                fields="body(content(paragraph(elements(startIndex,endIndex,textRun(content))),table,sectionBreak,tableOfContents,startIndex,endIndex))",
+        if document is None:
+            # Request detailed document structure
+            document = (
+                docs.documents()
+                .get(documentId=document_id, fields=TEXT_SEARCH_FIELDS)
+                .execute()
             )
-            .execute()
-        )
 
-        body = res.get("body", {})
+        body = get_body_from_document(document, tab_id) or {}
         content = body.get("content", [])
 
         if not content:
@@ -112,42 +212,39 @@ def find_text_range(
             return None
 
         # Collect text segments with their indices
-        full_text = ""
+        text_parts: list[str] = []
         segments: list[dict] = []
 
         def collect_text_from_content(content_list: list) -> None:
-            nonlocal full_text
-
             for element in content_list:
                 # Handle paragraph elements
-                paragraph = element.get("paragraph", {})
-                if paragraph.get("elements"):
-                    for pe in paragraph["elements"]:
-                        text_run = pe.get("textRun", {})
-                        if (
-                            text_run.get("content")
-                            and pe.get("startIndex") is not None
-                            and pe.get("endIndex") is not None
-                        ):
-                            text_content = text_run["content"]
-                            full_text += text_content
+                paragraph = element.get("paragraph")
+                if paragraph:
+                    for pe in paragraph.get("elements") or ():
+                        text_run = pe.get("textRun")
+                        if not text_run:
+                            continue
+                        text_content = text_run.get("content")
+                        start = pe.get("startIndex")
+                        end = pe.get("endIndex")
+                        if text_content and start is not None and end is not None:
+                            text_parts.append(text_content)
                             segments.append(
-                                {
-                                    "text": text_content,
-                                    "start": pe["startIndex"],
-                                    "end": pe["endIndex"],
-                                }
+                                {"text": text_content, "start": start, "end": end}
                             )
+                    continue
 
                 # Handle table elements
-                table = element.get("table", {})
-                if table.get("tableRows"):
-                    for row in table["tableRows"]:
-                        for cell in row.get("tableCells", []):
-                            if cell.get("content"):
-                                collect_text_from_content(cell["content"])
+                table = element.get("table")
+                if table:
+                    for row in table.get("tableRows") or ():
+                        for cell in row.get("tableCells") or ():
+                            cell_content = cell.get("content")
+                            if cell_content:
+                                collect_text_from_content(cell_content)
 
         collect_text_from_content(content)
+        full_text = "".join(text_parts)
 
         # Sort segments by starting position
         segments.sort(key=lambda x: x["start"])
@@ -157,6 +254,9 @@ def find_text_range(
             f"and {len(full_text)} characters in total."
         )
 
+        # Per-match logging is skipped entirely when logging is disabled
+        verbose = log_enabled()
+
         # Find the specified instance of the text
         start_index = -1
         end_index = -1
@@ -166,24 +266,27 @@ def find_text_range(
         while found_count < instance:
             current_index = full_text.find(text_to_find, search_start_index)
             if current_index == -1:
-                log(
-                    f'Search text "{text_to_find}" not found for instance '
-                    f"{found_count + 1} (requested: {instance})"
-                )
+                if verbose:
+                    log(
+                        f'Search text "{text_to_find}" not found for instance '
+                        f"{found_count + 1} (requested: {instance})"
+                    )
                 break
 
             found_count += 1
-            log(
-                f'Found instance {found_count} of "{text_to_find}" '
-                f"at position {current_index} in full text"
-            )
+            if verbose:
+                log(
+                    f'Found instance {found_count} of "{text_to_find}" '
+                    f"at position {current_index} in full text"
+                )
 
             if found_count == instance:
                 target_start = current_index
                 target_end = current_index + len(text_to_find)
                 current_pos = 0
 
-                log(f"Target text range in full text: {target_start}-{target_end}")
+                if verbose:
+                    log(f"Target text range in full text: {target_start}-{target_end}")
 
                 for seg in segments:
                     seg_start = current_pos
@@ -197,66 +300,74 @@ def find_text_range(
                         and target_start < seg_end
                     ):
                         start_index = seg["start"] + (target_start - seg_start)
-                        log(
-                            f"Mapped start to segment {seg['start']}-{seg['end']}, "
-                            f"position {start_index}"
-                        )
+                        if verbose:
+                            log(
+                                f"Mapped start to segment {seg['start']}-{seg['end']}, "
+                                f"position {start_index}"
+                            )
 
                     if target_end > seg_start and target_end <= seg_end:
                         end_index = seg["start"] + (target_end - seg_start)
-                        log(
-                            f"Mapped end to segment {seg['start']}-{seg['end']}, "
-                            f"position {end_index}"
-                        )
+                        if verbose:
+                            log(
+                                f"Mapped end to segment {seg['start']}-{seg['end']}, "
+                                f"position {end_index}"
+                            )
                         break
 
                     current_pos = seg_end
 
                 if start_index == -1 or end_index == -1:
-                    log(
-                        f'Failed to map text "{text_to_find}" instance {instance} '
-                        f"to actual document indices"
-                    )
+                    if verbose:
+                        log(
+                            f'Failed to map text "{text_to_find}" instance {instance} '
+                            f"to actual document indices"
+                        )
                     start_index = -1
                     end_index = -1
                     search_start_index = current_index + 1
                     found_count -= 1
                     continue
 
-                log(
-                    f'Successfully mapped "{text_to_find}" to document range '
-                    f"{start_index}-{end_index}"
-                )
+                if verbose:
+                    log(
+                        f'Successfully mapped "{text_to_find}" to document range '
+                        f"{start_index}-{end_index}"
+                    )
                 return TextRange(start_index=start_index, end_index=end_index)
 
             # Prepare for next search iteration
             search_start_index = current_index + 1
 
-        log(
-            f'Could not find instance {instance} of text "{text_to_find}" '
-            f"in document {document_id}"
-        )
+        if verbose:
+            log(
+                f'Could not find instance {instance} of text "{text_to_find}" '
+                f"in document {document_id}"
+            )
         return None
 
+    except ToolError:
+        raise
     except Exception as e:
         error_message = str(e)
-        log(
+        status = get_http_status(e)
+        log_error(
             f'Error finding text "{text_to_find}" in doc {document_id}: {error_message}'
         )
-        if "404" in error_message:
+        if status == 404:
             raise ToolError(
                 f"Document not found while searching text (ID: {document_id})."
             )
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 f"Permission denied while searching text in doc {document_id}."
             )
-        raise Exception(f"Failed to retrieve doc for text searching: {error_message}")
+        raise Exception(f"Failed to retrieve doc for text searching: {error_message}") from e
 
 
 # --- Paragraph Boundary Helper ---
 def get_paragraph_range(
-    docs, document_id: str, index_within: int
+    docs, document_id: str, index_within: int, document: dict | None = None
 ) -> TextRange | None:
     """
     Find the paragraph boundaries containing a specific index.
@@ -265,6 +376,7 @@ def get_paragraph_range(
         docs: Google Docs API client
         document_id: The document ID
         index_within: An index within the target paragraph
+        document: Optional pre-fetched document data; skips fetching the document
 
     Returns:
         TextRange with paragraph start and end indices, or None if not found
@@ -272,6 +384,9 @@ def get_paragraph_range(
     Raises:
         UserError: For permission/not found errors
     """
+    if document is not None:
+        return get_paragraph_range_from_document(document, index_within)
+
     try:
         log(f"Finding paragraph containing index {index_within} in document {document_id}")
 
@@ -343,19 +458,51 @@ def get_paragraph_range(
 
     except Exception as e:
         error_message = str(e)
-        log(
+        status = get_http_status(e)
+        log_error(
             f"Error getting paragraph range for index {index_within} "
             f"in doc {document_id}: {error_message}"
         )
-        if "404" in error_message:
+        if status == 404:
             raise ToolError(
                 f"Document not found while finding paragraph (ID: {document_id})."
             )
-        if "403" in error_message:
+        if status == 403:
             raise ToolError(
                 f"Permission denied while accessing doc {document_id}."
             )
-        raise Exception(f"Failed to find paragraph: {error_message}")
+        raise Exception(f"Failed to find paragraph: {error_message}") from e
+
+
+def get_body_from_document(document: dict, tab_id: str | None = None) -> dict | None:
+    """
+    Get the body from pre-fetched document data, with or without tabs content.
+
+    Args:
+        document: The document data dict (from docs.documents().get())
+        tab_id: Optional tab ID to take the body from, searching child tabs too
+            (uses the first tab if not specified)
+
+    Returns:
+        The Body object, or None if the document has none
+
+    Raises:
+        ToolError: If tab_id is given but no such tab exists in the document
+    """
+    tabs = document.get("tabs", [])
+
+    if not tabs:
+        # Legacy document structure without tabs
+        return document.get("body", {})
+
+    # Document has tabs structure
+    if tab_id:
+        tab = find_tab_by_id(document, tab_id)
+        if tab is None:
+            raise ToolError(f'Tab with ID "{tab_id}" not found in document.')
+    else:
+        tab = tabs[0]
+    return tab.get("documentTab", {}).get("body", {})
 
 
 def get_paragraph_range_from_document(
@@ -374,28 +521,13 @@ def get_paragraph_range_from_document(
 
     Returns:
         TextRange with paragraph start and end indices, or None if not found
+
+    Raises:
+        ToolError: If tab_id is given but no such tab exists in the document
     """
     log(f"Finding paragraph containing index {index_within} in document data")
 
-    # Get the body content - handle both tab-based and direct body structure
-    body = None
-    tabs = document.get("tabs", [])
-
-    if tabs:
-        # Document has tabs structure
-        if tab_id:
-            # Find the specific tab
-            for tab in tabs:
-                tab_props = tab.get("tabProperties", {})
-                if tab_props.get("tabId") == tab_id:
-                    body = tab.get("documentTab", {}).get("body", {})
-                    break
-        if not body and tabs:
-            # Use first tab
-            body = tabs[0].get("documentTab", {}).get("body", {})
-    else:
-        # Legacy document structure without tabs
-        body = document.get("body", {})
+    body = get_body_from_document(document, tab_id)
 
     if not body:
         log("No body content found in document data")
@@ -407,6 +539,8 @@ def get_paragraph_range_from_document(
         log("No content found in document body")
         return None
 
+    verbose = log_enabled()
+
     def find_paragraph_in_content(content_list: list) -> TextRange | None:
         for element in content_list:
             start_idx = element.get("startIndex")
@@ -418,17 +552,19 @@ def get_paragraph_range_from_document(
                     # Use "in" check because element.get("paragraph") returns {}
                     # which is falsy even when the key exists
                     if "paragraph" in element:
-                        log(
-                            f"Found paragraph containing index {index_within}, "
-                            f"range: {start_idx}-{end_idx}"
-                        )
+                        if verbose:
+                            log(
+                                f"Found paragraph containing index {index_within}, "
+                                f"range: {start_idx}-{end_idx}"
+                            )
                         return TextRange(start_index=start_idx, end_index=end_idx)
 
                     # If it's a table, search cells recursively
                     if "table" in element:
                         table = element["table"]
                         if table.get("tableRows"):
-                            log(f"Index {index_within} is within a table, searching cells...")
+                            if verbose:
+                                log(f"Index {index_within} is within a table, searching cells...")
                             for row in table["tableRows"]:
                                 for cell in row.get("tableCells", []):
                                     if cell.get("content"):
@@ -436,10 +572,11 @@ def get_paragraph_range_from_document(
                                         if result:
                                             return result
 
-                    log(
-                        f"Index {index_within} is within element "
-                        f"({start_idx}-{end_idx}) but not in a paragraph"
-                    )
+                    if verbose:
+                        log(
+                            f"Index {index_within} is within element "
+                            f"({start_idx}-{end_idx}) but not in a paragraph"
+                        )
 
         return None
 
@@ -453,6 +590,60 @@ def get_paragraph_range_from_document(
     return result
 
 
+def build_paragraph_index(body: dict) -> tuple[list[int], list[TextRange]]:
+    """
+    Index the paragraphs of a body, including those inside table cells, by position.
+
+    Paragraphs never overlap, so sorting them by start index lets
+    find_paragraph_in_index locate one with a binary search. Build the index
+    once when looking up many positions in the same body.
+
+    Args:
+        body: A document or tab body dict
+
+    Returns:
+        Tuple of (sorted paragraph start indices, matching paragraph ranges)
+    """
+    ranges: list[TextRange] = []
+
+    def collect(content_list: list) -> None:
+        for element in content_list:
+            start_idx = element.get("startIndex")
+            end_idx = element.get("endIndex")
+            if start_idx is None or end_idx is None:
+                continue
+            if "paragraph" in element:
+                ranges.append(TextRange(start_index=start_idx, end_index=end_idx))
+            elif "table" in element:
+                for row in element["table"].get("tableRows", []):
+                    for cell in row.get("tableCells", []):
+                        collect(cell.get("content", []))
+
+    collect(body.get("content", []))
+    ranges.sort(key=lambda r: r.start_index)
+    return [r.start_index for r in ranges], ranges
+
+
+def find_paragraph_in_index(
+    paragraph_index: tuple[list[int], list[TextRange]], index_within: int
+) -> TextRange | None:
+    """
+    Find the paragraph containing an index using an index from build_paragraph_index.
+
+    Args:
+        paragraph_index: The (starts, ranges) tuple from build_paragraph_index
+        index_within: An index within the target paragraph
+
+    Returns:
+        TextRange of the containing paragraph, or None if no paragraph contains it
+    """
+    starts, ranges = paragraph_index
+    position = bisect.bisect_right(starts, index_within) - 1
+    if position >= 0 and index_within < ranges[position].end_index:
+        return ranges[position]
+    return None
+
+
 # --- Style Request Builders ---
 def build_update_text_style_request(
     start_index: int, end_index: int, style: TextStyleArgs
@@ -665,6 +856,23 @@ def insert_text(docs, document_id: str, text: str, index: int) -> dict | None:
     return execute_batch_update_sync(docs, document_id, [request])
 
 
+def get_drive_file_id(image_url: str) -> str | None:
+    """
+    Extract the file ID from a Google Drive URL such as .../uc?export=download&id=<ID>.
+
+    Args:
+        image_url: The URL to inspect
+
+    Returns:
+        The Drive file ID, or None if the URL is not a Drive URL with an id parameter
+    """
+    parts = urlsplit(image_url)
+    if parts.hostname != "drive.google.com":
+        return None
+    match = _DRIVE_FILE_ID_PATTERN.search(parts.query)
+    return match.group(1) if match else None
+
+
 def _validate_image_url(image_url: str) -> None:
     """
     Validate that an image URL is accessible before sending to Google Docs API.
@@ -675,10 +883,6 @@ def _validate_image_url(image_url: str) -> None:
     Raises:
         ToolError: If the URL is invalid or inaccessible
     """
-    import urllib.request
-    from urllib.parse import urlparse
-    from urllib.error import HTTPError, URLError
-
     # Validate URL format
     try:
         result = urlparse(image_url)
@@ -694,10 +898,8 @@ def _validate_image_url(image_url: str) -> None:
         # For Drive URLs with the /uc endpoint, convert to download format
         if '/uc' in image_url:
             # Extract file ID and create proper download URL
-            import re
-            file_id_match = re.search(r'[?&]id=([^&]+)', image_url)
-            if file_id_match:
-                file_id = file_id_match.group(1)
+            file_id = get_drive_file_id(image_url)
+            if file_id:
                 # Return the download URL format that works with Google Docs
                 suggested_url = f"https://drive.google.com/uc?export=download&id={file_id}"
                 if 'export=download' not in image_url:
@@ -792,34 +994,30 @@ def insert_inline_image(
     _validate_image_url(image_url)
 
     # If this is a Google Drive URL, ensure it has public permissions
-    if 'drive.google.com' in image_url:
-        import re
+    file_id = get_drive_file_id(image_url)
+    if file_id:
         from google_docs_mcp.auth import get_drive_client
 
-        # Extract file ID from various Drive URL formats
-        file_id_match = re.search(r'[?&]id=([^&]+)', image_url)
-        if file_id_match:
-            file_id = file_id_match.group(1)
-            log(f"Setting public permissions for Google Drive file {file_id}")
-
-            try:
-                drive = get_drive_client()
-                # Make the file publicly readable so Google Docs can access it
-                permission = {
-                    "type": "anyone",
-                    "role": "reader"
-                }
-                drive.permissions().create(
-                    fileId=file_id,
-                    body=permission
-                ).execute()
-                log(f"Successfully set public permissions for Drive file {file_id}")
-            except Exception as e:
-                log(f"Warning: Could not set public permissions for Drive file {file_id}: {e}")
-                raise ToolError(
-                    f"Failed to set public permissions on Google Drive file {file_id}. "
-                    "Please ensure the file is publicly accessible or share it with 'Anyone with the link'."
-                )
+        log(f"Setting public permissions for Google Drive file {file_id}")
+
+        try:
+            drive = get_drive_client()
+            # Make the file publicly readable so Google Docs can access it
+            permission = {
+                "type": "anyone",
+                "role": "reader"
+            }
+            drive.permissions().create(
+                fileId=file_id,
+                body=permission
+            ).execute()
+            log(f"Successfully set public permissions for Drive file {file_id}")
+        except Exception as e:
+            log_warning(f"Could not set public permissions for Drive file {file_id}: {e}")
+            raise ToolError(
+                f"Failed to set public permissions on Google Drive file {file_id}. "
+                "Please ensure the file is publicly accessible or share it with 'Anyone with the link'."
+            )
 
     request: dict[str, Any] = {
         "insertInlineImage": {"location": {"index": index}, "uri": image_url}
@@ -878,6 +1076,34 @@ def get_all_tabs(doc: dict) -> list[TabInfo]:
     return all_tabs
 
 
+def iter_text_runs(body: dict) -> Iterator[str]:
+    """
+    Yield the text of every text run in a body, including text inside tables.
+
+    Args:
+        body: A Body object (document or tab body)
+
+    Yields:
+        Non-empty text run contents in document order
+    """
+    for element in body.get("content") or ():
+        if "paragraph" in element:
+            for pe in element["paragraph"].get("elements") or ():
+                content = (pe.get("textRun") or {}).get("content")
+                if content:
+                    yield content
+        elif "table" in element:
+            for row in element["table"].get("tableRows") or ():
+                for cell in row.get("tableCells") or ():
+                    for cell_element in cell.get("content") or ():
+                        if "paragraph" not in cell_element:
+                            continue
+                        for pe in cell_element["paragraph"].get("elements") or ():
+                            content = (pe.get("textRun") or {}).get("content")
+                            if content:
+                                yield content
+
+
 def get_tab_text_length(document_tab: dict) -> int:
     """
     Get the text length from a DocumentTab.
@@ -888,32 +1114,23 @@ def get_tab_text_length(document_tab: dict) -> int:
     Returns:
         Total character count
     """
-    total_length = 0
-    body = document_tab.get("body", {})
-    content = body.get("content", [])
+    return sum(map(len, iter_text_runs(document_tab.get("body") or {})))
 
-    for element in content:
-        # Handle paragraphs
-        paragraph = element.get("paragraph", {})
-        if paragraph.get("elements"):
-            for pe in paragraph["elements"]:
-                text_run = pe.get("textRun", {})
-                if text_run.get("content"):
-                    total_length += len(text_run["content"])
-
-        # Handle tables
-        table = element.get("table", {})
-        if table.get("tableRows"):
-            for row in table["tableRows"]:
-                for cell in row.get("tableCells", []):
-                    for cell_element in cell.get("content", []):
-                        cell_paragraph = cell_element.get("paragraph", {})
-                        for pe in cell_paragraph.get("elements", []):
-                            text_run = pe.get("textRun", {})
-                            if text_run.get("content"):
-                                total_length += len(text_run["content"])
-
-    return total_length
+
+def build_tabs_fields(tab_fields: str) -> str:
+    """
+    Build a fields mask selecting tab_fields from every tab, including child tabs.
+
+    Args:
+        tab_fields: Fields to select from each Tab (e.g. "tabProperties")
+
+    Returns:
+        Fields mask for documents.get with includeTabsContent=True
+    """
+    mask = tab_fields
+    for _ in range(MAX_TAB_DEPTH - 1):
+        mask = f"{tab_fields},childTabs({mask})"
+    return f"tabs({mask})"
 
 
 def find_tab_by_id(doc: dict, tab_id: str) -> dict | None:
@@ -1086,8 +1303,6 @@ def find_table_at_index(docs, document_id: str, search_index: int) -> Any:
     Raises:
         ToolError: For API errors
     """
-    from google_docs_mcp.types import TableInfo
-
     try:
         # Fetch document structure with minimal fields
         res = (
@@ -1122,7 +1337,7 @@ def find_table_at_index(docs, document_id: str, search_index: int) -> Any:
 
     except Exception as e:
         error_message = str(e)
-        log(f"Error finding table at index {search_index}: {error_message}")
+        log_error(f"Error finding table at index {search_index}: {error_message}")
         raise ToolError(f"Failed to find table: {error_message}")
 
 
@@ -1366,7 +1581,15 @@ def build_merge_table_cells_request(
 
     Returns:
         Request dictionary for Google Docs API
+
+    Raises:
+        ToolError: If the merge range spans no rows or columns
     """
+    if row_span < 1 or column_span < 1:
+        raise ToolError(
+            f"Merge range must span at least 1 row and 1 column (got {row_span}x{column_span})."
+        )
+
     return {
         "mergeTableCells": {
             "tableRange": {
@@ -1422,7 +1645,15 @@ def build_create_named_range_request(
 
     Returns:
         Request dictionary for Google Docs API
+
+    Raises:
+        ToolError: If the range is empty
     """
+    if end_index <= start_index:
+        raise ToolError(
+            f"Named range end_index ({end_index}) must be greater than start_index ({start_index})."
+        )
+
     request: dict[str, Any] = {
         "createNamedRange": {
             "name": name,
@@ -1501,11 +1732,21 @@ def build_insert_section_break_request(index: int, section_type: str = "CONTINUO
 
     Args:
         index: Index where to insert section break (1-based)
-        section_type: Type of section break (CONTINUOUS, NEXT_PAGE, etc.)
+        section_type: Type of section break (CONTINUOUS or NEXT_PAGE)
 
     Returns:
         Request dictionary for Google Docs API
+
+    Raises:
+        ToolError: If the index or section type is invalid
     """
+    if index < 1:
+        raise ToolError(f"Section break index must be at least 1 (got {index}).")
+    if section_type not in SECTION_TYPES:
+        raise ToolError(
+            f"Invalid section_type '{section_type}'. Use one of: {', '.join(sorted(SECTION_TYPES))}."
+        )
+
     return {
         "insertSectionBreak": {
             "location": {"index": index},
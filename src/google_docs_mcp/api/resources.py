@@ -13,8 +13,9 @@ from fastmcp.exceptions import ToolError
 from googleapiclient.http import MediaFileUpload
 from mcp_mapped_resource_lib import BlobStorage
 
-from google_docs_mcp.auth import get_drive_client
-from google_docs_mcp.utils import log
+from google_docs_mcp.api import helpers
+from google_docs_mcp.auth import get_docs_client, get_drive_client
+from google_docs_mcp.utils import log, log_error
 
 
 def _get_blob_storage() -> BlobStorage:
@@ -156,10 +157,11 @@ def upload_image_to_drive_from_resource(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error uploading image from resource: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error uploading image from resource: {error_message}")
+        if status == 404:
             raise ToolError("Parent folder not found. Check the parent folder ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError("Permission denied. Make sure you have write access to Drive.")
         raise ToolError(f"Failed to upload image from resource: {error_message}")
 
@@ -251,10 +253,11 @@ def upload_file_to_drive_from_resource(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error uploading file from resource: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error uploading file from resource: {error_message}")
+        if status == 404:
             raise ToolError("Parent folder not found. Check the parent folder ID.")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError("Permission denied. Make sure you have write access to Drive.")
         raise ToolError(f"Failed to upload file from resource: {error_message}")
 
@@ -284,8 +287,6 @@ def insert_image_from_resource(
     Raises:
         ToolError: For permission, upload, or resource not found errors
     """
-    from google_docs_mcp.auth import get_docs_client
-
     docs = get_docs_client()
     drive = get_drive_client()
     storage = _get_blob_storage()
@@ -387,9 +388,10 @@ def insert_image_from_resource(
         raise
     except Exception as e:
         error_message = str(e)
-        log(f"Error inserting image from resource: {error_message}")
-        if "404" in error_message:
+        status = helpers.get_http_status(e)
+        log_error(f"Error inserting image from resource: {error_message}")
+        if status == 404:
             raise ToolError(f"Document not found (ID: {document_id}).")
-        if "403" in error_message:
+        if status == 403:
             raise ToolError("Permission denied. Make sure you have access to this document.")
         raise ToolError(f"Failed to insert image from resource: {error_message}")
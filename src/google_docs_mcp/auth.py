@@ -8,6 +8,7 @@ Supports two authentication methods:
 
 import json
 import os
+import threading
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
@@ -16,9 +17,12 @@ from google.oauth2.credentials import Credentials
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, build_http
 
-from google_docs_mcp.utils import log
+from google_docs_mcp.utils import log, log_warning, log_error
 from google_docs_mcp.utils.docker import discover_oauth_port
 
 # Scopes required for Google Docs and Drive access
@@ -131,9 +135,9 @@ def _wait_for_auth_code(port: int, timeout: int = 300) -> str:
     server.timeout = timeout
 
     oauth_port = get_oauth_port()
-    log(f"Listening for OAuth callback on http://localhost:{oauth_port}")
+    log_warning(f"Listening for OAuth callback on http://localhost:{oauth_port}")
     if oauth_port != port:
-        log(f"(Container port {port} mapped to host port {oauth_port})")
+        log_warning(f"(Container port {port} mapped to host port {oauth_port})")
 
     # Use a simple loop with timeout
     server.handle_request()
@@ -174,7 +178,7 @@ def _authorize_with_service_account() -> ServiceAccountCredentials:
         log("Service Account authentication successful!")
         return credentials
     except Exception as e:
-        log(f"Error loading service account key: {e}")
+        log_error(f"Error loading service account key: {e}")
         raise Exception(
             "Failed to authorize using the service account. "
             "Ensure the key file is valid and the path is correct."
@@ -201,7 +205,7 @@ def _load_saved_credentials() -> Credentials | None:
             return credentials
         return None
     except Exception as e:
-        log(f"Error loading saved credentials: {e}")
+        log_error(f"Error loading saved credentials: {e}")
         return None
 
 
@@ -217,7 +221,7 @@ def _save_credentials(credentials: Credentials) -> None:
             f.write(credentials.to_json())
         log(f"Token stored to {TOKEN_PATH}")
     except Exception as e:
-        log(f"Error saving credentials: {e}")
+        log_error(f"Error saving credentials: {e}")
 
 
 def _load_client_secrets() -> dict:
@@ -272,10 +276,10 @@ def _authenticate() -> Credentials:
         access_type="offline", include_granted_scopes="true"
     )
 
-    log("\n" + "=" * 60)
-    log("Authorize this app by visiting this URL in your browser:")
-    log("\n" + auth_url + "\n")
-    log("=" * 60 + "\n")
+    log_warning("\n" + "=" * 60)
+    log_warning("Authorize this app by visiting this URL in your browser:")
+    log_warning("\n" + auth_url + "\n")
+    log_warning("=" * 60 + "\n")
 
     # Wait for callback
     code = _wait_for_auth_code(_CONTAINER_PORT)
@@ -287,11 +291,11 @@ def _authenticate() -> Credentials:
         if credentials.refresh_token:
             _save_credentials(credentials)
         else:
-            log("Did not receive refresh token. Token might expire.")
+            log_warning("Did not receive refresh token. Token might expire.")
         log("Authentication successful!")
         return credentials
     except Exception as e:
-        log(f"Error retrieving access token: {e}")
+        log_error(f"Error retrieving access token: {e}")
         raise Exception("Authentication failed")
 
 
@@ -317,58 +321,151 @@ def authorize() -> Credentials | ServiceAccountCredentials:
         return _authenticate()
 
 
-# Global clients (initialized lazily)
+# Global credentials (initialized lazily)
 _auth_client = None
-_docs_client = None
-_drive_client = None
+_auth_lock = threading.Lock()
+
+# Per-thread transport and clients. httplib2 transports are not thread-safe,
+# so each worker thread running API calls gets its own transport and clients.
+_thread_clients = threading.local()
+
+
+def _get_authorized_http() -> AuthorizedHttp:
+    """
+    Get the authorized HTTP transport for the current thread.
+
+    The transport is shared by the Docs and Drive clients of the thread so
+    that keep-alive connections are reused across API calls. Credentials are
+    shared process-wide.
+
+    Returns:
+        Authorized httplib2 transport
+    """
+    http = getattr(_thread_clients, "http", None)
+
+    if http is None:
+        http = AuthorizedHttp(get_auth_client(), http=build_http())
+        _thread_clients.http = http
+
+    return http
+
+
+# Times a request is retried, with randomized exponential backoff, after a
+# 429, 5xx or rate-limit 403 response before the error is raised
+API_NUM_RETRIES = 4
+
+# Methods that can be safely repeated after a lost or failed response
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def _is_rate_limited(error: HttpError) -> bool:
+    """Check whether an API error is a rate-limit rejection."""
+    status = error.resp.status
+    return status == 429 or (
+        status == 403 and b"ratelimitexceeded" in (error.content or b"").lower()
+    )
+
+
+class _RetryingHttpRequest(HttpRequest):
+    """
+    HttpRequest that retries transient failures unless told otherwise.
+
+    Idempotent requests retry 5xx responses and connection errors as well as
+    rate limiting. Writes such as batchUpdate or comment creation may already
+    have been applied when their response is lost or a 5xx comes back, so
+    they are retried only after a rate-limit rejection.
+    """
+
+    def execute(self, http=None, num_retries=API_NUM_RETRIES):
+        if self.method.upper() in _IDEMPOTENT_METHODS:
+            return super().execute(http=http, num_retries=num_retries)
+
+        for retry_num in range(num_retries + 1):
+            try:
+                return super().execute(http=http, num_retries=0)
+            except HttpError as e:
+                if retry_num == num_retries or not _is_rate_limited(e):
+                    raise
+                delay = self._rand() * 2 ** (retry_num + 1)
+                log_warning(
+                    "Rate limited on %s %s, retry %d of %d in %.1fs",
+                    self.method,
+                    self.uri,
+                    retry_num + 1,
+                    num_retries,
+                    delay,
+                )
+                self._sleep(delay)
+
+
+def _build_client(service_name: str, version: str):
+    """
+    Build a Google API client resource for the authorized credentials.
+
+    Uses the discovery documents bundled with google-api-python-client, so
+    building a client never fetches the discovery document over the network.
+    The discovery file cache is disabled since it is only used for
+    dynamically fetched documents. Requests from the client retry transient
+    failures (see API_NUM_RETRIES and _RetryingHttpRequest) without any
+    change at the call sites.
+
+    Args:
+        service_name: API service name (e.g. "docs", "drive")
+        version: API version (e.g. "v1", "v3")
+
+    Returns:
+        Google API client resource
+    """
+    return build(
+        service_name,
+        version,
+        http=_get_authorized_http(),
+        static_discovery=True,
+        cache_discovery=False,
+        requestBuilder=_RetryingHttpRequest,
+    )
 
 
 def get_docs_client():
     """
     Get the Google Docs API client.
 
+    The client is built once per thread and reused for subsequent calls.
+
     Returns:
         Google Docs API client resource
 
     Raises:
         Exception: If initialization fails
     """
-    global _auth_client, _docs_client
+    client = getattr(_thread_clients, "docs", None)
 
-    if _docs_client is not None:
-        return _docs_client
+    if client is None:
+        client = _build_client("docs", "v1")
+        _thread_clients.docs = client
 
-    if _auth_client is None:
-        log("Attempting to authorize Google API client...")
-        _auth_client = authorize()
-        log("Google API client authorized successfully.")
-
-    _docs_client = build("docs", "v1", credentials=_auth_client)
-    return _docs_client
+    return client
 
 
 def get_drive_client():
     """
     Get the Google Drive API client.
 
+    The client is built once per thread and reused for subsequent calls.
+
     Returns:
         Google Drive API client resource
 
     Raises:
         Exception: If initialization fails
     """
-    global _auth_client, _drive_client
+    client = getattr(_thread_clients, "drive", None)
 
-    if _drive_client is not None:
-        return _drive_client
-
-    if _auth_client is None:
-        log("Attempting to authorize Google API client...")
-        _auth_client = authorize()
-        log("Google API client authorized successfully.")
+    if client is None:
+        client = _build_client("drive", "v3")
+        _thread_clients.drive = client
 
-    _drive_client = build("drive", "v3", credentials=_auth_client)
-    return _drive_client
+    return client
 
 
 def get_auth_client():
@@ -381,6 +478,12 @@ def get_auth_client():
     global _auth_client
 
     if _auth_client is None:
-        _auth_client = authorize()
+        # Serialize authorization so concurrent first calls from worker
+        # threads do not start more than one OAuth flow.
+        with _auth_lock:
+            if _auth_client is None:
+                log("Attempting to authorize Google API client...")
+                _auth_client = authorize()
+                log("Google API client authorized successfully.")
 
     return _auth_client
@@ -8,6 +8,9 @@ IMPORTANT: All logging must use stderr, never stdout.
 The MCP protocol uses stdout for JSON-RPC communication.
 """
 
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated
 
 from fastmcp import FastMCP
@@ -15,7 +18,7 @@ from mcp.types import ImageContent
 
 from google_docs_mcp.types import TextStyleArgs, ParagraphStyleArgs
 from google_docs_mcp.api import documents, comments, drive, resources
-from google_docs_mcp.utils import log
+from google_docs_mcp.utils import env_number, log
 
 
 # Create MCP server
@@ -39,6 +42,20 @@ mcp = FastMCP(
 )
 
 
+# Worker threads for blocking Google API calls. Each worker keeps its own HTTP
+# connection, so this also bounds the number of concurrent API connections.
+_API_MAX_WORKERS = env_number("API_MAX_WORKERS", 50, minimum=1, cast=int)
+_api_executor = ThreadPoolExecutor(
+    max_workers=_API_MAX_WORKERS, thread_name_prefix="google-api"
+)
+
+
+async def _run_blocking(func, /, *args, **kwargs):
+    """Run a blocking API call on the API worker pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_api_executor, functools.partial(func, *args, **kwargs))
+
+
 # === DOCUMENT TOOLS ===
 
 
@@ -371,35 +388,56 @@ Example:
 
 
 # === COMMENT TOOLS ===
+#
+# Comment tools are async and run the blocking Drive API calls in worker
+# threads, so concurrent comment requests do not block the event loop.
 
 
 @mcp.tool(annotations={"readOnlyHint": True})
-def list_comments(
+async def list_comments(
     document_id: Annotated[str, "The ID of the Google Document"],
 ) -> str:
     """
     List all comments in a Google Document.
     """
-    return comments.list_comments(document_id)
+    return await _run_blocking(comments.list_comments, document_id)
 
 
 @mcp.tool(annotations={"readOnlyHint": True})
-def get_comment(
+async def get_comment(
     document_id: Annotated[str, "The ID of the Google Document"],
     comment_id: Annotated[str, "The ID of the comment to retrieve"],
 ) -> str:
     """
     Get a specific comment with its full thread of replies.
     """
-    return comments.get_comment(document_id, comment_id)
+    return await _run_blocking(comments.get_comment, document_id, comment_id)
+
+
+@mcp.tool(annotations={"readOnlyHint": True})
+async def get_comments(
+    document_id: Annotated[str, "The ID of the Google Document"],
+    comment_ids: Annotated[list[str], "The IDs of the comments to retrieve"],
+) -> str:
+    """
+    Get several comments with their full reply threads in one batched request.
+
+    Prefer this over repeated get_comment calls when expanding many threads.
+    """
+    return await _run_blocking(comments.get_comments, document_id, comment_ids)
 
 
 @mcp.tool()
-def add_comment(
+async def add_comment(
     document_id: Annotated[str, "The ID of the Google Document"],
     start_index: Annotated[int, "Starting index of the text range (inclusive, 1-based)"],
     end_index: Annotated[int, "Ending index of the text range (exclusive)"],
     comment_text: Annotated[str, "The content of the comment"],
+    quoted_text: Annotated[
+        str | None,
+        "Text the comment quotes. Omit to read it from the document (one extra request); "
+        "pass an empty string to skip the quote.",
+    ] = None,
 ) -> str:
     """
     Add a comment anchored to a specific text range in the document.
@@ -407,11 +445,30 @@ def add_comment(
     NOTE: Due to Google API limitations, comments created programmatically
     appear in the 'All Comments' list but may not be visibly anchored in the UI.
     """
-    return comments.add_comment(document_id, start_index, end_index, comment_text)
+    return await _run_blocking(
+        comments.add_comment, document_id, start_index, end_index, comment_text, quoted_text
+    )
+
+
+@mcp.tool()
+async def add_comments(
+    document_id: Annotated[str, "The ID of the Google Document"],
+    new_comments: Annotated[
+        list[dict],
+        "Comments to add, each with 'start_index', 'end_index' and 'comment_text', "
+        "and optionally 'quoted_text' (as in add_comment)",
+    ],
+) -> str:
+    """
+    Add several comments anchored to text ranges in one batched request.
+
+    Prefer this over repeated add_comment calls when commenting on many ranges.
+    """
+    return await _run_blocking(comments.add_comments, document_id, new_comments)
 
 
 @mcp.tool()
-def reply_to_comment(
+async def reply_to_comment(
     document_id: Annotated[str, "The ID of the Google Document"],
     comment_id: Annotated[str, "The ID of the comment to reply to"],
     reply_text: Annotated[str, "The content of the reply"],
@@ -419,11 +476,11 @@ def reply_to_comment(
     """
     Add a reply to an existing comment.
     """
-    return comments.reply_to_comment(document_id, comment_id, reply_text)
+    return await _run_blocking(comments.reply_to_comment, document_id, comment_id, reply_text)
 
 
 @mcp.tool()
-def resolve_comment(
+async def resolve_comment(
     document_id: Annotated[str, "The ID of the Google Document"],
     comment_id: Annotated[str, "The ID of the comment to resolve"],
 ) -> str:
@@ -433,18 +490,18 @@ def resolve_comment(
     NOTE: Due to Google API limitations, the resolved status may not persist
     in the Google Docs UI for all document types.
     """
-    return comments.resolve_comment(document_id, comment_id)
+    return await _run_blocking(comments.resolve_comment, document_id, comment_id)
 
 
 @mcp.tool(annotations={"destructiveHint": True})
-def delete_comment(
+async def delete_comment(
     document_id: Annotated[str, "The ID of the Google Document"],
     comment_id: Annotated[str, "The ID of the comment to delete"],
 ) -> str:
     """
     Delete a comment from a document.
     """
-    return comments.delete_comment(document_id, comment_id)
+    return await _run_blocking(comments.delete_comment, document_id, comment_id)
 
 
 # === GOOGLE DRIVE TOOLS ===
@@ -939,7 +996,7 @@ def insert_section_break(
     index: Annotated[int, "Index where to insert section break (1-based)"],
     section_type: Annotated[
         str,
-        "Type of section break: 'CONTINUOUS', 'NEXT_PAGE', 'EVEN_PAGE', 'ODD_PAGE'"
+        "Type of section break: 'CONTINUOUS' or 'NEXT_PAGE'"
     ] = "CONTINUOUS",
 ) -> str:
     """
@@ -948,8 +1005,6 @@ def insert_section_break(
     Section breaks allow different page layouts in different sections of the document.
     - CONTINUOUS: New section on same page
     - NEXT_PAGE: New section on next page
-    - EVEN_PAGE: New section on next even page
-    - ODD_PAGE: New section on next odd page
     """
     return documents.insert_section_break(document_id, index, section_type)
 
@@ -4,7 +4,6 @@ Type definitions and utilities for Google Docs MCP Server.
 
 import re
 from dataclasses import dataclass, field
-from typing import TypedDict
 
 # --- Hex Color Regex ---
 HEX_COLOR_REGEX = re.compile(r"^#?([0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})$")
@@ -50,7 +49,7 @@ def hex_to_rgb_color(hex_color: str) -> dict[str, float] | None:
 
 
 # --- Text Style Arguments ---
-@dataclass
+@dataclass(slots=True)
 class TextStyleArgs:
     """Arguments for text styling operations."""
 
@@ -66,7 +65,7 @@ class TextStyleArgs:
 
 
 # --- Paragraph Style Arguments ---
-@dataclass
+@dataclass(slots=True)
 class ParagraphStyleArgs:
     """Arguments for paragraph styling operations."""
 
@@ -80,7 +79,7 @@ class ParagraphStyleArgs:
 
 
 # --- Response Types ---
-@dataclass
+@dataclass(slots=True)
 class TextRange:
     """Represents a range of text in a document."""
 
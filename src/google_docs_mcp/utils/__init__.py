@@ -2,13 +2,112 @@
 Google Docs MCP Server utility modules.
 """
 
+import atexit
+import logging
+import logging.handlers
+import math
+import os
+import queue
 import sys
+import threading
 
+_logger = logging.getLogger("google_docs_mcp")
+_listener: logging.handlers.QueueListener | None = None
+_listener_lock = threading.Lock()
 
-def log(message: str) -> None:
-    """Log a message to stderr (MCP protocol compatibility).
+
+def _configured_level() -> int:
+    """Return the level named by LOG_LEVEL, falling back to INFO."""
+    level = logging.getLevelName(os.environ.get("LOG_LEVEL", "INFO").upper())
+    return level if isinstance(level, int) else logging.INFO
+
+
+def _get_logger() -> logging.Logger:
+    """Return the package logger, starting its background writer on first use.
+
+    Records are handed to a queue and written to stderr by a listener
+    thread, so request handlers never block on the stderr write.
+    """
+    global _listener
+    if _listener is None:
+        with _listener_lock:
+            if _listener is None:
+                log_queue: queue.Queue = queue.Queue(-1)
+                stream_handler = logging.StreamHandler(sys.stderr)
+                stream_handler.setFormatter(logging.Formatter("%(message)s"))
+                _logger.addHandler(logging.handlers.QueueHandler(log_queue))
+                _logger.setLevel(_configured_level())
+                _logger.propagate = False
+                _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+                _listener.start()
+                # Flush anything still queued when the process exits
+                atexit.register(_listener.stop)
+    return _logger
+
+
+def log(message: str, *args: object) -> None:
+    """Log a progress message to stderr at INFO level (MCP protocol compatibility).
 
     The MCP protocol uses stdout for JSON-RPC communication,
     so all logging must go to stderr to avoid corrupting the protocol.
+
+    When args are given, message is a %-style format string that is only
+    formatted if the message is actually logged.
+    """
+    _get_logger().info(message, *args)
+
+
+def log_warning(message: str, *args: object) -> None:
+    """Log a warning to stderr.
+
+    Used for problems and for messages the user must see, such as the
+    OAuth authorization prompt, so they still appear when LOG_LEVEL
+    silences progress messages.
+    """
+    _get_logger().warning(message, *args)
+
+
+def log_error(message: str, *args: object) -> None:
+    """Log an error to stderr, such as a failed API call."""
+    _get_logger().error(message, *args)
+
+
+def env_number(name: str, default: float, minimum: float = 0, cast=float) -> float:
+    """Read a numeric setting from the environment without failing startup.
+
+    A missing value gives the default. A value that cannot be parsed also
+    gives the default, and one below minimum is raised to minimum; both
+    log a warning.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or invalid
+        minimum: Smallest accepted value
+        cast: Conversion applied to the raw string (e.g. int or float)
+
+    Returns:
+        The configured value
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = cast(raw.strip())
+        if not math.isfinite(value):
+            raise ValueError(raw)
+    except ValueError:
+        log_warning("Invalid %s=%r, using the default %s", name, raw, default)
+        return default
+    if value < minimum:
+        log_warning("%s=%s is below the minimum %s, using %s", name, value, minimum, minimum)
+        return cast(minimum)
+    return value
+
+
+def log_enabled() -> bool:
+    """Return whether log() messages are currently emitted.
+
+    Hot loops check this once so they can skip formatting per-item
+    messages that would be discarded anyway.
     """
-    print(message, file=sys.stderr)
+    return _get_logger().isEnabledFor(logging.INFO)
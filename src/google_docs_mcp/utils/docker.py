@@ -9,7 +9,7 @@ import re
 from pathlib import Path
 from typing import Optional
 
-from google_docs_mcp.utils import log
+from google_docs_mcp.utils import log, log_warning
 
 
 def get_container_id() -> Optional[str]:
@@ -39,7 +39,7 @@ def get_container_id() -> Optional[str]:
             if match:
                 return match.group(1)
         except Exception as e:
-            log(f"[Port Discovery] Error reading cgroup: {e}")
+            log_warning(f"[Port Discovery] Error reading cgroup: {e}")
 
     # Try cgroup v2 / mountinfo format
     mountinfo_path = Path("/proc/self/mountinfo")
@@ -55,7 +55,7 @@ def get_container_id() -> Optional[str]:
             if match:
                 return match.group(1)
         except Exception as e:
-            log(f"[Port Discovery] Error reading mountinfo: {e}")
+            log_warning(f"[Port Discovery] Error reading mountinfo: {e}")
 
     return None
 
@@ -109,10 +109,10 @@ def get_published_port(container_port: int) -> Optional[int]:
         return None
 
     except docker.errors.DockerException as e:
-        log(f"[Port Discovery] Docker API error: {e}")
+        log_warning(f"[Port Discovery] Docker API error: {e}")
         return None
     except Exception as e:
-        log(f"[Port Discovery] Unexpected error during port discovery: {e}")
+        log_warning(f"[Port Discovery] Unexpected error during port discovery: {e}")
         return None
 
 
@@ -150,5 +150,5 @@ def discover_oauth_port(default_port: int = 3000) -> int:
             return default_port
 
     except Exception as e:
-        log(f"[Port Discovery] Error during discovery: {e}, using default port {default_port}")
+        log_warning(f"[Port Discovery] Error during discovery: {e}, using default port {default_port}")
         return default_port
@@ -0,0 +1,80 @@
+"""
+Tests for appending text to a document.
+"""
+
+import httplib2
+import pytest
+from unittest.mock import MagicMock, patch
+from googleapiclient.errors import HttpError
+
+from fastmcp.exceptions import ToolError
+
+from google_docs_mcp.api.documents import append_to_document
+
+
+def _docs_ending_at(end_index):
+    """Provide a mock Docs client whose body ends at end_index."""
+    docs = MagicMock()
+    docs.documents().get().execute.return_value = {
+        "body": {"content": [{"endIndex": end_index}]}
+    }
+    docs.documents().get.reset_mock()
+    return docs
+
+
+class TestAppendToDocument:
+    """Tests for append_to_document."""
+
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_empty_text_makes_no_requests(self, mock_get_docs):
+        """Should return before fetching or updating the document."""
+        docs = _docs_ending_at(10)
+        mock_get_docs.return_value = docs
+
+        assert append_to_document("doc123", "") == "Nothing to append."
+        docs.documents().get.assert_not_called()
+
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_adds_newline_to_non_empty_document(self, mock_get_docs, mock_execute):
+        """Should prefix a newline when the document already has text."""
+        mock_get_docs.return_value = _docs_ending_at(10)
+
+        append_to_document("doc123", "More")
+
+        request = mock_execute.call_args.args[2][0]
+        assert request["insertText"] == {"location": {"index": 9}, "text": "\nMore"}
+
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_without_newline_skips_document_fetch(self, mock_get_docs, mock_execute):
+        """Should append at the end of the segment without reading the document."""
+        docs = _docs_ending_at(10)
+        mock_get_docs.return_value = docs
+
+        append_to_document("doc123", "More", add_newline_if_needed=False, tab_id="t1")
+
+        docs.documents().get.assert_not_called()
+        request = mock_execute.call_args.args[2][0]
+        assert request["insertText"] == {
+            "endOfSegmentLocation": {"tabId": "t1"},
+            "text": "More",
+        }
+
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_without_newline_reports_unknown_tab(self, mock_get_docs, mock_execute):
+        """Should report an unknown tab like the other tab-targeted writes."""
+        cause = HttpError(
+            httplib2.Response({"status": 400}),
+            b"Invalid requests[0].insertText: The tab ID is invalid.",
+        )
+        error = ToolError(f"Invalid request sent to Google Docs API: {cause}")
+        error.__cause__ = cause
+        mock_execute.side_effect = error
+
+        with pytest.raises(ToolError, match='Tab "missing" not found'):
+            append_to_document(
+                "doc123", "More", add_newline_if_needed=False, tab_id="missing"
+            )
+
@@ -0,0 +1,91 @@
+"""
+Tests for API client construction.
+"""
+
+from unittest.mock import patch
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpMockSequence
+
+from google_docs_mcp.auth import API_NUM_RETRIES, _build_client, _RetryingHttpRequest
+
+
+class TestBuildClient:
+    """Tests for _build_client."""
+
+    @patch("google_docs_mcp.auth._get_authorized_http")
+    def test_requests_retry_transient_errors(self, mock_get_http):
+        """Should build requests that retry transient failures by default."""
+        mock_get_http.return_value = httplib2.Http()
+        drive = _build_client("drive", "v3")
+
+        request = drive.files().get(fileId="abc")
+
+        assert isinstance(request, _RetryingHttpRequest)
+        with patch("googleapiclient.http.HttpRequest.execute") as mock_execute:
+            request.execute()
+        mock_execute.assert_called_once_with(http=None, num_retries=API_NUM_RETRIES)
+
+    @patch("google_docs_mcp.auth._get_authorized_http")
+    def test_explicit_retry_count_is_respected(self, mock_get_http):
+        """Should let callers override the retry count."""
+        mock_get_http.return_value = httplib2.Http()
+        docs = _build_client("docs", "v1")
+
+        request = docs.documents().get(documentId="abc")
+
+        with patch("googleapiclient.http.HttpRequest.execute") as mock_execute:
+            request.execute(num_retries=0)
+        mock_execute.assert_called_once_with(http=None, num_retries=0)
+
+
+class TestWriteRetries:
+    """Tests for retrying non-idempotent requests."""
+
+    @patch("google_docs_mcp.auth._get_authorized_http")
+    def test_post_not_retried_on_server_error(self, mock_get_http):
+        """Should not resend a write that may already have been applied."""
+        http = HttpMockSequence([({"status": "500"}, b"{}"), ({"status": "200"}, b"{}")])
+        mock_get_http.return_value = http
+        docs = _build_client("docs", "v1")
+
+        request = docs.documents().batchUpdate(documentId="abc", body={"requests": []})
+        request._sleep = lambda seconds: None
+
+        with pytest.raises(HttpError) as exc_info:
+            request.execute()
+        assert exc_info.value.resp.status == 500
+        assert len(http._iterable) == 1
+
+    @patch("google_docs_mcp.auth._get_authorized_http")
+    def test_post_retried_when_rate_limited(self, mock_get_http):
+        """Should resend a write rejected by rate limiting."""
+        http = HttpMockSequence(
+            [({"status": "429"}, b"{}"), ({"status": "200"}, b'{"replies": []}')]
+        )
+        mock_get_http.return_value = http
+        docs = _build_client("docs", "v1")
+
+        request = docs.documents().batchUpdate(documentId="abc", body={"requests": []})
+        sleeps = []
+        request._sleep = sleeps.append
+
+        assert request.execute() == {"replies": []}
+        assert len(sleeps) == 1
+
+    @patch("google_docs_mcp.auth._get_authorized_http")
+    def test_get_retried_on_server_error(self, mock_get_http):
+        """Should keep retrying idempotent reads after a 5xx."""
+        http = HttpMockSequence(
+            [({"status": "503"}, b"{}"), ({"status": "200"}, b'{"documentId": "abc"}')]
+        )
+        mock_get_http.return_value = http
+        docs = _build_client("docs", "v1")
+
+        request = docs.documents().get(documentId="abc")
+        request._sleep = lambda seconds: None
+
+        assert request.execute() == {"documentId": "abc"}
+
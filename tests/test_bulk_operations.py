@@ -16,6 +16,7 @@ from google_docs_mcp.api.documents import (
     _prepare_insert_image_request,
     _prepare_apply_text_style_request,
     _prepare_apply_paragraph_style_request,
+    _validate_image_urls,
 )
 from google_docs_mcp.api.helpers import chunk_requests
 from fastmcp.exceptions import ToolError
@@ -263,6 +264,52 @@ class TestPrepareInsertImageRequest:
 
         assert "Invalid image URL" in str(exc_info.value)
 
+    @patch("google_docs_mcp.api.helpers._validate_image_url")
+    def test_uses_prevalidated_result(self, mock_validate):
+        """Should reuse an up-front validation result instead of checking again."""
+        op_dict = {"image_url": "https://example.com/image.png", "index": 1}
+
+        request = _prepare_insert_image_request(op_dict, {op_dict["image_url"]: None})
+
+        mock_validate.assert_not_called()
+        assert request["insertInlineImage"]["uri"] == op_dict["image_url"]
+
+    def test_raises_prevalidated_error(self):
+        """Should raise the error recorded for the URL during up-front validation."""
+        op_dict = {"image_url": "https://example.com/missing.png", "index": 1}
+        error = ToolError("Image URL returned HTTP 404")
+
+        with pytest.raises(ToolError, match="HTTP 404"):
+            _prepare_insert_image_request(op_dict, {op_dict["image_url"]: error})
+
+
+class TestValidateImageUrls:
+    """Tests for up-front validation of bulk image URLs."""
+
+    @patch("google_docs_mcp.api.helpers._validate_image_url")
+    def test_validates_each_unique_url_once(self, mock_validate):
+        """Should check every distinct image URL once and record failures."""
+        def validate(url):
+            if "bad" in url:
+                raise ToolError(f"Bad image: {url}")
+
+        mock_validate.side_effect = validate
+
+        results = _validate_image_urls([
+            {"type": "insert_image_from_url", "image_url": "https://example.com/a.png"},
+            {"type": "insert_text", "text": "x", "image_url": "https://example.com/ignored.png"},
+            {"type": "insert_image_from_url", "image_url": "https://example.com/a.png"},
+            {"type": "insert_image_from_url", "image_url": "https://example.com/bad.png"},
+        ])
+
+        assert mock_validate.call_count == 2
+        assert results["https://example.com/a.png"] is None
+        assert isinstance(results["https://example.com/bad.png"], ToolError)
+
+    def test_no_image_operations(self):
+        """Should return no results when there are no image operations."""
+        assert _validate_image_urls([{"type": "insert_text", "text": "x"}]) == {}
+
 
 class TestBulkUpdateDocument:
     """Tests for bulk_update_document function."""
@@ -382,6 +429,20 @@ class TestBulkUpdateDocument:
 
         assert "missing 'type' field" in str(exc_info.value)
 
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_preparation_error_names_operation(self, mock_get_docs):
+        """Should report which operation failed to prepare."""
+        operations = [
+            {"type": "insert_text", "text": "Hello", "index": 1},
+            {"type": "delete_range", "start_index": 5, "end_index": 2},
+        ]
+
+        with pytest.raises(ToolError) as exc_info:
+            bulk_update_document("doc123", operations)
+
+        assert str(exc_info.value).startswith("Error preparing operation 2 (delete_range):")
+        assert isinstance(exc_info.value.__cause__, ToolError)
+
     @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
     @patch("google_docs_mcp.api.documents.get_docs_client")
     def test_operation_with_default_tab_id(self, mock_get_docs, mock_execute_batch):
@@ -436,3 +497,135 @@ class TestBulkUpdateDocument:
         assert "Successfully executed 5 operations" in result
         assert "3× insert_text" in result
         assert "2× insert_table" in result
+
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_document_not_fetched_without_text_finding(self, mock_get_docs, mock_execute_batch):
+        """Should skip the document fetch when no operation searches for text."""
+        mock_execute_batch.return_value = {}
+
+        operations = [
+            {"type": "apply_text_style", "start_index": 1, "end_index": 5, "bold": True},
+            {"type": "apply_paragraph_style", "start_index": 1, "end_index": 5, "alignment": "CENTER"},
+        ]
+
+        bulk_update_document("doc123", operations)
+
+        mock_get_docs.return_value.documents.return_value.get.assert_not_called()
+
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_document_fetched_once_with_narrow_fields(self, mock_get_docs, mock_execute_batch):
+        """Should fetch the document once, without requesting every field."""
+        mock_execute_batch.return_value = {}
+        mock_get = mock_get_docs.return_value.documents.return_value.get
+        mock_get.return_value.execute.return_value = {
+            "documentId": "doc123",
+            "body": {
+                "content": [
+                    {"startIndex": 1, "endIndex": 10, "paragraph": {}},
+                    {"startIndex": 10, "endIndex": 20, "paragraph": {}},
+                ]
+            },
+        }
+
+        operations = [
+            {"type": "apply_paragraph_style", "index_within_paragraph": 3, "alignment": "CENTER"},
+            {"type": "apply_paragraph_style", "index_within_paragraph": 12, "alignment": "END"},
+        ]
+
+        bulk_update_document("doc123", operations)
+
+        requests = mock_execute_batch.call_args.args[2]
+        assert [r["updateParagraphStyle"]["range"]["startIndex"] for r in requests] == [1, 10]
+        mock_get.assert_called_once()
+        fields = mock_get.call_args.kwargs["fields"]
+        assert fields != "*"
+        assert fields.startswith("documentId,tabs(")
+        assert "childTabs(tabProperties,documentTab(" in fields
+
+    @patch("google_docs_mcp.api.documents.helpers.find_text_range")
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_repeated_text_lookups_searched_once(
+        self, mock_get_docs, mock_execute_batch, mock_find_text
+    ):
+        """Should search once for operations targeting the same text and instance."""
+        from google_docs_mcp.types import TextRange
+
+        mock_execute_batch.return_value = {}
+        mock_find_text.return_value = TextRange(start_index=5, end_index=10)
+        mock_get = mock_get_docs.return_value.documents.return_value.get
+        mock_get.return_value.execute.return_value = {"documentId": "doc123"}
+
+        operations = [
+            {"type": "apply_text_style", "text_to_find": "Hello", "bold": True},
+            {"type": "apply_text_style", "text_to_find": "Hello", "italic": True},
+            {"type": "apply_text_style", "text_to_find": "Hello", "match_instance": 2, "bold": True},
+        ]
+
+        bulk_update_document("doc123", operations)
+
+        assert mock_find_text.call_count == 2
+
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_text_style_in_nested_tab(self, mock_get_docs, mock_execute_batch):
+        """Should find text in a child tab using that tab's own indices."""
+        mock_execute_batch.return_value = {}
+
+        def tab(tab_id, text, children=()):
+            return {
+                "tabProperties": {"tabId": tab_id},
+                "documentTab": {
+                    "body": {
+                        "content": [
+                            {
+                                "startIndex": 1,
+                                "endIndex": 1 + len(text),
+                                "paragraph": {
+                                    "elements": [
+                                        {
+                                            "startIndex": 1,
+                                            "endIndex": 1 + len(text),
+                                            "textRun": {"content": text},
+                                        }
+                                    ]
+                                },
+                            }
+                        ]
+                    }
+                },
+                "childTabs": list(children),
+            }
+
+        mock_get = mock_get_docs.return_value.documents.return_value.get
+        mock_get.return_value.execute.return_value = {
+            "documentId": "doc123",
+            "tabs": [tab("t.0", "Hello world\n", [tab("t.child", "Hi world\n")])],
+        }
+
+        operations = [
+            {"type": "apply_text_style", "text_to_find": "world", "tab_id": "t.child", "bold": True}
+        ]
+
+        bulk_update_document("doc123", operations)
+
+        style_range = mock_execute_batch.call_args.args[2][0]["updateTextStyle"]["range"]
+        assert style_range == {"startIndex": 4, "endIndex": 9, "tabId": "t.child"}
+
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_text_lookup_in_unknown_tab(self, mock_get_docs):
+        """Should report a missing tab instead of searching the first tab."""
+        mock_get = mock_get_docs.return_value.documents.return_value.get
+        mock_get.return_value.execute.return_value = {
+            "documentId": "doc123",
+            "tabs": [{"tabProperties": {"tabId": "t.0"}, "documentTab": {"body": {}}}],
+        }
+
+        operations = [
+            {"type": "apply_text_style", "text_to_find": "world", "tab_id": "missing", "bold": True}
+        ]
+
+        with pytest.raises(ToolError, match='Tab with ID "missing" not found'):
+            bulk_update_document("doc123", operations)
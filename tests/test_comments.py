@@ -0,0 +1,412 @@
+"""
+Tests for comment operations.
+"""
+
+import json
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from fastmcp.exceptions import ToolError
+
+from google_docs_mcp.api import comments
+from google_docs_mcp.api.comments import (
+    _author_name,
+    _build_anchor,
+    _short_date,
+    add_comment,
+    add_comments,
+    get_comments,
+    list_comments,
+    reply_to_comment,
+    get_comment,
+    resolve_comment,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_comment_cache():
+    """Keep cached comment reads from leaking between tests."""
+    comments._comment_cache.clear()
+    yield
+    comments._comment_cache.clear()
+
+
+class FakeBatch:
+    """Minimal stand-in for googleapiclient's BatchHttpRequest."""
+
+    def __init__(self, callback, responses):
+        self._callback = callback
+        self._responses = responses
+        self.request_ids: list[str] = []
+
+    def add(self, request, request_id=None):
+        self.request_ids.append(request_id)
+
+    def execute(self):
+        for request_id in self.request_ids:
+            response = self._responses[request_id]
+            if isinstance(response, Exception):
+                self._callback(request_id, None, response)
+            else:
+                self._callback(request_id, response, None)
+
+
+def _make_drive(responses):
+    drive = MagicMock()
+    batches: list[FakeBatch] = []
+
+    def new_batch(callback):
+        batch = FakeBatch(callback, responses)
+        batches.append(batch)
+        return batch
+
+    drive.new_batch_http_request.side_effect = new_batch
+    return drive, batches
+
+
+class TestGetComments:
+    """Tests for batched comment retrieval."""
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    def test_fetches_comments_in_one_batch(self, mock_get_drive):
+        """Should fetch all comments with a single batch request."""
+        drive, batches = _make_drive(
+            {
+                "c1": {"content": "First", "author": {"displayName": "Ann"}},
+                "c2": {
+                    "content": "Second",
+                    "replies": [{"content": "Reply", "author": {"displayName": "Bob"}}],
+                },
+            }
+        )
+        mock_get_drive.return_value = drive
+
+        result = get_comments("doc123", ["c1", "c2"])
+
+        assert len(batches) == 1
+        assert batches[0].request_ids == ["c1", "c2"]
+        assert "Comment ID: c1" in result
+        assert "**Ann**" in result
+        assert "First" in result
+        assert "**Replies:**" in result
+        assert "Reply" in result
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    def test_splits_large_requests_into_batches_of_100(self, mock_get_drive):
+        """Should not exceed the Drive batch limit of 100 calls per request."""
+        ids = [f"c{i}" for i in range(150)]
+        drive, batches = _make_drive({cid: {"content": cid} for cid in ids})
+        mock_get_drive.return_value = drive
+
+        get_comments("doc123", ids)
+
+        assert [len(batch.request_ids) for batch in batches] == [100, 50]
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    def test_duplicate_ids_fetched_once(self, mock_get_drive):
+        """Should dedupe comment IDs since batch request IDs must be unique."""
+        drive, batches = _make_drive({"c1": {"content": "Only"}})
+        mock_get_drive.return_value = drive
+
+        result = get_comments("doc123", ["c1", "c1"])
+
+        assert batches[0].request_ids == ["c1"]
+        assert result.count("Comment ID: c1") == 1
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    def test_failed_comment_reported_inline(self, mock_get_drive):
+        """Should report a failed sub-request without failing the others."""
+        drive, _ = _make_drive(
+            {"c1": {"content": "Fine"}, "c2": Exception("404 Not found")}
+        )
+        mock_get_drive.return_value = drive
+
+        result = get_comments("doc123", ["c1", "c2"])
+
+        assert "Fine" in result
+        assert "Failed to get comment" in result
+
+    def test_empty_ids(self):
+        """Should return early when no IDs are provided."""
+        assert "No comment IDs" in get_comments("doc123", [])
+
+
+class TestResolveComment:
+    """Tests for resolving comments."""
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    def test_uses_update_response_instead_of_verify_get(self, mock_get_drive):
+        """Should read the resolved state from the update response."""
+        drive = MagicMock()
+        drive.comments().get().execute.return_value = {"content": "Note"}
+        drive.comments().update().execute.return_value = {"id": "c1", "resolved": True}
+        drive.comments().get.reset_mock()
+        mock_get_drive.return_value = drive
+
+        result = resolve_comment("doc123", "c1")
+
+        assert "has been marked as resolved" in result
+        drive.comments().get.assert_called_once()
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    def test_reports_unpersisted_resolve(self, mock_get_drive):
+        """Should warn when the update response is not resolved."""
+        drive = MagicMock()
+        drive.comments().get().execute.return_value = {"content": "Note"}
+        drive.comments().update().execute.return_value = {"id": "c1", "resolved": False}
+        mock_get_drive.return_value = drive
+
+        result = resolve_comment("doc123", "c1")
+
+        assert "may not persist" in result
+
+
+class TestListComments:
+    """Tests for listing comments."""
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    def test_follows_page_tokens(self, mock_get_drive):
+        """Should keep fetching pages until no nextPageToken is returned."""
+        drive = MagicMock()
+        drive.comments().list().execute.side_effect = [
+            {"comments": [{"id": "c1", "content": "One"}], "nextPageToken": "p2"},
+            {"comments": [{"id": "c2", "content": "Two"}]},
+        ]
+        drive.comments().list.reset_mock()
+        mock_get_drive.return_value = drive
+
+        result = list_comments("doc123")
+
+        assert "Found 2 comments" in result
+        assert "1. **Unknown**" in result
+        assert "2. **Unknown**" in result
+        page_tokens = [c.kwargs["pageToken"] for c in drive.comments().list.call_args_list]
+        assert page_tokens == [None, "p2"]
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    def test_no_comments(self, mock_get_drive):
+        """Should report when the document has no comments."""
+        drive = MagicMock()
+        drive.comments().list().execute.return_value = {}
+        mock_get_drive.return_value = drive
+
+        assert list_comments("doc123") == "No comments found in this document."
+
+
+def _paragraph(start, text):
+    """Build a body paragraph with a single text run."""
+    end = start + len(text)
+    return {
+        "startIndex": start,
+        "endIndex": end,
+        "paragraph": {
+            "elements": [
+                {"startIndex": start, "endIndex": end, "textRun": {"content": text}}
+            ]
+        },
+    }
+
+
+class TestAddComment:
+    """Tests for adding comments."""
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    @patch("google_docs_mcp.api.comments.get_docs_client")
+    def test_quotes_text_across_paragraphs(self, mock_get_docs, mock_get_drive):
+        """Should quote only the text inside the requested range."""
+        docs = MagicMock()
+        docs.documents().get().execute.return_value = {
+            "body": {
+                "content": [
+                    {"startIndex": 0, "endIndex": 1, "sectionBreak": {}},
+                    _paragraph(1, "Hello\n"),
+                    _paragraph(7, "World\n"),
+                    _paragraph(13, "Ignored\n"),
+                ]
+            }
+        }
+        mock_get_docs.return_value = docs
+        drive = MagicMock()
+        drive.comments().create().execute.return_value = {"id": "new1"}
+        mock_get_drive.return_value = drive
+
+        result = add_comment("doc123", 3, 10, "Note")
+
+        assert "new1" in result
+        body = drive.comments().create.call_args.kwargs["body"]
+        assert body["quotedFileContent"]["value"] == "llo\nWor"
+        fields = docs.documents().get.call_args.kwargs["fields"]
+        assert "textRun(content)" in fields
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    @patch("google_docs_mcp.api.comments.get_docs_client")
+    def test_supplied_quote_skips_document_fetch(self, mock_get_docs, mock_get_drive):
+        """Should not read the document when the caller supplies the quote."""
+        drive = MagicMock()
+        drive.comments().create().execute.return_value = {"id": "new1"}
+        mock_get_drive.return_value = drive
+
+        add_comment("doc123", 3, 10, "Note", quoted_text="")
+
+        mock_get_docs.assert_not_called()
+        body = drive.comments().create.call_args.kwargs["body"]
+        assert "quotedFileContent" not in body
+        assert "anchor" in body
+
+    def test_rejects_empty_range(self):
+        """Should reject ranges where end is not after start."""
+        with pytest.raises(ToolError):
+            add_comment("doc123", 5, 5, "Note")
+
+
+class TestAddComments:
+    """Tests for batched comment creation."""
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    @patch("google_docs_mcp.api.comments.get_docs_client")
+    def test_creates_comments_in_one_batch(self, mock_get_docs, mock_get_drive):
+        """Should fetch quotes once and create every comment in a single batch."""
+        docs = MagicMock()
+        docs.documents().get().execute.return_value = {
+            "body": {"content": [_paragraph(1, "Hello\n"), _paragraph(7, "World\n")]}
+        }
+        docs.documents().get.reset_mock()
+        mock_get_docs.return_value = docs
+        drive, batches = _make_drive(
+            {"1": {"id": "new1"}, "2": {"id": "new2"}, "3": Exception("403 Forbidden")}
+        )
+        mock_get_drive.return_value = drive
+
+        result = add_comments(
+            "doc123",
+            [
+                {"start_index": 1, "end_index": 6, "comment_text": "A"},
+                {"start_index": 7, "end_index": 12, "comment_text": "B"},
+                {"start_index": 2, "end_index": 4, "comment_text": "C", "quoted_text": ""},
+            ],
+        )
+
+        docs.documents().get.assert_called_once()
+        assert len(batches) == 1
+        assert batches[0].request_ids == ["1", "2", "3"]
+        bodies = [call.kwargs["body"] for call in drive.comments().create.call_args_list]
+        assert [b.get("quotedFileContent", {}).get("value") for b in bodies] == [
+            "Hello",
+            "World",
+            None,
+        ]
+        assert "Comment 1: Comment ID: new1" in result
+        assert "Comment 2: Comment ID: new2" in result
+        assert "Comment 3: Failed to add comment" in result
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    def test_splits_large_requests_into_batches_of_100(self, mock_get_drive):
+        """Should not exceed the Drive batch limit of 100 calls per request."""
+        drive, batches = _make_drive({str(i): {"id": f"c{i}"} for i in range(1, 151)})
+        mock_get_drive.return_value = drive
+
+        add_comments(
+            "doc123",
+            [
+                {"start_index": 1, "end_index": 2, "comment_text": "x", "quoted_text": ""}
+                for _ in range(150)
+            ],
+        )
+
+        assert [len(batch.request_ids) for batch in batches] == [100, 50]
+
+    def test_rejects_invalid_comment(self):
+        """Should name the comment with a bad range or missing fields."""
+        with pytest.raises(ToolError, match="Comment 2: end index"):
+            add_comments(
+                "doc123",
+                [
+                    {"start_index": 1, "end_index": 2, "comment_text": "ok"},
+                    {"start_index": 5, "end_index": 5, "comment_text": "bad"},
+                ],
+            )
+        with pytest.raises(ToolError, match="Comment 1 is missing comment_text"):
+            add_comments("doc123", [{"start_index": 1, "end_index": 2}])
+
+    def test_empty_list(self):
+        """Should return early when no comments are provided."""
+        assert "No comments" in add_comments("doc123", [])
+
+
+class TestBuildAnchor:
+    """Tests for the comment anchor JSON."""
+
+    def test_matches_json_encoding(self):
+        """Should produce the same structure json.dumps would."""
+        anchor = json.loads(_build_anchor("abc_DEF-123", 5, 12))
+
+        assert anchor == {"r": "abc_DEF-123", "a": [{"txt": {"o": 4, "l": 7, "ml": 7}}]}
+
+    def test_escapes_unusual_ids(self):
+        """Should fall back to json encoding for IDs needing escaping."""
+        anchor = json.loads(_build_anchor('bad"id', 1, 2))
+
+        assert anchor["r"] == 'bad"id'
+
+
+class TestCommentFieldHelpers:
+    """Tests for author and date extraction helpers."""
+
+    def test_short_date(self):
+        """Should trim timestamps to the date and default when missing."""
+        assert _short_date({"createdTime": "2024-05-01T12:34:56.000Z"}) == "2024-05-01"
+        assert _short_date({}) == "Unknown date"
+
+    def test_author_name(self):
+        """Should default when the author or its display name is missing."""
+        assert _author_name({"author": {"displayName": "Ann"}}) == "Ann"
+        assert _author_name({"author": None}) == "Unknown"
+        assert _author_name({}) == "Unknown"
+
+
+class TestCommentCache:
+    """Tests for the short-lived comment read cache."""
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    def test_repeated_reads_use_cache(self, mock_get_drive):
+        """Should serve an identical read from cache."""
+        drive = MagicMock()
+        drive.comments().get().execute.return_value = {"content": "Cached"}
+        drive.comments().get().execute.reset_mock()
+        mock_get_drive.return_value = drive
+
+        first = get_comment("doc123", "c1")
+        second = get_comment("doc123", "c1")
+
+        assert first == second
+        drive.comments().get().execute.assert_called_once()
+
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    def test_writes_invalidate_document_entries(self, mock_get_drive):
+        """Should refetch after a write to the same document."""
+        drive = MagicMock()
+        drive.comments().list().execute.return_value = {}
+        drive.replies().create().execute.return_value = {"id": "r1"}
+        drive.comments().list().execute.reset_mock()
+        mock_get_drive.return_value = drive
+
+        list_comments("doc123")
+        reply_to_comment("doc123", "c1", "Reply")
+        list_comments("doc123")
+
+        assert drive.comments().list().execute.call_count == 2
+
+    @patch("google_docs_mcp.api.comments._COMMENT_CACHE_TTL_SECONDS", 0)
+    @patch("google_docs_mcp.api.comments.get_drive_client")
+    def test_zero_ttl_disables_cache(self, mock_get_drive):
+        """Should always fetch when the TTL is zero."""
+        drive = MagicMock()
+        drive.comments().list().execute.return_value = {}
+        drive.comments().list().execute.reset_mock()
+        mock_get_drive.return_value = drive
+
+        list_comments("doc123")
+        list_comments("doc123")
+
+        assert drive.comments().list().execute.call_count == 2
@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import MagicMock, patch, call
 from google_docs_mcp.api.helpers import insert_inline_image
-from google_docs_mcp.api.documents import _prepare_insert_image_request
+from google_docs_mcp.api.documents import _prepare_insert_image_request, _share_drive_images
 from fastmcp.exceptions import ToolError
 
 
@@ -85,18 +85,14 @@ class TestDrivePermissionsInHelpers:
 
 
 class TestDrivePermissionsInBulkOperations:
-    """Test that Drive permissions are set when preparing bulk operations."""
+    """Test that Drive permissions are set in one batch for bulk operations."""
 
     @patch('google_docs_mcp.api.documents.get_drive_client')
     @patch('google_docs_mcp.api.helpers._validate_image_url')
-    def test_prepare_insert_image_sets_drive_permissions(
+    def test_prepare_insert_image_does_not_call_drive(
         self, mock_validate, mock_get_drive
     ):
-        """Test that preparing a Drive image insert sets public permissions."""
-        # Setup
-        mock_drive = MagicMock()
-        mock_get_drive.return_value = mock_drive
-
+        """Test that preparing a Drive image insert leaves sharing to the batch."""
         op_dict = {
             "image_url": "https://drive.google.com/uc?export=download&id=bulk456",
             "index": 10,
@@ -104,90 +100,85 @@ class TestDrivePermissionsInBulkOperations:
             "height": 150
         }
 
-        # Execute
         request = _prepare_insert_image_request(op_dict)
 
-        # Verify Drive permissions were set
-        mock_get_drive.assert_called_once()
-        mock_drive.permissions().create.assert_called_once()
-
-        # Check the permission structure
-        call_args = mock_drive.permissions().create.call_args
-        assert call_args[1]['fileId'] == 'bulk456'
-        assert call_args[1]['body'] == {
-            'type': 'anyone',
-            'role': 'reader'
-        }
-
-        # Verify the request structure
+        mock_get_drive.assert_not_called()
         assert request['insertInlineImage']['uri'] == op_dict['image_url']
         assert request['insertInlineImage']['location']['index'] == 10
         assert request['insertInlineImage']['objectSize']['width']['magnitude'] == 200
         assert request['insertInlineImage']['objectSize']['height']['magnitude'] == 150
 
     @patch('google_docs_mcp.api.documents.get_drive_client')
-    @patch('google_docs_mcp.api.helpers._validate_image_url')
-    def test_prepare_insert_image_handles_permission_failure(
-        self, mock_validate, mock_get_drive
-    ):
-        """Test that permission failures in bulk operations raise helpful errors."""
-        # Setup
+    def test_share_drive_images_batches_unique_files(self, mock_get_drive):
+        """Test that each Drive file is shared once, in a single batch."""
         mock_drive = MagicMock()
         mock_get_drive.return_value = mock_drive
+        batch = mock_drive.new_batch_http_request.return_value
+
+        _share_drive_images([
+            {"type": "insert_image_from_url", "image_url": "https://drive.google.com/uc?id=a1"},
+            {"type": "insert_text", "text": "x"},
+            {"type": "insert_image_from_url", "image_url": "https://drive.google.com/uc?id=a1"},
+            {"type": "insert_image_from_url", "image_url": "https://drive.google.com/uc?id=b2"},
+            {"type": "insert_image_from_url", "image_url": "https://example.com/image.png"},
+        ])
+
+        mock_drive.new_batch_http_request.assert_called_once()
+        batch.execute.assert_called_once()
+        assert [c.kwargs['request_id'] for c in batch.add.call_args_list] == ['a1', 'b2']
+        mock_drive.permissions().create.assert_any_call(
+            fileId='a1', body={'type': 'anyone', 'role': 'reader'}
+        )
 
-        # Make permissions().create() raise an error
-        mock_drive.permissions().create().execute.side_effect = Exception("403 Forbidden")
-
-        op_dict = {
-            "image_url": "https://drive.google.com/uc?export=download&id=bulk456",
-            "index": 10
-        }
+    @patch('google_docs_mcp.api.documents.get_drive_client')
+    def test_share_drive_images_skips_non_drive_urls(self, mock_get_drive):
+        """Test that operations without Drive file IDs don't touch Drive."""
+        _share_drive_images([
+            {"type": "insert_image_from_url", "image_url": "https://example.com/image.png"},
+            {"type": "insert_image_from_url", "image_url": "https://drive.google.com/file/d/123/view"},
+        ])
 
-        # Execute and verify error
-        with pytest.raises(ToolError) as exc_info:
-            _prepare_insert_image_request(op_dict)
+        mock_get_drive.assert_not_called()
 
-        error_msg = str(exc_info.value)
-        assert "Failed to set public permissions" in error_msg
-        assert "bulk456" in error_msg
+    @patch('google_docs_mcp.api.documents.get_drive_client')
+    def test_share_drive_images_reports_failed_operation(self, mock_get_drive):
+        """Test that a failed permission names the operation and file."""
+        mock_drive = MagicMock()
+        mock_get_drive.return_value = mock_drive
 
-    @patch('google_docs_mcp.api.helpers._validate_image_url')
-    def test_prepare_insert_image_skips_permissions_for_non_drive_urls(
-        self, mock_validate
-    ):
-        """Test that non-Drive URLs in bulk ops don't trigger permission logic."""
-        op_dict = {
-            "image_url": "https://example.com/image.png",
-            "index": 5
-        }
+        def fail_second(**kwargs):
+            callback = kwargs['callback']
+            batch = MagicMock()
+            batch.execute.side_effect = lambda: (
+                callback('ok1', {}, None),
+                callback('bad2', None, Exception("403 Forbidden")),
+            )
+            return batch
 
-        # Execute
-        request = _prepare_insert_image_request(op_dict)
+        mock_drive.new_batch_http_request.side_effect = fail_second
 
-        # Verify validation was called
-        mock_validate.assert_called_once_with(op_dict['image_url'])
+        with pytest.raises(ToolError) as exc_info:
+            _share_drive_images([
+                {"type": "insert_image_from_url", "image_url": "https://drive.google.com/uc?id=ok1"},
+                {"type": "insert_image_from_url", "image_url": "https://drive.google.com/uc?id=bad2"},
+            ])
 
-        # Verify the request was created correctly
-        assert request['insertInlineImage']['uri'] == op_dict['image_url']
-        assert request['insertInlineImage']['location']['index'] == 5
+        error_msg = str(exc_info.value)
+        assert "operation 2" in error_msg
+        assert "Failed to set public permissions" in error_msg
+        assert "bad2" in error_msg
 
     @patch('google_docs_mcp.api.documents.get_drive_client')
-    @patch('google_docs_mcp.api.helpers._validate_image_url')
-    def test_prepare_handles_drive_url_without_id_parameter(
-        self, mock_validate, mock_get_drive
-    ):
-        """Test that Drive URLs without proper ID format are handled gracefully."""
-        # Setup - URL without proper ?id= format
-        op_dict = {
-            "image_url": "https://drive.google.com/file/d/123/view",
-            "index": 5
-        }
-
-        # Execute - should not crash even if ID extraction fails
-        request = _prepare_insert_image_request(op_dict)
+    def test_share_drive_images_handles_batch_failure(self, mock_get_drive):
+        """Test that a failed batch request is reported for the first file."""
+        mock_drive = MagicMock()
+        mock_get_drive.return_value = mock_drive
+        mock_drive.new_batch_http_request().execute.side_effect = Exception("Network down")
 
-        # Drive client should not be called if no ID was found
-        mock_get_drive.assert_not_called()
+        with pytest.raises(ToolError) as exc_info:
+            _share_drive_images([
+                {"type": "insert_image_from_url", "image_url": "https://drive.google.com/uc?id=bulk456"},
+            ])
 
-        # Request should still be created
-        assert request['insertInlineImage']['uri'] == op_dict['image_url']
+        assert "operation 1" in str(exc_info.value)
+        assert "bulk456" in str(exc_info.value)
@@ -0,0 +1,40 @@
+"""
+Tests for reading numeric settings from the environment.
+"""
+
+from unittest.mock import patch
+
+from google_docs_mcp.utils import env_number
+
+
+class TestEnvNumber:
+    """Tests for env_number."""
+
+    def test_unset_uses_default(self):
+        """Should return the default when the variable is unset."""
+        with patch.dict("os.environ", {}, clear=True):
+            assert env_number("DOCS_WRITE_RATE_LIMIT", 5.0) == 5.0
+
+    def test_parses_value(self):
+        """Should convert the value with the given cast."""
+        with patch.dict("os.environ", {"API_MAX_WORKERS": " 8 "}):
+            assert env_number("API_MAX_WORKERS", 50, minimum=1, cast=int) == 8
+
+    @patch("google_docs_mcp.utils.log_warning")
+    def test_invalid_value_falls_back_to_default(self, mock_warning):
+        """Should warn and use the default instead of failing at import."""
+        for raw in ("five", "1.5", "nan"):
+            with patch.dict("os.environ", {"API_MAX_WORKERS": raw}):
+                assert env_number("API_MAX_WORKERS", 50, minimum=1, cast=int) == 50
+        with patch.dict("os.environ", {"DOCS_WRITE_RATE_LIMIT": "inf"}):
+            assert env_number("DOCS_WRITE_RATE_LIMIT", 5.0) == 5.0
+
+        assert mock_warning.call_count == 4
+
+    @patch("google_docs_mcp.utils.log_warning")
+    def test_value_below_minimum_is_clamped(self, mock_warning):
+        """Should raise values below the minimum to the minimum."""
+        with patch.dict("os.environ", {"API_MAX_WORKERS": "0"}):
+            assert env_number("API_MAX_WORKERS", 50, minimum=1, cast=int) == 1
+
+        mock_warning.assert_called_once()
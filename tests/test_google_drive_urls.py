@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import MagicMock, patch
-from google_docs_mcp.api.helpers import _validate_image_url
+from google_docs_mcp.api.helpers import _validate_image_url, get_drive_file_id
 from fastmcp.exceptions import ToolError
 
 
@@ -72,3 +72,30 @@ class TestGoogleDriveURLHandling:
             error_msg = str(exc_info.value)
             assert "drive.google.com" in error_msg.lower()
             assert "export=download" in error_msg
+
+
+class TestGetDriveFileId:
+    """Test Drive file ID extraction from image URLs."""
+
+    def test_extracts_id_from_download_url(self):
+        """Test that the id query parameter is returned."""
+        assert get_drive_file_id("https://drive.google.com/uc?export=download&id=abc123") == "abc123"
+        assert get_drive_file_id("https://drive.google.com/uc?id=abc123&export=download") == "abc123"
+
+    def test_ignores_non_drive_hosts(self):
+        """Test that id parameters on other hosts are not treated as Drive files."""
+        assert get_drive_file_id("https://example.com/img?id=abc123&src=drive.google.com") is None
+        assert get_drive_file_id("https://notdrive.google.com/uc?id=abc123") is None
+
+    def test_accepts_explicit_port_and_host_case(self):
+        """Test that the host is compared without its port or letter case."""
+        assert get_drive_file_id("https://drive.google.com:443/uc?id=abc123") == "abc123"
+        assert get_drive_file_id("https://Drive.Google.com/uc?id=abc123") == "abc123"
+
+    def test_ignores_similar_parameter_names(self):
+        """Test that parameters merely ending in 'id' are not matched."""
+        assert get_drive_file_id("https://drive.google.com/uc?resourcekey=x&userid=7") is None
+
+    def test_url_without_id(self):
+        """Test that Drive URLs without an id parameter return None."""
+        assert get_drive_file_id("https://drive.google.com/file/d/123/view") is None
@@ -4,10 +4,20 @@ Tests for Google Docs API helper functions.
 Ported from tests/helpers.test.js
 """
 
+import httplib2
 import pytest
 from unittest.mock import MagicMock, patch
-
-from google_docs_mcp.api.helpers import find_text_range, get_paragraph_range_from_document
+from googleapiclient.errors import HttpError
+
+from google_docs_mcp.api.helpers import (
+    _TokenBucket,
+    build_paragraph_index,
+    build_tabs_fields,
+    find_paragraph_in_index,
+    get_http_status,
+    find_text_range,
+    get_paragraph_range_from_document,
+)
 from google_docs_mcp.types import TextRange
 
 
@@ -482,3 +492,180 @@ class TestGetParagraphRangeFromDocument:
         assert result is not None
         assert result.start_index == 1
         assert result.end_index == 55
+
+
+class TestParagraphIndex:
+    """Tests for position lookups through a paragraph index."""
+
+    BODY = {
+        "content": [
+            {"startIndex": 0, "endIndex": 1, "sectionBreak": {}},
+            {"startIndex": 1, "endIndex": 10, "paragraph": {}},
+            {
+                "startIndex": 10,
+                "endIndex": 40,
+                "table": {
+                    "tableRows": [
+                        {
+                            "tableCells": [
+                                {"content": [{"startIndex": 12, "endIndex": 20, "paragraph": {}}]},
+                                {"content": [{"startIndex": 21, "endIndex": 30, "paragraph": {}}]},
+                            ]
+                        }
+                    ]
+                },
+            },
+            {"startIndex": 40, "endIndex": 55, "paragraph": {}},
+        ]
+    }
+
+    def test_matches_linear_lookup(self):
+        """Should return the same paragraph as get_paragraph_range_from_document."""
+        paragraph_index = build_paragraph_index(self.BODY)
+
+        for position in range(60):
+            assert find_paragraph_in_index(paragraph_index, position) == (
+                get_paragraph_range_from_document({"body": self.BODY}, position)
+            )
+
+    def test_finds_table_cell_paragraph(self):
+        """Should index paragraphs nested in table cells."""
+        paragraph_index = build_paragraph_index(self.BODY)
+
+        assert find_paragraph_in_index(paragraph_index, 25) == TextRange(
+            start_index=21, end_index=30
+        )
+
+    def test_position_outside_paragraphs(self):
+        """Should return None for positions not inside any paragraph."""
+        paragraph_index = build_paragraph_index(self.BODY)
+
+        assert find_paragraph_in_index(paragraph_index, 0) is None
+        assert find_paragraph_in_index(paragraph_index, 20) is None
+        assert find_paragraph_in_index(paragraph_index, 55) is None
+
+    def test_empty_body(self):
+        """Should handle a body without content."""
+        assert find_paragraph_in_index(build_paragraph_index({}), 5) is None
+
+
+class TestBuildTabsFields:
+    """Tests for tab field mask construction."""
+
+    def test_includes_nested_child_tabs(self):
+        """Should select the fields at every tab nesting level."""
+        assert build_tabs_fields("tabProperties") == (
+            "tabs(tabProperties,childTabs(tabProperties,childTabs(tabProperties)))"
+        )
+
+
+class TestGetHttpStatus:
+    """Tests for HTTP status extraction from API errors."""
+
+    def test_reads_status_from_http_error(self):
+        """Should use the response status rather than the message text."""
+        error = HttpError(
+            httplib2.Response({"status": 403}),
+            b"",
+            uri="https://docs.googleapis.com/v1/documents/doc-404",
+        )
+
+        assert get_http_status(error) == 403
+
+    def test_reads_status_from_cause(self):
+        """Should find the HttpError an exception was re-raised from."""
+        cause = HttpError(httplib2.Response({"status": 404}), b"Not found")
+        try:
+            try:
+                raise cause
+            except HttpError as e:
+                raise Exception(f"Google API Error: {e}") from e
+        except Exception as error:
+            assert get_http_status(error) == 404
+
+    def test_ignores_status_like_message_text(self):
+        """Should not read a status out of the message of other exceptions."""
+        assert get_http_status(Exception("404 Not found")) is None
+        assert get_http_status(TimeoutError("request took 403 ms")) is None
+        assert get_http_status(Exception("Connection reset")) is None
+
+
+class TestFindTextRangeWithDocument:
+    """Tests for text search over pre-fetched document data."""
+
+    def test_uses_prefetched_tab_body(self, mock_docs_client):
+        """Should search the given tab without fetching the document."""
+        document = {
+            "tabs": [
+                {
+                    "tabProperties": {"tabId": "t1"},
+                    "documentTab": {"body": {"content": []}},
+                },
+                {
+                    "tabProperties": {"tabId": "t2"},
+                    "documentTab": {
+                        "body": {
+                            "content": [
+                                {
+                                    "startIndex": 1,
+                                    "endIndex": 13,
+                                    "paragraph": {
+                                        "elements": [
+                                            {
+                                                "startIndex": 1,
+                                                "endIndex": 13,
+                                                "textRun": {"content": "Hello world\n"},
+                                            }
+                                        ]
+                                    },
+                                }
+                            ]
+                        }
+                    },
+                },
+            ]
+        }
+
+        result = find_text_range(
+            mock_docs_client, "doc123", "world", document=document, tab_id="t2"
+        )
+
+        assert result == TextRange(start_index=7, end_index=12)
+        mock_docs_client.documents.assert_not_called()
+
+
+class TestTokenBucket:
+    """Tests for the batchUpdate rate limiter."""
+
+    @patch("google_docs_mcp.api.helpers.time.sleep")
+    @patch("google_docs_mcp.api.helpers.time.monotonic", return_value=100.0)
+    def test_allows_burst_up_to_capacity(self, mock_monotonic, mock_sleep):
+        """Should let a burst of capacity calls through without waiting."""
+        bucket = _TokenBucket(rate=5, capacity=3)
+
+        for _ in range(3):
+            bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    @patch("google_docs_mcp.api.helpers.time.sleep")
+    @patch("google_docs_mcp.api.helpers.time.monotonic", return_value=100.0)
+    def test_waits_when_empty(self, mock_monotonic, mock_sleep):
+        """Should sleep for the time the next token takes to refill."""
+        bucket = _TokenBucket(rate=5, capacity=1)
+
+        bucket.acquire()
+        bucket.acquire()
+        bucket.acquire()
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == pytest.approx([0.2, 0.4])
+
+    @patch("google_docs_mcp.api.helpers.time.sleep")
+    def test_zero_rate_disables_limit(self, mock_sleep):
+        """Should never wait when the rate is 0."""
+        bucket = _TokenBucket(rate=0, capacity=1)
+
+        for _ in range(5):
+            bucket.acquire()
+
+        mock_sleep.assert_not_called()
@@ -0,0 +1,91 @@
+"""
+Tests for listing document tabs.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from google_docs_mcp.api import helpers
+from google_docs_mcp.api.documents import list_document_tabs
+
+
+def _tab(tab_id, title, index, parent=None, children=None):
+    """Build a Tab object with optional parent and child tabs."""
+    props = {"tabId": tab_id, "title": title, "index": index}
+    if parent:
+        props["parentTabId"] = parent
+    return {"tabProperties": props, "childTabs": children or []}
+
+
+class TestListDocumentTabs:
+    """Tests for list_document_tabs output."""
+
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_nested_tabs_are_indented(self, mock_get_docs):
+        """Should indent child tabs under their parent."""
+        docs = MagicMock()
+        docs.documents().get().execute.return_value = {
+            "title": "Plan",
+            "tabs": [
+                _tab("t1", "Intro", 0, children=[_tab("t1.1", "Detail", 0, parent="t1")]),
+                _tab("t2", "Outro", 1),
+            ],
+        }
+        mock_get_docs.return_value = docs
+
+        result = list_document_tabs("doc123")
+
+        assert result.startswith('**Document:** "Plan"\n**Total tabs:** 3\n\n')
+        assert '**Tab 1:** "Intro"\n   - ID: t1\n' in result
+        assert '  └─ **Tab 2:** "Detail"\n     - ID: t1.1\n' in result
+        assert "     - Parent Tab ID: t1\n" in result
+        assert result.endswith("Tip: Use tab IDs with other tools to target specific tabs.")
+
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_single_tab_document(self, mock_get_docs):
+        """Should describe a single tab as the default tab."""
+        docs = MagicMock()
+        docs.documents().get().execute.return_value = {
+            "title": "Solo",
+            "tabs": [_tab("t1", "Main", 0)],
+        }
+        mock_get_docs.return_value = docs
+
+        result = list_document_tabs("doc123")
+
+        assert result == (
+            '**Document:** "Solo"\n**Total tabs:** 1 (single-tab document)\n\n'
+            "**Default Tab:**\n- Tab ID: t1\n- Title: Main\n"
+        )
+
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_requests_only_tab_properties(self, mock_get_docs):
+        """Should not request tab bodies unless content lengths are wanted."""
+        docs = MagicMock()
+        docs.documents().get().execute.return_value = {
+            "title": "Solo",
+            "tabs": [_tab("t1", "Main", 0)],
+        }
+        mock_get_docs.return_value = docs
+
+        list_document_tabs("doc123")
+
+        fields = docs.documents().get.call_args.kwargs["fields"]
+        assert "documentTab" not in fields
+        assert fields.startswith("title,tabs(tabProperties,childTabs(")
+
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_content_lengths_request_text_fields_only(self, mock_get_docs):
+        """Should request just body text when reporting content lengths."""
+        tab = _tab("t1", "Main", 0)
+        tab["documentTab"] = {
+            "body": {"content": [{"paragraph": {"elements": [{"textRun": {"content": "Hello\n"}}]}}]}
+        }
+        docs = MagicMock()
+        docs.documents().get().execute.return_value = {"title": "Solo", "tabs": [tab]}
+        mock_get_docs.return_value = docs
+
+        result = list_document_tabs("doc123", include_content=True)
+
+        assert "- Content: 6 characters\n" in result
+        fields = docs.documents().get.call_args.kwargs["fields"]
+        assert f"documentTab({helpers.BODY_TEXT_FIELDS})" in fields
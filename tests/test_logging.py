@@ -0,0 +1,87 @@
+"""
+Tests for the stderr logging helpers.
+"""
+
+import logging
+from unittest.mock import MagicMock, patch
+
+from google_docs_mcp.utils import _configured_level, log, log_error, log_warning
+
+
+class TestConfiguredLevel:
+    """Tests for LOG_LEVEL parsing."""
+
+    def test_defaults_to_info(self):
+        """Should log at INFO when LOG_LEVEL is unset."""
+        with patch.dict("os.environ", {}, clear=True):
+            assert _configured_level() == logging.INFO
+
+    def test_accepts_level_name(self):
+        """Should accept level names case-insensitively."""
+        with patch.dict("os.environ", {"LOG_LEVEL": "warning"}):
+            assert _configured_level() == logging.WARNING
+
+    def test_invalid_level_falls_back_to_info(self):
+        """Should fall back to INFO for unknown level names."""
+        with patch.dict("os.environ", {"LOG_LEVEL": "LOUD"}):
+            assert _configured_level() == logging.INFO
+
+
+class TestLog:
+    """Tests for the log() helper."""
+
+    @patch("google_docs_mcp.utils._get_logger")
+    def test_defers_formatting_to_logger(self, mock_get_logger):
+        """Should pass format arguments through so formatting happens only when logged."""
+        log("Inserting footnote at index %s", 12)
+
+        mock_get_logger.return_value.info.assert_called_once_with(
+            "Inserting footnote at index %s", 12
+        )
+
+    def test_skips_formatting_when_disabled(self):
+        """Should not format arguments when INFO messages are disabled."""
+        logger = logging.getLogger("google_docs_mcp.test_disabled")
+        logger.setLevel(logging.WARNING)
+        arg = MagicMock()
+
+        with patch("google_docs_mcp.utils._get_logger", return_value=logger):
+            log("Value: %s", arg)
+
+        arg.__str__.assert_not_called()
+
+    def test_warnings_and_errors_survive_warning_level(self):
+        """Should still emit warnings and errors when LOG_LEVEL hides progress messages."""
+        logger = logging.getLogger("google_docs_mcp.test_levels")
+        logger.setLevel(logging.WARNING)
+        handler = MagicMock(level=logging.NOTSET)
+        logger.addHandler(handler)
+
+        with patch("google_docs_mcp.utils._get_logger", return_value=logger):
+            log("Progress")
+            log_warning("Authorize this app: %s", "https://example.com")
+            log_error("Error reading doc")
+
+        records = [call.args[0] for call in handler.handle.call_args_list]
+        assert [(r.levelno, r.getMessage()) for r in records] == [
+            (logging.WARNING, "Authorize this app: https://example.com"),
+            (logging.ERROR, "Error reading doc"),
+        ]
+
+
+
+class TestDocumentEntryLogging:
+    """Tests for the entry-point logs of document tools."""
+
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    @patch("google_docs_mcp.api.documents.log")
+    def test_entry_log_defers_formatting(self, mock_log, mock_get_docs, mock_execute):
+        """Should hand the logger a format string and arguments, not a built message."""
+        from google_docs_mcp.api.documents import insert_text
+
+        insert_text("doc123", "Hi", 1, tab_id="t1")
+
+        mock_log.assert_any_call(
+            "Inserting text in doc %s at index %s (tab: %s)", "doc123", 1, "t1"
+        )
@@ -0,0 +1,33 @@
+"""
+Tests for named range operations.
+"""
+
+from unittest.mock import patch
+
+from google_docs_mcp.api.documents import create_named_range
+
+
+class TestCreateNamedRange:
+    """Tests for create_named_range."""
+
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_reports_created_range_id(self, mock_get_docs, mock_execute):
+        """Should return the ID from the createNamedRange reply."""
+        mock_execute.return_value = {
+            "replies": [{"createNamedRange": {"namedRangeId": "kix.abc"}}]
+        }
+
+        result = create_named_range("doc123", "intro", 1, 10)
+
+        assert result.endswith("Range ID: kix.abc")
+
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_handles_missing_replies(self, mock_get_docs, mock_execute):
+        """Should still succeed when the response carries no replies."""
+        mock_execute.return_value = {}
+
+        result = create_named_range("doc123", "intro", 1, 10)
+
+        assert result.endswith("Range ID: ")
@@ -5,8 +5,10 @@ Tests the Google Drive API native markdown support for both
 importing markdown to Google Docs and exporting Google Docs to markdown.
 """
 
+import httplib2
 import pytest
 from unittest.mock import Mock, MagicMock, patch
+from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaInMemoryUpload
 
 from google_docs_mcp.api.drive import create_google_doc_from_markdown
@@ -114,7 +116,9 @@ class TestMarkdownImport:
         # Setup mock to raise 404 error
         mock_drive = MagicMock()
         mock_get_drive.return_value = mock_drive
-        mock_drive.files().create().execute.side_effect = Exception("404 Not found")
+        mock_drive.files().create().execute.side_effect = HttpError(
+            httplib2.Response({"status": 404}), b"Not found"
+        )
 
         # Execute and verify error
         with pytest.raises(ToolError) as exc_info:
@@ -127,6 +131,28 @@ class TestMarkdownImport:
         assert "Parent folder not found" in str(exc_info.value)
 
 
+def _fake_downloader(byte_chunks):
+    """Build a stand-in for MediaIoBaseDownload that writes the given chunks."""
+    holder = []
+
+    class FakeDownloader:
+        def __init__(self, fd, request, chunksize):
+            self.fd = fd
+            self.calls = 0
+            holder.append(self)
+
+        def next_chunk(self, num_retries=0):
+            self.fd.write(byte_chunks[self.calls])
+            self.calls += 1
+            return None, self.calls == len(byte_chunks)
+
+    def factory(*args, **kwargs):
+        return FakeDownloader(*args, **kwargs)
+
+    factory.holder = holder
+    return factory
+
+
 class TestMarkdownExport:
     """Tests for native markdown export via Drive API."""
 
@@ -155,15 +181,16 @@ class TestMarkdownExport:
         assert call_kwargs['fileId'] == 'doc-123'
         assert call_kwargs['mimeType'] == 'text/markdown'
 
+    @patch('google_docs_mcp.api.documents.MediaIoBaseDownload')
     @patch('google_docs_mcp.api.documents.get_drive_client')
-    def test_export_with_max_length(self, mock_get_drive):
+    def test_export_with_max_length(self, mock_get_drive, mock_downloader_cls):
         """Test markdown export with max_length truncation."""
         # Setup mock
         mock_drive = MagicMock()
         mock_get_drive.return_value = mock_drive
 
         long_markdown = "A" * 1000
-        mock_drive.files().export().execute.return_value = long_markdown.encode('utf-8')
+        mock_downloader_cls.side_effect = _fake_downloader([long_markdown.encode('utf-8')])
 
         # Execute with max_length
         result = _export_document_as_markdown(
@@ -175,6 +202,31 @@ class TestMarkdownExport:
         assert len(result) > 100  # Includes truncation message
         assert "Markdown truncated to 100 chars" in result
         assert "1000 total" in result
+        mock_drive.files().export_media.assert_called_with(
+            fileId='doc-123', mimeType='text/markdown'
+        )
+
+    @patch('google_docs_mcp.api.documents.MediaIoBaseDownload')
+    @patch('google_docs_mcp.api.documents.get_drive_client')
+    def test_export_with_max_length_stops_downloading_early(
+        self, mock_get_drive, mock_downloader_cls
+    ):
+        """Test that truncated exports stop fetching once max_length is reached."""
+        mock_get_drive.return_value = MagicMock()
+
+        chunks = ["é" * 60, "B" * 60, "C" * 60]
+        # Split a two-byte character across chunk boundaries
+        data = "".join(chunks).encode('utf-8')
+        byte_chunks = [data[:119], data[119:179], data[179:]]
+        factory = _fake_downloader(byte_chunks)
+        mock_downloader_cls.side_effect = factory
+
+        result = _export_document_as_markdown(document_id="doc-123", max_length=100)
+
+        assert result.startswith("é" * 60 + "B" * 40)
+        assert "Markdown truncated to 100 chars." in result
+        assert "total" not in result
+        assert factory.holder[0].calls == 2
 
     @patch('google_docs_mcp.api.documents.get_drive_client')
     def test_export_permission_error(self, mock_get_drive):
@@ -196,7 +248,9 @@ class TestMarkdownExport:
         # Setup mock to raise 404 error
         mock_drive = MagicMock()
         mock_get_drive.return_value = mock_drive
-        mock_drive.files().export().execute.side_effect = Exception("404 Not found")
+        mock_drive.files().export().execute.side_effect = HttpError(
+            httplib2.Response({"status": 404}), b"Not found"
+        )
 
         # Execute and verify error
         with pytest.raises(ToolError) as exc_info:
@@ -205,7 +259,18 @@ class TestMarkdownExport:
         assert "Document not found" in str(exc_info.value)
 
     @patch('google_docs_mcp.api.documents.get_drive_client')
-    @patch('google_docs_mcp.api.documents.log')
+    def test_export_replaces_invalid_utf8(self, mock_get_drive):
+        """Test that non-UTF-8 bytes in the export are replaced, not raised."""
+        mock_drive = MagicMock()
+        mock_get_drive.return_value = mock_drive
+        mock_drive.files().export().execute.return_value = b"# Title\xff\n"
+
+        result = _export_document_as_markdown(document_id="doc-123")
+
+        assert result == "# Title�\n"
+
+    @patch('google_docs_mcp.api.documents.get_drive_client')
+    @patch('google_docs_mcp.api.documents.log_warning')
     def test_export_with_tab_id_warning(self, mock_log, mock_get_drive):
         """Test that warning is logged when tab_id is specified."""
         # Setup mock
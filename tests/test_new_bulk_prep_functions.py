@@ -200,6 +200,17 @@ class TestTableCellStylePrepFunction:
 
         assert request is None
 
+    def test_prepare_cell_style_no_styles_skips_builder(self):
+        """Test that the request builder is not called without style properties."""
+        op_dict = {"table_start_index": 100, "row_index": 0, "column_index": 0}
+
+        with patch(
+            "google_docs_mcp.api.documents.helpers.build_update_table_cell_style_request"
+        ) as mock_build:
+            assert _prepare_update_table_cell_style_request(op_dict) is None
+
+        mock_build.assert_not_called()
+
 
 class TestTableCellMergingPrepFunctions:
     """Tests for table cell merging preparation functions."""
@@ -1,6 +1,7 @@
 """Tests for new helper functions in api/helpers.py."""
 
 import pytest
+from fastmcp.exceptions import ToolError
 from src.google_docs_mcp.api import helpers
 from src.google_docs_mcp.types import TableInfo
 
@@ -278,6 +279,13 @@ class TestTableOperationHelpers:
         assert location["rowIndex"] == 1
         assert location["columnIndex"] == 1
 
+    def test_build_merge_table_cells_request_rejects_zero_span(self):
+        """Test that a merge spanning no columns is rejected."""
+        with pytest.raises(ToolError, match="at least 1 row and 1 column"):
+            helpers.build_merge_table_cells_request(
+                table_start_index=100, start_row=0, start_column=0, row_span=2, column_span=0
+            )
+
 
 class TestNamedRangeHelpers:
     """Tests for named range helper functions."""
@@ -315,6 +323,11 @@ class TestNamedRangeHelpers:
         assert "deleteNamedRange" in request
         assert request["deleteNamedRange"]["namedRangeId"] == "range123"
 
+    def test_build_create_named_range_request_rejects_empty_range(self):
+        """Test that a range ending at or before its start is rejected."""
+        with pytest.raises(ToolError, match="must be greater than start_index"):
+            helpers.build_create_named_range_request(name="empty", start_index=10, end_index=10)
+
 
 class TestContentElementHelpers:
     """Tests for content element helper functions."""
@@ -363,3 +376,13 @@ class TestContentElementHelpers:
         )
 
         assert request["insertSectionBreak"]["sectionType"] == "NEXT_PAGE"
+
+    def test_build_insert_section_break_request_rejects_unknown_type(self):
+        """Test that unsupported section types are rejected before any API call."""
+        with pytest.raises(ToolError, match="Invalid section_type 'ODD_PAGE'"):
+            helpers.build_insert_section_break_request(index=100, section_type="ODD_PAGE")
+
+    def test_build_insert_section_break_request_rejects_index_zero(self):
+        """Test that section breaks cannot be inserted before index 1."""
+        with pytest.raises(ToolError, match="at least 1"):
+            helpers.build_insert_section_break_request(index=0)
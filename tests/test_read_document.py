@@ -0,0 +1,162 @@
+"""
+Tests for reading document content.
+"""
+
+import json
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from google_docs_mcp.api import helpers
+from google_docs_mcp.api.documents import read_document
+
+
+def _text_element(text):
+    """Build a paragraph structural element holding a single text run."""
+    return {"paragraph": {"elements": [{"textRun": {"content": text}}]}}
+
+
+@pytest.fixture
+def docs_with_body():
+    """Provide a mock Docs client returning a body with a paragraph and a table."""
+    docs = MagicMock()
+    docs.documents().get().execute.return_value = {
+        "body": {
+            "content": [
+                _text_element("Intro\n"),
+                {
+                    "table": {
+                        "tableRows": [
+                            {"tableCells": [{"content": [_text_element("Cell\n")]}]}
+                        ]
+                    }
+                },
+                _text_element("Outro\n"),
+            ]
+        }
+    }
+    return docs
+
+
+class TestReadDocumentText:
+    """Tests for the default text format."""
+
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_extracts_paragraph_and_table_text(self, mock_get_docs, docs_with_body):
+        """Should concatenate text runs from paragraphs and table cells in order."""
+        mock_get_docs.return_value = docs_with_body
+
+        result = read_document("doc123")
+
+        assert result == "Content (17 characters):\n---\nIntro\nCell\nOutro\n"
+
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_truncates_to_max_length(self, mock_get_docs, docs_with_body):
+        """Should truncate and report the remaining length."""
+        mock_get_docs.return_value = docs_with_body
+
+        result = read_document("doc123", max_length=5)
+
+        assert "truncated to 5 chars of 17 total" in result
+        assert "---\nIntro\n\n" in result
+        assert "12 more characters" in result
+
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_empty_document(self, mock_get_docs):
+        """Should report an empty document."""
+        docs = MagicMock()
+        docs.documents().get().execute.return_value = {"body": {"content": []}}
+        mock_get_docs.return_value = docs
+
+        assert read_document("doc123") == "Document found, but appears empty."
+
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_whitespace_only_document(self, mock_get_docs):
+        """Should treat a body holding only whitespace as empty."""
+        docs = MagicMock()
+        docs.documents().get().execute.return_value = {
+            "body": {"content": [_text_element("\n"), _text_element("  \n")]}
+        }
+        mock_get_docs.return_value = docs
+
+        assert read_document("doc123") == "Document found, but appears empty."
+
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_truncation_keeps_text_after_leading_whitespace(self, mock_get_docs):
+        """Should not treat a whitespace prefix as empty when text follows it."""
+        docs = MagicMock()
+        docs.documents().get().execute.return_value = {
+            "body": {"content": [_text_element("   \n"), _text_element("Later\n")]}
+        }
+        mock_get_docs.return_value = docs
+
+        result = read_document("doc123", max_length=3)
+
+        assert "truncated to 3 chars of 10 total" in result
+        assert "---\n   \n\n" in result
+        assert "7 more characters" in result
+
+
+class TestReadDocumentJson:
+    """Tests for the JSON format."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_returns_indented_json(self, mock_get_docs, use_orjson, docs_with_body):
+        """Should return the same indented JSON with or without orjson."""
+        mock_get_docs.return_value = docs_with_body
+        body = docs_with_body.documents().get().execute.return_value
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+            result = read_document("doc123", format="json")
+        else:
+            with patch("google_docs_mcp.api.documents.orjson", None):
+                result = read_document("doc123", format="json")
+
+        assert result == json.dumps(body, indent=2)
+
+
+class TestReadDocumentFields:
+    """Tests for the fields requested per output format."""
+
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_text_requests_only_text_fields(self, mock_get_docs, docs_with_body):
+        """Should request just body text, including table text."""
+        mock_get_docs.return_value = docs_with_body
+
+        read_document("doc123")
+
+        fields = docs_with_body.documents().get.call_args.kwargs["fields"]
+        assert fields == helpers.BODY_TEXT_FIELDS
+        assert "tableCells" in fields
+
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_tab_text_requests_tab_text_fields(self, mock_get_docs):
+        """Should not request the full document when reading a tab as text."""
+        docs = MagicMock()
+        docs.documents().get().execute.return_value = {
+            "tabs": [
+                {
+                    "tabProperties": {"tabId": "t1", "title": "One"},
+                    "documentTab": {"body": {"content": [_text_element("Tab text\n")]}},
+                }
+            ]
+        }
+        mock_get_docs.return_value = docs
+
+        result = read_document("doc123", tab_id="t1")
+
+        assert "Tab text" in result
+        fields = docs.documents().get.call_args.kwargs["fields"]
+        assert fields != "*"
+        assert fields.startswith("tabs(tabProperties,documentTab(body(")
+
+    @patch("google_docs_mcp.api.documents._export_document_as_markdown")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_markdown_without_tab_skips_docs_fetch(self, mock_get_docs, mock_export):
+        """Should go straight to the Drive export for markdown."""
+        mock_export.return_value = "# Title"
+
+        assert read_document("doc123", format="markdown") == "# Title"
+        mock_get_docs.return_value.documents.assert_not_called()
@@ -0,0 +1,75 @@
+"""
+Tests for tab handling in tab-targeted writes.
+"""
+
+import httplib2
+import pytest
+from unittest.mock import MagicMock, patch
+from googleapiclient.errors import HttpError
+
+from fastmcp.exceptions import ToolError
+
+from google_docs_mcp.api.documents import delete_range, insert_text
+
+
+def _batch_update_error(status, message):
+    """Build the ToolError execute_batch_update_sync raises for an HttpError."""
+    cause = HttpError(httplib2.Response({"status": status}), message.encode())
+    try:
+        raise ToolError(f"Invalid request sent to Google Docs API: {cause}") from cause
+    except ToolError as e:
+        return e
+
+
+class TestTabTargetedWrites:
+    """Tests for writes that target a tab."""
+
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_insert_text_into_tab_skips_document_fetch(self, mock_get_docs, mock_execute):
+        """Should send the insert directly, without validating the tab first."""
+        docs = MagicMock()
+        mock_get_docs.return_value = docs
+
+        insert_text("doc123", "Hi", 1, tab_id="t1")
+
+        docs.documents().get.assert_not_called()
+        request = mock_execute.call_args.args[2][0]
+        assert request["insertText"]["location"] == {"index": 1, "tabId": "t1"}
+
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_delete_range_in_unknown_tab(self, mock_get_docs, mock_execute):
+        """Should report an unknown tab when batchUpdate rejects the tab ID."""
+        mock_execute.side_effect = _batch_update_error(
+            400, "Invalid requests[0].deleteContentRange: The tab ID is invalid."
+        )
+
+        with pytest.raises(ToolError, match='Tab "missing" not found'):
+            delete_range("doc123", 1, 5, tab_id="missing")
+
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_other_invalid_requests_pass_through(self, mock_get_docs, mock_execute):
+        """Should keep the original error for invalid requests unrelated to tabs."""
+        mock_execute.side_effect = _batch_update_error(
+            400, "Invalid requests[0].insertText: Index 99 must be less than the end index."
+        )
+
+        with pytest.raises(ToolError, match="Invalid request sent"):
+            insert_text("doc123", "Hi", 99, tab_id="t1")
+
+    @patch("google_docs_mcp.api.documents.helpers.execute_batch_update_sync")
+    @patch("google_docs_mcp.api.documents.get_docs_client")
+    def test_table_errors_pass_through(self, mock_get_docs, mock_execute):
+        """Should not mistake an error about a table for an unknown tab."""
+        mock_execute.side_effect = _batch_update_error(
+            400,
+            "Invalid requests[0].deleteContentRange: "
+            "Cannot delete the last newline of a table cell.",
+        )
+
+        with pytest.raises(ToolError, match="Invalid request sent") as exc_info:
+            delete_range("doc123", 1, 5, tab_id="t.0")
+
+        assert "table cell" in str(exc_info.value)